@@ -6,9 +6,14 @@ import logging
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST, Platform
 from homeassistant.core import HomeAssistant
+import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.typing import ConfigType
 
-from .const import DOMAIN
+from .const import CONF_FLEET_POLLING, CONF_WAIT_FOR_CONTROLLER, DOMAIN
 from .coordinator import FFESSaunaCoordinator
+from .fleet import async_get_fleet
+from .services import async_setup_services
+from .storage import FFESSaunaStore
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -20,27 +25,80 @@ PLATFORMS: list[Platform] = [
     Platform.NUMBER,
 ]
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the FFES Sauna services."""
+    async_setup_services(hass)
+    return True
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up FFES Sauna from a config entry."""
     host = entry.data[CONF_HOST]
+    fleet_polling = entry.options.get(CONF_FLEET_POLLING, False)
+    
+    store = FFESSaunaStore(hass, entry.entry_id)
+    await store.async_load()
     
-    coordinator = FFESSaunaCoordinator(hass, host)
+    coordinator = FFESSaunaCoordinator(
+        hass, host, fleet_polling, store, entry.options
+    )
+    if fleet_polling:
+        fleet = async_get_fleet(hass)
+        coordinator.async_join_fleet(fleet)
+    entry.async_on_unload(coordinator.async_leave_fleet)
     
-    # Fetch initial data
-    await coordinator.async_config_entry_first_refresh()
+    # Start from the last known state so a slow or offline controller does
+    # not hold up setup; live data follows in the background
+    restored = store.state
+    if restored is not None and not entry.options.get(CONF_WAIT_FOR_CONTROLLER, False):
+        coordinator.async_restore(*restored)
+        if not fleet_polling:
+            entry.async_create_background_task(
+                hass, coordinator.async_refresh(), f"{DOMAIN} first refresh {host}"
+            )
+    elif fleet_polling:
+        await fleet.async_first_refresh(coordinator)
+    else:
+        await coordinator.async_config_entry_first_refresh()
     
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = coordinator
     
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     
+    entry.async_on_unload(entry.add_update_listener(async_update_options))
+    
     return True
 
 
+async def async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Apply changed options to the running coordinator without a reload."""
+    coordinator: FFESSaunaCoordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator.async_apply_options(entry.options)
+    
+    fleet_polling = entry.options.get(CONF_FLEET_POLLING, False)
+    if fleet_polling and coordinator.fleet is None:
+        coordinator.update_interval = None
+        coordinator.async_join_fleet(async_get_fleet(hass))
+    elif not fleet_polling and coordinator.fleet is not None:
+        coordinator.async_leave_fleet()
+        coordinator.update_interval = coordinator.poll_interval
+        # Polling resumes on its own schedule after this refresh
+        await coordinator.async_request_refresh()
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        hass.data[DOMAIN].pop(entry.entry_id)
+        coordinator: FFESSaunaCoordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        await coordinator.async_shutdown()
     
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the stored state of a deleted config entry."""
+    await FFESSaunaStore(hass, entry.entry_id).async_remove()
@@ -0,0 +1,86 @@
+"""Circuit breaker for unreachable FFES Sauna controllers."""
+from __future__ import annotations
+
+import logging
+import time
+
+from .const import BREAKER_BASE_BACKOFF, BREAKER_FAILURE_THRESHOLD, BREAKER_MAX_BACKOFF
+
+_LOGGER = logging.getLogger(__name__)
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Stop sending requests to a controller that keeps failing.
+
+    After ``failure_threshold`` consecutive failures the circuit opens and
+    requests fail fast. Once the backoff has passed a single probe request is
+    let through: success closes the circuit, failure opens it again with
+    twice the backoff, up to ``max_backoff``.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        failure_threshold: int = BREAKER_FAILURE_THRESHOLD,
+        base_backoff: float = BREAKER_BASE_BACKOFF,
+        max_backoff: float = BREAKER_MAX_BACKOFF,
+    ) -> None:
+        """Initialize the breaker."""
+        self.host = host
+        self._failure_threshold = failure_threshold
+        self._base_backoff = base_backoff
+        self._max_backoff = max_backoff
+        self.state = STATE_CLOSED
+        self.failures = 0
+        self.backoff = base_backoff
+        self._retry_at = 0.0
+
+    @property
+    def retry_in(self) -> float:
+        """Return the seconds until the next probe is allowed."""
+        return max(0.0, self._retry_at - time.monotonic())
+
+    @property
+    def probing(self) -> bool:
+        """Return True while the probe request is in flight."""
+        return self.state == STATE_HALF_OPEN
+
+    def allow_request(self) -> bool:
+        """Return True if a request may be sent now."""
+        if self.state == STATE_CLOSED:
+            return True
+        now = time.monotonic()
+        if now >= self._retry_at:
+            # A probe that never reported back is replaced after the backoff
+            self.state = STATE_HALF_OPEN
+            self._retry_at = now + self.backoff
+            return True
+        return False
+
+    def record_success(self) -> None:
+        """Close the circuit after a successful request."""
+        if self.state != STATE_CLOSED:
+            _LOGGER.info("%s is reachable again", self.host)
+        self.state = STATE_CLOSED
+        self.failures = 0
+        self.backoff = self._base_backoff
+
+    def record_failure(self) -> None:
+        """Count a failed request, opening the circuit if needed."""
+        self.failures += 1
+        if self.state == STATE_HALF_OPEN:
+            self.backoff = min(self.backoff * 2, self._max_backoff)
+        elif self.state == STATE_OPEN or self.failures < self._failure_threshold:
+            return
+        else:
+            _LOGGER.warning(
+                "%s is unreachable, pausing requests for %.0f s",
+                self.host,
+                self.backoff,
+            )
+        self.state = STATE_OPEN
+        self._retry_at = time.monotonic() + self.backoff
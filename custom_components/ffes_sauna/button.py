@@ -10,10 +10,10 @@ from homeassistant.components.button import ButtonEntity, ButtonEntityDescriptio
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN, STATUS_OFF, STATUS_HEATING, STATUS_VENTILATION, STATUS_STANDBY
 from .coordinator import FFESSaunaCoordinator
+from .entity import FFESSaunaEntity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -69,7 +69,7 @@ async def async_setup_entry(
     async_add_entities(entities)
 
 
-class FFESSaunaButton(CoordinatorEntity, ButtonEntity):
+class FFESSaunaButton(FFESSaunaEntity, ButtonEntity):
     """Representation of a FFES Sauna button."""
 
     entity_description: FFESSaunaButtonEntityDescription
@@ -81,7 +81,8 @@ class FFESSaunaButton(CoordinatorEntity, ButtonEntity):
         entry: ConfigEntry,
     ) -> None:
         """Initialize the button."""
-        super().__init__(coordinator)
+        # Buttons have no state, so only availability changes matter
+        super().__init__(coordinator, ())
         self.entity_description = description
         self._attr_unique_id = f"{entry.entry_id}_{description.key}"
         self._attr_device_info = {
@@ -0,0 +1,92 @@
+"""HTTP transport for one FFES Sauna controller."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import TYPE_CHECKING
+
+import aiohttp
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_create_clientsession
+
+from .const import CLIENT_CONNECTION_LIMIT
+
+if TYPE_CHECKING:
+    from .trace import TraceRecorder
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class FFESSaunaClient:
+    """Session of one controller.
+
+    The session comes from Home Assistant's client helper, so it keeps Home
+    Assistant's user agent, SSL context and keep-alive pool and is detached
+    when the config entry unloads. At most ``CLIENT_CONNECTION_LIMIT``
+    requests to the controller run at once. Exchanges are written to
+    ``recorder`` while one is set.
+    """
+
+    def __init__(self, hass: HomeAssistant, host: str) -> None:
+        """Initialize the client."""
+        self.host = host
+        self._session = async_create_clientsession(hass)
+        self._limit = asyncio.Semaphore(CLIENT_CONNECTION_LIMIT)
+        self.recorder: TraceRecorder | None = None
+
+    async def async_get(
+        self, path: str, timeout: aiohttp.ClientTimeout
+    ) -> tuple[int, bytes]:
+        """Send a GET request, return the status and raw body.
+
+        The controller may drop a keep-alive connection while idle, which
+        only shows on the next request, so that request is retried once.
+        """
+        try:
+            return await self._async_request("GET", path, timeout)
+        except aiohttp.ServerDisconnectedError:
+            _LOGGER.debug("%s closed the idle connection, retrying", self.host)
+            return await self._async_request("GET", path, timeout)
+
+    async def async_post(
+        self, path: str, data: dict[str, str], timeout: aiohttp.ClientTimeout
+    ) -> tuple[int, bytes]:
+        """Send a form POST request, return the status and raw body."""
+        return await self._async_request("POST", path, timeout, data)
+
+    async def _async_request(
+        self,
+        method: str,
+        path: str,
+        timeout: aiohttp.ClientTimeout,
+        data: dict[str, str] | None = None,
+    ) -> tuple[int, bytes]:
+        """Send a request and read the whole response."""
+        started = time.monotonic()
+        try:
+            async with self._limit, self._session.request(
+                method, f"{self.host}{path}", data=data, timeout=timeout
+            ) as response:
+                status, body = response.status, await response.read()
+        except (TimeoutError, aiohttp.ClientError) as err:
+            if self.recorder is not None:
+                self.recorder.async_record(
+                    method,
+                    path,
+                    time.monotonic() - started,
+                    form=data,
+                    error="timeout" if isinstance(err, TimeoutError) else repr(err),
+                )
+            raise
+        if self.recorder is not None:
+            self.recorder.async_record(
+                method,
+                path,
+                time.monotonic() - started,
+                form=data,
+                status=status,
+                body=body,
+            )
+        return status, body
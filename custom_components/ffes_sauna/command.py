@@ -0,0 +1,405 @@
+"""Command helpers for FFES Sauna."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field, replace
+from datetime import datetime
+import logging
+import time
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from .const import (
+    ACTION_START_SESSION,
+    COMMAND_DEBOUNCE_SECONDS,
+    CONFIRM_BACKOFF,
+    CONFIRM_FIELDS,
+    CONFIRM_TIMEOUT,
+    DEFAULT_PROFILE,
+    DEFAULT_SESSION_TIME,
+    DEFAULT_TEMPERATURE,
+    DEFAULT_VENTILATION_TIME,
+    PRIORITY_NORMAL,
+    PRIORITY_STOP,
+)
+from .models import SaunaState, hhmm_label
+from .stats import LatencyHistogram
+
+if TYPE_CHECKING:
+    from .coordinator import FFESSaunaCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def parse_session_time(value: str) -> int:
+    """Convert an HH:MM string to the controller's HHMM integer."""
+    hours, _, minutes = value.partition(":")
+    return int(hours) * 100 + int(minutes or 0)
+
+
+def _state_changes(changes: dict[str, Any]) -> dict[str, Any]:
+    """Map ``start_session`` arguments to the ``SaunaState`` fields they set."""
+    state: dict[str, Any] = {}
+    for key, value in changes.items():
+        if key == "temperature":
+            state["set_temp"] = value
+        elif key in ("session_time", "ventilation_time"):
+            state[key] = parse_session_time(value)
+        else:
+            state[key] = value
+    return state
+
+
+class SessionCommandAggregator:
+    """Merge session changes made within a short window into one request.
+
+    Queued changes are shown right away and go out as one trailing-edge
+    ``start_session`` POST, or with the next Start Heating or ``async_apply``
+    call if that comes first. Entities use ``async_send`` to wait for the
+    result of the request that carried their change.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        coordinator: FFESSaunaCoordinator,
+        delay: float = COMMAND_DEBOUNCE_SECONDS,
+    ) -> None:
+        """Initialize the aggregator."""
+        self.hass = hass
+        self._coordinator = coordinator
+        self._delay = delay
+        self._pending: dict[str, Any] = {}
+        self._waiters: list[asyncio.Future[bool]] = []
+        self._unsub_timer: CALLBACK_TYPE | None = None
+
+    @property
+    def pending(self) -> bool:
+        """Return True if changes are waiting to be sent."""
+        return bool(self._pending)
+
+    @callback
+    def async_queue(self, **changes: Any) -> None:
+        """Queue session changes without waiting for the merged request."""
+        self._pending.update(changes)
+        self._coordinator.async_show_pending(_state_changes(changes))
+
+        if self._unsub_timer is not None:
+            self._unsub_timer()
+        self._unsub_timer = async_call_later(self.hass, self._delay, self._handle_timer)
+
+    async def async_send(self, **changes: Any) -> bool:
+        """Queue session changes and wait for the request that carries them."""
+        future: asyncio.Future[bool] = self.hass.loop.create_future()
+        self._waiters.append(future)
+        self.async_queue(**changes)
+        return await asyncio.shield(future)
+
+    async def async_apply(self, **changes: Any) -> bool:
+        """Send pending and given changes now as one request."""
+        self._pending.update(changes)
+        return await self.async_flush()
+
+    @callback
+    def _handle_timer(self, _now: datetime) -> None:
+        """Flush pending changes once the window has passed."""
+        self._unsub_timer = None
+        self.hass.async_create_task(self._async_flush_queued())
+
+    async def _async_flush_queued(self) -> None:
+        """Send queued changes, dropping their shown values if that fails."""
+        if not await self.async_flush():
+            _LOGGER.warning(
+                "%s did not accept the queued session changes",
+                self._coordinator.host,
+            )
+            await self._coordinator.async_request_refresh()
+
+    @callback
+    def async_cancel(self) -> None:
+        """Drop pending changes."""
+        if self._unsub_timer is not None:
+            self._unsub_timer()
+            self._unsub_timer = None
+        self._pending = {}
+        self._resolve(self._take_waiters(), False)
+
+    async def async_flush(self) -> bool:
+        """Send pending changes now."""
+        if self._unsub_timer is not None:
+            self._unsub_timer()
+            self._unsub_timer = None
+
+        changes, self._pending = self._pending, {}
+        waiters = self._take_waiters()
+        if not changes:
+            self._resolve(waiters, True)
+            return True
+
+        _LOGGER.debug("Sending merged session changes: %s", changes)
+        result = False
+        try:
+            result = await self._coordinator.async_start_session(
+                **self._build_session(changes)
+            )
+        finally:
+            self._resolve(waiters, result)
+        return result
+
+    def _take_waiters(self) -> list[asyncio.Future[bool]]:
+        """Detach the callers waiting for the pending changes."""
+        waiters, self._waiters = self._waiters, []
+        return waiters
+
+    @staticmethod
+    def _resolve(waiters: list[asyncio.Future[bool]], result: bool) -> None:
+        """Pass the result of a request to the callers waiting for it."""
+        for future in waiters:
+            if not future.done():
+                future.set_result(result)
+
+    def _build_session(self, changes: dict[str, Any]) -> dict[str, Any]:
+        """Fill in unchanged settings from the last controller data."""
+        session = {
+            "profile": DEFAULT_PROFILE,
+            "temperature": DEFAULT_TEMPERATURE,
+            "session_time": hhmm_label(DEFAULT_SESSION_TIME),
+            "ventilation_time": hhmm_label(DEFAULT_VENTILATION_TIME),
+            "aroma_value": 0,
+            "humidity_value": 0,
+        }
+        if (state := self._coordinator.data) is not None:
+            if state.profile is not None:
+                session["profile"] = state.profile
+            if state.set_temp is not None:
+                session["temperature"] = state.set_temp
+            if state.session_time:
+                session["session_time"] = state.session_label
+            if state.ventilation_time:
+                session["ventilation_time"] = state.ventilation_label
+            if state.aroma_value is not None:
+                session["aroma_value"] = state.aroma_value
+            if state.humidity_value is not None:
+                session["humidity_value"] = state.humidity_value
+        session.update(changes)
+        return session
+
+
+@dataclass(order=True)
+class _QueuedCommand:
+    """A command waiting to be sent, ordered by priority then arrival."""
+
+    priority: int
+    sequence: int
+    key: str = field(compare=False)
+    data: dict[str, str] = field(compare=False)
+    optimistic: dict[str, Any] | None = field(compare=False)
+    queued_at: float = field(compare=False)
+    futures: list[asyncio.Future[bool]] = field(compare=False, default_factory=list)
+
+
+class CommandQueue:
+    """Send the commands of one controller one at a time.
+
+    Commands are keyed by the setting they change. A command replacing one
+    that has not been sent yet takes its place, and every caller receives the
+    result of the request that was actually sent. Stop commands go first and
+    drop pending session starts issued before them.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        name: str,
+        send: Callable[[dict[str, str], dict[str, Any] | None], Awaitable[bool]],
+    ) -> None:
+        """Initialize the queue."""
+        self.hass = hass
+        self._name = name
+        self._send = send
+        self._pending: dict[str, _QueuedCommand] = {}
+        self._sequence = 0
+        self._worker: asyncio.Task[None] | None = None
+        self.wait = LatencyHistogram()
+
+    @property
+    def depth(self) -> int:
+        """Return the number of commands waiting to be sent."""
+        return len(self._pending)
+
+    async def async_send(
+        self,
+        key: str,
+        data: dict[str, str],
+        optimistic: dict[str, Any] | None = None,
+        priority: int = PRIORITY_NORMAL,
+    ) -> bool:
+        """Queue a command and wait for the result of sending it."""
+        future: asyncio.Future[bool] = self.hass.loop.create_future()
+
+        if (queued := self._pending.get(key)) is not None:
+            # Last writer wins, earlier callers share the result
+            queued.data = data
+            queued.optimistic = optimistic
+            queued.priority = min(queued.priority, priority)
+        else:
+            self._sequence += 1
+            queued = self._pending[key] = _QueuedCommand(
+                priority, self._sequence, key, data, optimistic, time.monotonic()
+            )
+        queued.futures.append(future)
+
+        if priority == PRIORITY_STOP:
+            self._drop(ACTION_START_SESSION)
+
+        if self._worker is None or self._worker.done():
+            self._worker = self.hass.async_create_background_task(
+                self._async_run(), f"{self._name} command queue"
+            )
+        return await asyncio.shield(future)
+
+    def _drop(self, key: str) -> None:
+        """Drop a pending command superseded by a stop command."""
+        if (queued := self._pending.pop(key, None)) is None:
+            return
+        _LOGGER.debug("%s: dropping %s superseded by stop", self._name, key)
+        for future in queued.futures:
+            if not future.done():
+                future.set_result(False)
+
+    async def _async_run(self) -> None:
+        """Send queued commands until the queue is empty."""
+        while self._pending:
+            command = min(self._pending.values())
+            del self._pending[command.key]
+            self.wait.add(time.monotonic() - command.queued_at)
+
+            result = False
+            try:
+                result = await self._send(command.data, command.optimistic)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("%s: error sending %s", self._name, command.key)
+            finally:
+                for future in command.futures:
+                    if not future.done():
+                        future.set_result(result)
+
+    async def async_drain(self) -> None:
+        """Wait until every queued command has been sent."""
+        if self._worker is not None and not self._worker.done():
+            await self._worker
+
+
+class CommandConfirmation:
+    """Poll after an accepted command until the controller reports it.
+
+    Polls follow ``backoff`` until every commanded field shows up in the
+    controller data or ``timeout`` has passed, then the regular schedule
+    takes over again; regular polls count as well. Until then the commanded
+    values are kept over stale readings, so entities do not flip back. The
+    time until the controller showed the values is recorded in ``latency``.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        coordinator: FFESSaunaCoordinator,
+        backoff: tuple[float, ...] = CONFIRM_BACKOFF,
+        timeout: float = CONFIRM_TIMEOUT,
+    ) -> None:
+        """Initialize the confirmation."""
+        self.hass = hass
+        self._coordinator = coordinator
+        self._backoff = backoff
+        self._timeout = timeout
+        self._expected: dict[str, Any] = {}
+        self._sent_at = 0.0
+        self._step = 0
+        self._task: asyncio.Task[None] | None = None
+        self.latency = LatencyHistogram()
+        self.unconfirmed = 0
+
+    @property
+    def pending(self) -> bool:
+        """Return True while commanded values wait for confirmation."""
+        return bool(self._expected)
+
+    @callback
+    def async_expect(self, changes: dict[str, Any]) -> None:
+        """Start confirming changes the controller accepted."""
+        expected = {key: value for key, value in changes.items() if key in CONFIRM_FIELDS}
+        if not expected:
+            return
+        self._expected.update(expected)
+        # A newer command restarts the burst and the deadline
+        self._sent_at = time.monotonic()
+        self._step = 0
+        if self._task is None or self._task.done():
+            self._task = self.hass.async_create_background_task(
+                self._async_run(), f"{self._coordinator.name} confirmation"
+            )
+
+    @callback
+    def async_check(self, state: SaunaState) -> SaunaState:
+        """Match live data with the commanded values, return the data to show."""
+        if not self._expected:
+            return state
+        elapsed = time.monotonic() - self._sent_at
+        missing = {
+            key: value
+            for key, value in self._expected.items()
+            if getattr(state, key) != value
+        }
+        if not missing:
+            _LOGGER.debug(
+                "%s confirmed the command after %.1f s", self._coordinator.host, elapsed
+            )
+            self.latency.add(elapsed)
+            self._expected = {}
+            return state
+        if elapsed >= self._timeout:
+            self._async_expire(missing)
+            return state
+        self._expected = missing
+        return replace(state, **missing)
+
+    @callback
+    def _async_expire(self, missing: dict[str, Any]) -> None:
+        """Give up on values the controller did not report in time."""
+        _LOGGER.warning(
+            "%s did not report %s within %s s of the command",
+            self._coordinator.host,
+            missing,
+            self._timeout,
+        )
+        self.unconfirmed += 1
+        self._expected = {}
+
+    async def _async_run(self) -> None:
+        """Poll in a backoff burst until the commanded values are confirmed."""
+        while self._expected:
+            await asyncio.sleep(self._backoff[min(self._step, len(self._backoff) - 1)])
+            self._step += 1
+            if (fleet := self._coordinator.fleet) is not None:
+                # Share the fleet's cap and never overlap its scheduled poll
+                await fleet.async_refresh(self._coordinator)
+            else:
+                await self._coordinator.async_refresh()
+            if (
+                self._expected
+                and not self._coordinator.last_update_success
+                and time.monotonic() - self._sent_at >= self._timeout
+            ):
+                # No live data to compare with, the next poll shows the truth
+                self._async_expire(self._expected)
+
+    @callback
+    def async_cancel(self) -> None:
+        """Stop confirming."""
+        self._expected = {}
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
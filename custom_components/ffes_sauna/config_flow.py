@@ -9,28 +9,64 @@ import voluptuous as vol
 
 from homeassistant import config_entries
 from homeassistant.const import CONF_HOST
-from homeassistant.core import HomeAssistant
-from homeassistant.data_entry_flow import FlowResult
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.data_entry_flow import AbortFlow, FlowResult, FlowResultType
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+import homeassistant.helpers.config_validation as cv
 
-from .const import DOMAIN, ENDPOINT_DATA
+from .const import (
+    CONF_CONNECT_TIMEOUT,
+    CONF_FLEET_POLLING,
+    CONF_HUMIDITY_DEADBAND,
+    CONF_HUMIDITY_MAX_SILENCE,
+    CONF_READ_TIMEOUT,
+    CONF_SCAN_INTERVAL_ACTIVE,
+    CONF_SCAN_INTERVAL_IDLE,
+    CONF_TEMPERATURE_DEADBAND,
+    CONF_TEMPERATURE_MAX_SILENCE,
+    CONF_TRACE,
+    CONF_WAIT_FOR_CONTROLLER,
+    DEFAULT_CONNECT_TIMEOUT,
+    DEFAULT_DEADBAND,
+    DEFAULT_MAX_SILENCE,
+    DEFAULT_READ_TIMEOUT,
+    DOMAIN,
+    ENDPOINT_DATA,
+    SCAN_INTERVAL_ACTIVE,
+    SCAN_INTERVAL_IDLE,
+)
+from .discovery import InvalidRange, async_scan, hosts_in_range, normalize_host
+from .models import InvalidPayload, SaunaState
 
 _LOGGER = logging.getLogger(__name__)
 
+CONF_NETWORK = "network"
+CONF_HOSTS = "hosts"
+
 STEP_USER_DATA_SCHEMA = vol.Schema(
     {
         vol.Required(CONF_HOST): str,
     }
 )
 
+STEP_DISCOVER_DATA_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_NETWORK, default="192.168.0.0/24"): str,
+    }
+)
+
+SCAN_INTERVAL_SCHEMA = vol.All(vol.Coerce(int), vol.Range(min=3, max=3600))
+TIMEOUT_SCHEMA = vol.All(vol.Coerce(float), vol.Range(min=1, max=60))
+DEADBAND_SCHEMA = vol.All(vol.Coerce(float), vol.Range(min=0, max=10))
+MAX_SILENCE_SCHEMA = vol.All(vol.Coerce(int), vol.Range(min=0, max=86400))
+
 
 async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str, Any]:
     """Validate the user input allows us to connect."""
-    host = data[CONF_HOST]
-    
-    # Add http:// if not present
-    if not host.startswith(("http://", "https://")):
-        host = f"http://{host}"
+    # Identified by host and port, like controllers found by discovery
+    host_id = normalize_host(data[CONF_HOST])
+    scheme = "https" if data[CONF_HOST].strip().startswith("https://") else "http"
+    host = f"{scheme}://{host_id}"
     
     # Test connection
     session = async_get_clientsession(hass)
@@ -41,14 +77,17 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str,
             if response.status != 200:
                 raise CannotConnect(f"HTTP {response.status}")
             
-            json_data = await response.json()
-            
-            # Validate that we got expected data
-            if "controllerStatus" not in json_data:
-                raise InvalidData("Missing controllerStatus in response")
+            body = await response.read()
             
-            return {"title": f"FFES Sauna ({data[CONF_HOST]})", "host": host}
+        # Validate that we got expected data
+        SaunaState.from_bytes(body)
+        
+        return {"title": f"FFES Sauna ({host_id})", "host": host, "unique_id": host_id}
             
+    except CannotConnect:
+        raise
+    except InvalidPayload as err:
+        raise InvalidData(str(err)) from err
     except aiohttp.ClientError as err:
         _LOGGER.error("Error connecting to sauna controller: %s", err)
         raise CannotConnect from err
@@ -62,10 +101,28 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> OptionsFlowHandler:
+        """Get the options flow for this handler."""
+        return OptionsFlowHandler(config_entry)
+
+    def __init__(self) -> None:
+        """Initialize the flow."""
+        self._discovered: list[str] = []
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
         """Handle the initial step."""
+        return self.async_show_menu(step_id="user", menu_options=["manual", "discover"])
+
+    async def async_step_manual(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Handle a controller entered by the user."""
         errors: dict[str, str] = {}
         
         if user_input is not None:
@@ -79,8 +136,9 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 errors["base"] = "unknown"
             else:
                 # Set unique ID based on host to prevent duplicates
-                await self.async_set_unique_id(user_input[CONF_HOST])
+                await self.async_set_unique_id(info["unique_id"])
                 self._abort_if_unique_id_configured()
+                self._abort_if_host_configured(info["unique_id"])
                 
                 return self.async_create_entry(
                     title=info["title"],
@@ -88,11 +146,189 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 )
 
         return self.async_show_form(
-            step_id="user",
+            step_id="manual",
             data_schema=STEP_USER_DATA_SCHEMA,
             errors=errors,
         )
 
+    async def async_step_discover(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Scan a network range for controllers."""
+        errors: dict[str, str] = {}
+        
+        if user_input is not None:
+            try:
+                hosts = hosts_in_range(user_input[CONF_NETWORK])
+            except InvalidRange:
+                errors["base"] = "invalid_range"
+            else:
+                configured = self._async_configured_hosts()
+                found = await async_scan(
+                    async_get_clientsession(self.hass),
+                    (host for host in hosts if host not in configured),
+                )
+                if found:
+                    self._discovered = found
+                    return await self.async_step_discover_confirm()
+                errors["base"] = "no_devices_found"
+
+        return self.async_show_form(
+            step_id="discover",
+            data_schema=self.add_suggested_values_to_schema(
+                STEP_DISCOVER_DATA_SCHEMA, user_input
+            ),
+            errors=errors,
+        )
+
+    async def async_step_discover_confirm(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Let the user pick which discovered controllers to add."""
+        if user_input is not None:
+            selected = user_input[CONF_HOSTS]
+            hosts = [host for host in self._discovered if host in selected]
+            if hosts:
+                # A flow creates one entry, the others get a discovery flow
+                # of their own
+                for host in hosts[1:]:
+                    result = await self.hass.config_entries.flow.async_init(
+                        DOMAIN,
+                        context={
+                            "source": config_entries.SOURCE_INTEGRATION_DISCOVERY
+                        },
+                        data={CONF_HOST: host},
+                    )
+                    if result["type"] != FlowResultType.CREATE_ENTRY:
+                        _LOGGER.warning(
+                            "Could not add the controller at %s: %s",
+                            host,
+                            result.get("reason"),
+                        )
+                return await self._async_create_host_entry(hosts[0])
+            return self.async_abort(reason="no_devices_selected")
+
+        return self.async_show_form(
+            step_id="discover_confirm",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        CONF_HOSTS, default=self._discovered
+                    ): cv.multi_select({host: host for host in self._discovered}),
+                }
+            ),
+            description_placeholders={"count": str(len(self._discovered))},
+        )
+
+    async def async_step_integration_discovery(
+        self, discovery_info: dict[str, Any]
+    ) -> FlowResult:
+        """Add a controller the user selected in a network search."""
+        return await self._async_create_host_entry(discovery_info[CONF_HOST])
+
+    async def _async_create_host_entry(self, host: str) -> FlowResult:
+        """Create the entry of a discovered controller."""
+        await self.async_set_unique_id(host)
+        self._abort_if_unique_id_configured()
+        self._abort_if_host_configured(host)
+        return self.async_create_entry(
+            title=f"FFES Sauna ({host})",
+            data={CONF_HOST: f"http://{host}"},
+        )
+
+    @callback
+    def _async_configured_hosts(self) -> set[str]:
+        """Return the controllers already configured, as host and port.
+
+        Entries added before unique IDs were normalized carry the address as
+        it was entered, so their host is normalized here instead.
+        """
+        return {
+            normalize_host(entry.data[CONF_HOST])
+            for entry in self._async_current_entries(include_ignore=False)
+        }
+
+    @callback
+    def _abort_if_host_configured(self, host: str) -> None:
+        """Abort if an entry already polls the controller at ``host``."""
+        if host in self._async_configured_hosts():
+            raise AbortFlow("already_configured")
+
+
+class OptionsFlowHandler(config_entries.OptionsFlow):
+    """Handle FFES Sauna options."""
+
+    def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
+        """Initialize the options flow."""
+        self._entry = config_entry
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Manage the options."""
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
+
+        options = self._entry.options
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Optional(
+                        CONF_FLEET_POLLING,
+                        default=options.get(CONF_FLEET_POLLING, False),
+                    ): bool,
+                    vol.Optional(
+                        CONF_SCAN_INTERVAL_ACTIVE,
+                        default=options.get(
+                            CONF_SCAN_INTERVAL_ACTIVE, SCAN_INTERVAL_ACTIVE
+                        ),
+                    ): SCAN_INTERVAL_SCHEMA,
+                    vol.Optional(
+                        CONF_SCAN_INTERVAL_IDLE,
+                        default=options.get(CONF_SCAN_INTERVAL_IDLE, SCAN_INTERVAL_IDLE),
+                    ): SCAN_INTERVAL_SCHEMA,
+                    vol.Optional(
+                        CONF_CONNECT_TIMEOUT,
+                        default=options.get(
+                            CONF_CONNECT_TIMEOUT, DEFAULT_CONNECT_TIMEOUT
+                        ),
+                    ): TIMEOUT_SCHEMA,
+                    vol.Optional(
+                        CONF_READ_TIMEOUT,
+                        default=options.get(CONF_READ_TIMEOUT, DEFAULT_READ_TIMEOUT),
+                    ): TIMEOUT_SCHEMA,
+                    vol.Optional(
+                        CONF_WAIT_FOR_CONTROLLER,
+                        default=options.get(CONF_WAIT_FOR_CONTROLLER, False),
+                    ): bool,
+                    vol.Optional(
+                        CONF_TEMPERATURE_DEADBAND,
+                        default=options.get(CONF_TEMPERATURE_DEADBAND, DEFAULT_DEADBAND),
+                    ): DEADBAND_SCHEMA,
+                    vol.Optional(
+                        CONF_TEMPERATURE_MAX_SILENCE,
+                        default=options.get(
+                            CONF_TEMPERATURE_MAX_SILENCE, DEFAULT_MAX_SILENCE
+                        ),
+                    ): MAX_SILENCE_SCHEMA,
+                    vol.Optional(
+                        CONF_HUMIDITY_DEADBAND,
+                        default=options.get(CONF_HUMIDITY_DEADBAND, DEFAULT_DEADBAND),
+                    ): DEADBAND_SCHEMA,
+                    vol.Optional(
+                        CONF_HUMIDITY_MAX_SILENCE,
+                        default=options.get(
+                            CONF_HUMIDITY_MAX_SILENCE, DEFAULT_MAX_SILENCE
+                        ),
+                    ): MAX_SILENCE_SCHEMA,
+                    vol.Optional(
+                        CONF_TRACE, default=options.get(CONF_TRACE, False)
+                    ): bool,
+                }
+            ),
+        )
+
 
 class CannotConnect(Exception):
     """Error to indicate we cannot connect."""
@@ -4,14 +4,122 @@ DOMAIN = "ffes_sauna"
 
 # Configuration
 CONF_HOST = "host"
+CONF_FLEET_POLLING = "fleet_polling"
+CONF_TEMPERATURE_DEADBAND = "temperature_deadband"
+CONF_TEMPERATURE_MAX_SILENCE = "temperature_max_silence"
+CONF_HUMIDITY_DEADBAND = "humidity_deadband"
+CONF_HUMIDITY_MAX_SILENCE = "humidity_max_silence"
+CONF_SCAN_INTERVAL_ACTIVE = "scan_interval_active"
+CONF_SCAN_INTERVAL_IDLE = "scan_interval_idle"
+CONF_CONNECT_TIMEOUT = "connect_timeout"
+CONF_READ_TIMEOUT = "read_timeout"
+CONF_WAIT_FOR_CONTROLLER = "wait_for_controller"
+CONF_TRACE = "trace"
 
 # Default values
 DEFAULT_SCAN_INTERVAL = 30
+DEFAULT_DEADBAND = 0.0
+DEFAULT_MAX_SILENCE = 900
+
+# Adaptive polling intervals (seconds)
+SCAN_INTERVAL_ACTIVE = 10
+SCAN_INTERVAL_IDLE = 120
+SCAN_INTERVAL_BURST = 3
+BURST_POLL_COUNT = 3
+
+# Shared fleet scheduler
+DATA_FLEET = f"{DOMAIN}_fleet"
+FLEET_MAX_CONCURRENT = 4
+FLEET_JITTER = 2.0
+FLEET_TICK = 1
+
+# Window for merging session changes into one start_session request (seconds)
+COMMAND_DEBOUNCE_SECONDS = 0.5
+
+# Command queue priorities, lower is sent first
+PRIORITY_STOP = 0
+PRIORITY_NORMAL = 1
+
+# Polls after an accepted command until the controller reports it (seconds)
+CONFIRM_BACKOFF = (0.5, 1, 2, 4)
+CONFIRM_TIMEOUT = 15
+CONFIRM_FIELDS = ("status", "light", "aux", "set_temp", "profile")
+
+# Session defaults used when the controller has not reported a value
+DEFAULT_PROFILE = 2
+DEFAULT_TEMPERATURE = 80
+DEFAULT_SESSION_TIME = 130
+DEFAULT_VENTILATION_TIME = 15
+
+# Network discovery of controllers
+DISCOVERY_TIMEOUT = 1.5
+DISCOVERY_MAX_CONCURRENT = 64
+DISCOVERY_MAX_HOSTS = 1024
+
+# Broadcast service limits
+BROADCAST_MAX_CONCURRENT = 16
+BROADCAST_TIMEOUT = 15
+
+# Bus events of state transitions, also offered as device triggers
+EVENT_FFES_SAUNA = f"{DOMAIN}_event"
+TRIGGER_TARGET_REACHED = "target_reached"
+TRIGGER_STATUS_CHANGED = "status_changed"
+TRIGGER_SESSION_FINISHED = "session_finished"
+TRIGGER_CONTROLLER_OFFLINE = "controller_offline"
+TRIGGER_TYPES = (
+    TRIGGER_TARGET_REACHED,
+    TRIGGER_STATUS_CHANGED,
+    TRIGGER_SESSION_FINISHED,
+    TRIGGER_CONTROLLER_OFFLINE,
+)
+
+# Profile service
+PROFILE_POLL_CYCLES = 3
+PROFILE_MAX_TIMEOUT = 3600
+PROFILE_CHECK_INTERVAL = 1.0
+PROFILE_SAMPLE_INTERVAL = 0.001
+PROFILE_REPORT_LINES = 60
+# Entity updates running longer than this block the event loop noticeably
+SLOW_CALLBACK_DURATION = 0.1
+
+# Concurrent requests to one controller
+CLIENT_CONNECTION_LIMIT = 2
+
+# Traffic traces
+TRACE_MAX_BYTES = 5 * 1024 * 1024
+TRACE_BACKUP_COUNT = 3
+TRACE_FLUSH_RECORDS = 100
+TRACE_FLUSH_DELAY = 30
+
+# HTTP timeouts (seconds)
+DEFAULT_CONNECT_TIMEOUT = 5
+DEFAULT_READ_TIMEOUT = 10
+PROBE_TIMEOUT = 3
+
+# Circuit breaker for unreachable controllers
+BREAKER_FAILURE_THRESHOLD = 2
+BREAKER_BASE_BACKOFF = 15
+BREAKER_MAX_BACKOFF = 120
+
+# Heating rate learning for the time-to-target estimate
+HEATING_RATE_ALPHA = 0.2
+HEATING_RATE_WINDOW = 60
+HEATING_RATE_MIN_GAP = 2
+
+# Samples kept in the in-memory telemetry window
+TELEMETRY_BUFFER_SIZE = 90
+
+# Storage of the last known controller state
+STORAGE_VERSION = 1
+STORAGE_SAVE_DELAY = 60
 
 # API endpoints
 ENDPOINT_DATA = "/sauna-data"
 ENDPOINT_CONTROL = "/sauna-control"
 
+# Control actions
+ACTION_START_SESSION = "start_session"
+
 # Sauna status values
 STATUS_OFF = 0
 STATUS_HEATING = 1
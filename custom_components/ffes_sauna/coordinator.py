@@ -1,67 +1,428 @@
 """DataUpdateCoordinator for FFES Sauna."""
 from __future__ import annotations
 
-from datetime import timedelta
+from collections.abc import Iterable, Mapping
+from dataclasses import replace
+from datetime import datetime, timedelta
 import logging
-from typing import Any
+import time
+from typing import TYPE_CHECKING, Any
 
 import aiohttp
 
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.const import CONF_DEVICE_ID
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util.json import json_loads
 
-from .const import DOMAIN, ENDPOINT_DATA, DEFAULT_SCAN_INTERVAL
+from .breaker import STATE_OPEN, CircuitBreaker
+from .client import FFESSaunaClient
+from .command import (
+    CommandConfirmation,
+    CommandQueue,
+    SessionCommandAggregator,
+    parse_session_time,
+)
+from .const import (
+    ACTION_START_SESSION,
+    BURST_POLL_COUNT,
+    CONF_CONNECT_TIMEOUT,
+    CONF_READ_TIMEOUT,
+    CONF_SCAN_INTERVAL_ACTIVE,
+    CONF_SCAN_INTERVAL_IDLE,
+    CONF_TRACE,
+    DEFAULT_CONNECT_TIMEOUT,
+    DEFAULT_READ_TIMEOUT,
+    DEFAULT_SCAN_INTERVAL,
+    DOMAIN,
+    ENDPOINT_CONTROL,
+    ENDPOINT_DATA,
+    EVENT_FFES_SAUNA,
+    PRIORITY_NORMAL,
+    PRIORITY_STOP,
+    PROBE_TIMEOUT,
+    SCAN_INTERVAL_ACTIVE,
+    SCAN_INTERVAL_BURST,
+    SCAN_INTERVAL_IDLE,
+    SLOW_CALLBACK_DURATION,
+    STATUS_HEATING,
+    STATUS_OFF,
+    STATUS_STANDBY,
+    STATUS_VENTILATION,
+)
+from .countdown import SessionCountdown
+from .estimator import HeatingRateEstimator
+from .events import TransitionDetector
+from .models import InvalidPayload, SaunaState
+from .stats import FFESSaunaStats
+from .telemetry import TelemetryBuffer
+from .trace import TraceRecorder
+
+if TYPE_CHECKING:
+    from .fleet import FFESFleetScheduler
+    from .storage import FFESSaunaStore
 
 _LOGGER = logging.getLogger(__name__)
 
 
-class FFESSaunaCoordinator(DataUpdateCoordinator):
+class FFESSaunaCoordinator(DataUpdateCoordinator[SaunaState]):
     """Class to manage fetching FFES Sauna data."""
 
-    def __init__(self, hass: HomeAssistant, host: str) -> None:
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        host: str,
+        fleet_polling: bool = False,
+        store: FFESSaunaStore | None = None,
+        options: Mapping[str, Any] | None = None,
+    ) -> None:
         """Initialize."""
         self.host = host
-        self.session = async_get_clientsession(hass)
+        self._store = store
+        # True while data is a stored state that no live poll has replaced yet
+        self.stale = False
+        self.stale_since: datetime | None = None
+        self.client = FFESSaunaClient(hass, host)
+        # Raw body behind data, to skip decoding unchanged payloads
+        self._last_body: bytes | None = None
+        self.poll_interval = timedelta(seconds=DEFAULT_SCAN_INTERVAL)
+        self.fleet: FFESFleetScheduler | None = None
+        self._unsub_fleet: CALLBACK_TYPE | None = None
+        self.poll_lag: float | None = None
+        self.scan_interval_active = SCAN_INTERVAL_ACTIVE
+        self.scan_interval_idle = SCAN_INTERVAL_IDLE
+        self.timeout = aiohttp.ClientTimeout(
+            total=DEFAULT_CONNECT_TIMEOUT + DEFAULT_READ_TIMEOUT,
+            sock_connect=DEFAULT_CONNECT_TIMEOUT,
+            sock_read=DEFAULT_READ_TIMEOUT,
+        )
+        self.stats = FFESSaunaStats()
+        self.breaker = CircuitBreaker(host)
+        self.heating_model = HeatingRateEstimator(
+            store.heating_rates if store is not None else None
+        )
+        self.telemetry = TelemetryBuffer()
+        self.countdown = SessionCountdown()
+        self.transitions = TransitionDetector()
+        self._device_id: str | None = None
+        # Controller state and availability of the latest poll, not yet
+        # passed to the transition detector
+        self._poll_result: tuple[SaunaState | None, bool] | None = None
+        # What the controller last reported, without held command values
+        self._polled: SaunaState | None = None
+        self._last_status: int | None = None
+        self._burst_remaining = 0
+        self.session_commands = SessionCommandAggregator(hass, self)
+        self.commands = CommandQueue(hass, f"{DOMAIN} {host}", self._async_post)
+        self.confirmation = CommandConfirmation(hass, self)
+        self._previous_data: SaunaState | None = None
+        self._last_notified_success: bool | None = None
+        self._last_notified_stale = False
+        self._listener_index: dict[str | None, list[CALLBACK_TYPE]] | None = None
         
         super().__init__(
             hass,
             _LOGGER,
-            name=DOMAIN,
-            update_interval=timedelta(seconds=DEFAULT_SCAN_INTERVAL),
+            # Names the controller in HA's refresh task and slow-callback logs
+            name=f"{DOMAIN} {host}",
+            # The fleet scheduler triggers refreshes itself
+            update_interval=None if fleet_polling else self.poll_interval,
         )
+        if options:
+            self.async_apply_options(options)
 
-    async def _async_update_data(self) -> dict[str, Any]:
+    async def _async_update_data(self) -> SaunaState:
         """Fetch data from API."""
-        url = f"{self.host}{ENDPOINT_DATA}"
+        try:
+            return await self._async_fetch_data()
+        except UpdateFailed:
+            self._poll_result = (None, False)
+            raise
+
+    async def _async_fetch_data(self) -> SaunaState:
+        """Poll the controller and return the data to show."""
+        if not self.breaker.allow_request():
+            # Fail fast without touching the network
+            self._set_poll_interval(max(self.breaker.retry_in, 1), "circuit open")
+            raise UpdateFailed(
+                f"Controller unreachable, retrying in {self.breaker.retry_in:.0f} s"
+            )
+
+        started = time.monotonic()
         
         try:
-            async with self.session.get(
-                url, timeout=aiohttp.ClientTimeout(total=10)
-            ) as response:
-                if response.status != 200:
-                    raise UpdateFailed(f"HTTP {response.status}")
-                
-                data = await response.json()
-                _LOGGER.debug("Received data: %s", data)
-                return data
-                
+            status, body = await self.client.async_get(
+                ENDPOINT_DATA, self._request_timeout()
+            )
+            if status != 200:
+                raise UpdateFailed(f"HTTP {status}")
+            self.breaker.record_success()
+            if body == self._last_body and self._polled is not None and not self.stale:
+                # Nothing changed on the controller
+                data = self._polled
+            else:
+                data = SaunaState.from_bytes(body)
+                self._last_body = body
+            self._poll_result = (data, True)
+            # Entities show commanded values the controller has yet to report
+            shown = self.confirmation.async_check(data)
+
+        except UpdateFailed as err:
+            self._record_poll_failure(started, str(err))
+            raise
+        except TimeoutError as err:
+            self._record_poll_failure(started, "Timeout", timeout=True)
+            raise UpdateFailed("Timeout communicating with API") from err
+        except InvalidPayload as err:
+            self.stats.poll.record_failure(time.monotonic() - started, str(err))
+            raise UpdateFailed(f"Invalid data from controller: {err}") from err
         except aiohttp.ClientError as err:
+            self._record_poll_failure(started, str(err))
             raise UpdateFailed(f"Error communicating with API: {err}") from err
         except Exception as err:
+            self._record_poll_failure(started, str(err))
             raise UpdateFailed(f"Unexpected error: {err}") from err
 
+        elapsed = time.monotonic() - started
+        self.stats.poll.record_success(elapsed, len(body))
+        _LOGGER.debug("Received %s bytes from %s in %.3f s", len(body), self.host, elapsed)
+        # Statistics, the schedule and the store follow the controller only
+        self._update_poll_interval(data.status)
+        now = time.monotonic()
+        self.telemetry.add(now, data)
+        if self.heating_model.add_sample(data, now):
+            if self._store is not None:
+                self._store.async_save_heating_rates(self.heating_model.rates)
+        self.stale = False
+        self.stale_since = None
+        if self._store is not None and data != self._polled:
+            self._store.async_save_state(data)
+        self._polled = data
+        return shown
+
+    @callback
+    def async_restore(self, state: SaunaState, received: datetime) -> None:
+        """Start from a stored state until the first live poll."""
+        _LOGGER.debug("Restored state of %s from %s", self.host, received)
+        self.data = state
+        self.stale = True
+        self.stale_since = received
+        self._last_status = state.status
+
+    @callback
+    def async_apply_options(self, options: Mapping[str, Any]) -> None:
+        """Use new polling and timeout options from the next request on."""
+        self.scan_interval_active = options.get(
+            CONF_SCAN_INTERVAL_ACTIVE, SCAN_INTERVAL_ACTIVE
+        )
+        self.scan_interval_idle = options.get(
+            CONF_SCAN_INTERVAL_IDLE, SCAN_INTERVAL_IDLE
+        )
+        connect = options.get(CONF_CONNECT_TIMEOUT, DEFAULT_CONNECT_TIMEOUT)
+        read = options.get(CONF_READ_TIMEOUT, DEFAULT_READ_TIMEOUT)
+        self.timeout = aiohttp.ClientTimeout(
+            total=connect + read, sock_connect=connect, sock_read=read
+        )
+        self._async_set_trace(options.get(CONF_TRACE, False))
+        # A burst or an open circuit keeps its own interval until it ends
+        if not self._burst_remaining and self.breaker.state != STATE_OPEN:
+            self._set_poll_interval(
+                self._status_interval(self._last_status), "options changed"
+            )
+
+    @callback
+    def async_join_fleet(self, fleet: FFESFleetScheduler) -> None:
+        """Leave polling to the fleet scheduler until ``async_leave_fleet``."""
+        self.async_leave_fleet()
+        self._unsub_fleet = fleet.async_add(self)
+
+    @callback
+    def async_leave_fleet(self) -> None:
+        """Take polling back from the fleet scheduler."""
+        if self._unsub_fleet is not None:
+            self._unsub_fleet()
+            self._unsub_fleet = None
+
+    @callback
+    def _async_set_trace(self, enabled: bool) -> None:
+        """Start or stop recording the controller traffic."""
+        recorder = self.client.recorder
+        if enabled and recorder is None:
+            self.client.recorder = TraceRecorder(self.hass, self.host)
+            _LOGGER.info("Recording traffic of %s", self.host)
+        elif not enabled and recorder is not None:
+            self.client.recorder = None
+            self.hass.async_create_task(recorder.async_close())
+
+    def _request_timeout(self) -> aiohttp.ClientTimeout:
+        """Return the timeout for the next request, short for breaker probes."""
+        if self.breaker.probing:
+            return aiohttp.ClientTimeout(total=PROBE_TIMEOUT)
+        return self.timeout
+
+    def _record_poll_failure(
+        self, started: float, error: str, timeout: bool = False
+    ) -> None:
+        """Record a failed poll and back off while the circuit is open."""
+        self.stats.poll.record_failure(time.monotonic() - started, error, timeout)
+        self.breaker.record_failure()
+        if self.breaker.state == STATE_OPEN:
+            self._set_poll_interval(max(self.breaker.retry_in, 1), "circuit open")
+
+    @callback
+    def async_add_listener(
+        self, update_callback: CALLBACK_TYPE, context: Any = None
+    ) -> CALLBACK_TYPE:
+        """Listen for data updates.
+
+        ``context`` is the iterable of ``SaunaState`` fields the listener
+        reads, or None to be notified on every update.
+        """
+        remove = super().async_add_listener(update_callback, context)
+        self._listener_index = None
+
+        @callback
+        def remove_listener() -> None:
+            remove()
+            self._listener_index = None
+
+        return remove_listener
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify the listeners, warning when their updates block the loop.
+
+        Transitions are detected here once per poll and fired as events, so
+        automations need not re-render templates on every sensor write. The
+        detector sees what the controller reported, never optimistic or held
+        values, so a command fires its events once the controller applied it.
+        """
+        if (poll_result := self._poll_result) is not None:
+            self._poll_result = None
+            for event_data in self.transitions.update(*poll_result):
+                self._async_fire_event(event_data)
+        started = time.monotonic()
+        self._async_notify_listeners()
+        if (elapsed := time.monotonic() - started) > SLOW_CALLBACK_DURATION:
+            _LOGGER.warning(
+                "Updating the entities of %s took %.3f s", self.host, elapsed
+            )
+
+    @callback
+    def _async_fire_event(self, event_data: dict[str, Any]) -> None:
+        """Fire a transition event for the device of this controller."""
+        if self._device_id is None and self.config_entry is not None:
+            device = dr.async_get(self.hass).async_get_device(
+                identifiers={(DOMAIN, self.config_entry.entry_id)}
+            )
+            self._device_id = device.id if device is not None else None
+        _LOGGER.debug("%s: %s", self.host, event_data)
+        self.hass.bus.async_fire(
+            EVENT_FFES_SAUNA,
+            {CONF_DEVICE_ID: self._device_id, "host": self.host, **event_data},
+        )
+
+    @callback
+    def _async_notify_listeners(self) -> None:
+        """Notify only the listeners whose state fields changed."""
+        if self.data is not None:
+            # Optimistic updates move the countdown as well as polls
+            self.countdown.update(self.data, time.monotonic())
+        previous, self._previous_data = self._previous_data, self.data
+        if (
+            previous is None
+            or self.data is None
+            or self.last_update_success != self._last_notified_success
+            or self.stale != self._last_notified_stale
+        ):
+            self._last_notified_success = self.last_update_success
+            self._last_notified_stale = self.stale
+            super().async_update_listeners()
+            return
+
+        changed = self.data.changed_fields(previous)
+
+        index = self._async_listener_index()
+        notified: set[CALLBACK_TYPE] = set()
+        for key in (None, *changed):
+            for update_callback in index.get(key, ()):
+                if update_callback not in notified:
+                    notified.add(update_callback)
+                    update_callback()
+
+    @callback
+    def _async_listener_index(self) -> dict[str | None, list[CALLBACK_TYPE]]:
+        """Return the state field to listener index, rebuilding it if stale."""
+        if self._listener_index is None:
+            index: dict[str | None, list[CALLBACK_TYPE]] = {}
+            for update_callback, context in list(self._listeners.values()):
+                keys: Iterable[str | None] = (None,) if context is None else context
+                for key in keys:
+                    index.setdefault(key, []).append(update_callback)
+            self._listener_index = index
+        return self._listener_index
+
+    def _update_poll_interval(self, status: int | None) -> None:
+        """Pick the next poll interval from the controller status."""
+        if self._last_status is not None and status != self._last_status:
+            self._burst_remaining = BURST_POLL_COUNT
+        self._last_status = status
+
+        if self._burst_remaining > 0:
+            self._burst_remaining -= 1
+            seconds = SCAN_INTERVAL_BURST
+        else:
+            seconds = self._status_interval(status)
+
+        self._set_poll_interval(seconds, f"status {status}")
+
+    def _status_interval(self, status: int | None) -> float:
+        """Return the regular poll interval for a controller status."""
+        if status in (STATUS_HEATING, STATUS_VENTILATION):
+            return self.scan_interval_active
+        if status in (STATUS_OFF, STATUS_STANDBY):
+            return self.scan_interval_idle
+        return DEFAULT_SCAN_INTERVAL
+
+    def _set_poll_interval(self, seconds: float, reason: str) -> None:
+        """Use a new poll interval from the next poll on."""
+        interval = timedelta(seconds=seconds)
+        if interval != self.poll_interval:
+            _LOGGER.debug("Polling %s every %.0f s (%s)", self.host, seconds, reason)
+            self.poll_interval = interval
+            if self.update_interval is not None:
+                self.update_interval = interval
+
+    async def async_shutdown(self) -> None:
+        """Drop unsent session changes, finish queued commands and stop."""
+        # Flushing here would start a session on every reload
+        self.session_commands.async_cancel()
+        await self.commands.async_drain()
+        self.confirmation.async_cancel()
+        await super().async_shutdown()
+        if self.client.recorder is not None:
+            await self.client.recorder.async_close()
+
     async def async_set_status(self, status: int) -> bool:
         """Set sauna status."""
-        return await self._async_send_command("status", status)
+        if status == STATUS_HEATING and self.session_commands.pending:
+            # start_session starts heating, so send the merged session instead
+            return await self.session_commands.async_flush()
+        if status == STATUS_OFF:
+            # Never start a session the user changed before turning off
+            self.session_commands.async_cancel()
+        return await self._async_send_command(
+            "status", status, {"status": status}
+        )
 
     async def async_set_light(self, state: bool) -> bool:
         """Set light state."""
-        return await self._async_send_command("light", 1 if state else 0)
+        return await self._async_send_command("light", 1 if state else 0, {"light": state})
 
     async def async_set_aux(self, state: bool) -> bool:
         """Set AUX state."""
-        return await self._async_send_command("aux", 1 if state else 0)
+        return await self._async_send_command("aux", 1 if state else 0, {"aux": state})
 
     async def async_start_session(
         self,
@@ -74,7 +435,7 @@ class FFESSaunaCoordinator(DataUpdateCoordinator):
     ) -> bool:
         """Start a sauna session."""
         data = {
-            "action": "start_session",
+            "action": ACTION_START_SESSION,
             "profile": str(profile),
             "temperature": str(temperature),
             "session_time": session_time,
@@ -82,49 +443,138 @@ class FFESSaunaCoordinator(DataUpdateCoordinator):
             "aroma_value": str(aroma_value),
             "humidity_value": str(humidity_value),
         }
+        optimistic = {
+            "status": STATUS_HEATING,
+            "profile": profile,
+            "set_temp": temperature,
+            "session_time": parse_session_time(session_time),
+            "ventilation_time": parse_session_time(ventilation_time),
+            "aroma_value": aroma_value,
+            "humidity_value": humidity_value,
+        }
         
-        return await self._async_send_post(data)
+        return await self._async_send_post(data, optimistic)
 
-    async def _async_send_command(self, action: str, value: int) -> bool:
+    async def _async_send_command(
+        self, action: str, value: int, optimistic: dict[str, Any] | None = None
+    ) -> bool:
         """Send a command to the sauna controller."""
         data = {
             "action": action,
             "value": str(value),
         }
         
-        return await self._async_send_post(data)
+        return await self._async_send_post(data, optimistic)
 
-    async def _async_send_post(self, data: dict[str, str]) -> bool:
-        """Send POST request to controller."""
-        from .const import ENDPOINT_CONTROL
-        
-        url = f"{self.host}{ENDPOINT_CONTROL}"
+    @callback
+    def async_show_pending(self, changes: dict[str, Any]) -> None:
+        """Show session changes that wait to be sent.
+
+        Unlike accepted commands they are not confirmed; a failed send or the
+        next poll replaces them.
+        """
+        if self.data is None or not changes:
+            return
+        self.async_set_updated_data(replace(self.data, **changes))
+
+    @callback
+    def _async_apply_optimistic(self, changes: dict[str, Any]) -> None:
+        """Patch the cached data with a command the controller accepted.
+
+        Confirmation polls reconcile it with the controller.
+        """
+        if self.data is None:
+            return
+        if "status" in changes:
+            # Follow the status change with the usual burst of polls
+            self._update_poll_interval(changes["status"])
+        # Poll until the controller reports the change
+        self.confirmation.async_expect(changes)
+        self.async_set_updated_data(replace(self.data, **changes))
+
+    async def _async_send_post(
+        self, data: dict[str, str], optimistic: dict[str, Any] | None = None
+    ) -> bool:
+        """Queue a POST request to the controller and wait for its result.
+
+        Turning the sauna off jumps ahead of other queued commands.
+        """
+        priority = PRIORITY_NORMAL
+        if data["action"] == "status" and data["value"] == str(STATUS_OFF):
+            priority = PRIORITY_STOP
+        return await self.commands.async_send(
+            data["action"], data, optimistic, priority
+        )
+
+    async def _async_post(
+        self, data: dict[str, str], optimistic: dict[str, Any] | None = None
+    ) -> bool:
+        """Send POST request to controller.
+
+        On success the ``optimistic`` changes are applied to the cached data
+        right away instead of waiting for a refresh.
+        """
+        if not self.breaker.allow_request():
+            _LOGGER.warning("Command not sent, %s is unreachable", self.host)
+            return False
+
+        started = time.monotonic()
         
         try:
-            async with self.session.post(
-                url,
-                data=data,
-                headers={"Content-Type": "application/x-www-form-urlencoded"},
-                timeout=aiohttp.ClientTimeout(total=10),
-            ) as response:
-                if response.status != 200:
-                    _LOGGER.error("Failed to send command: HTTP %s", response.status)
-                    return False
-                
-                result = await response.json()
-                success = result.get("success", False)
-                
-                if not success:
-                    _LOGGER.error("Command failed: %s", result.get("message", "Unknown error"))
-                
-                # Request immediate data refresh
-                await self.async_request_refresh()
-                
-                return success
+            status, body = await self.client.async_post(
+                ENDPOINT_CONTROL, data, self._request_timeout()
+            )
+            if status != 200:
+                _LOGGER.error("Failed to send command: HTTP %s", status)
+                self.stats.command.record_failure(
+                    time.monotonic() - started, f"HTTP {status}"
+                )
+                self.breaker.record_failure()
+                return False
+            self.breaker.record_success()
+            result = json_loads(body)
+            if not isinstance(result, dict):
+                raise ValueError(f"Unexpected response: {result!r}")
                 
+        except TimeoutError:
+            _LOGGER.error("Timeout sending command to %s", self.host)
+            self.stats.command.record_failure(
+                time.monotonic() - started, "Timeout", timeout=True
+            )
+            self.breaker.record_failure()
+            return False
         except aiohttp.ClientError as err:
             _LOGGER.error("Error sending command: %s", err)
+            self.stats.command.record_failure(time.monotonic() - started, str(err))
+            self.breaker.record_failure()
+            return False
+        except ValueError as err:
+            # The controller answered, so this is no connectivity failure
+            _LOGGER.warning("Malformed command response from %s: %s", self.host, err)
+            self.stats.command.record_failure(time.monotonic() - started, str(err))
+            # The command may have been applied, show the controller's state
+            await self.async_request_refresh()
             return False
         except Exception as err:
             _LOGGER.exception("Unexpected error sending command: %s", err)
+            self.stats.command.record_failure(time.monotonic() - started, str(err))
+            self.breaker.record_failure()
             return False
+
+        elapsed = time.monotonic() - started
+        success = result.get("success", False)
+        
+        if not success:
+            message = result.get("message", "Unknown error")
+            _LOGGER.error("Command failed: %s", message)
+            self.stats.command.record_failure(elapsed, message)
+            # Show the controller's actual state
+            await self.async_request_refresh()
+        else:
+            self.stats.command.record_success(elapsed, len(body))
+            if optimistic:
+                self._async_apply_optimistic(optimistic)
+            else:
+                await self.async_request_refresh()
+        
+        return success
@@ -0,0 +1,59 @@
+"""Local countdown of FFES Sauna sessions."""
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+from homeassistant.util import dt as dt_util
+
+from .const import STATUS_HEATING, STATUS_VENTILATION
+from .models import SaunaState
+
+
+class SessionCountdown:
+    """Count down the current heating or ventilation phase locally.
+
+    The controller only reports the configured length of a phase, so its
+    start is anchored when the status changes and the remaining time follows
+    the monotonic clock. Every update re-syncs the phase and its length with
+    the controller data.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the countdown."""
+        self._status: int | None = None
+        self._started = 0.0
+        self._duration = 0.0
+        # False while the phase was already running when first seen
+        self.observed_start = False
+        self.ends_at: datetime | None = None
+
+    def update(self, state: SaunaState, now: float) -> None:
+        """Re-sync with controller data received at monotonic time ``now``."""
+        if state.status == STATUS_HEATING:
+            duration = state.session_minutes * 60.0
+        elif state.status == STATUS_VENTILATION:
+            duration = state.ventilation_minutes * 60.0
+        else:
+            duration = 0.0
+
+        if state.status != self._status:
+            self.observed_start = self._status is not None
+            self._status = state.status
+            self._started = now
+        elif duration == self._duration:
+            return
+        self._duration = duration
+
+        if (remaining := self.remaining(now)) is None:
+            self.ends_at = None
+        else:
+            # Fixed until the next re-sync so the state does not jitter
+            self.ends_at = (dt_util.utcnow() + timedelta(seconds=remaining)).replace(
+                microsecond=0
+            )
+
+    def remaining(self, now: float) -> float | None:
+        """Return the seconds left in the current phase."""
+        if not self._duration:
+            return None
+        return max(0.0, self._started + self._duration - now)
@@ -0,0 +1,99 @@
+"""Device triggers for FFES Sauna."""
+from __future__ import annotations
+
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.components.device_automation import DEVICE_TRIGGER_BASE_SCHEMA
+from homeassistant.components.homeassistant.triggers import event as event_trigger
+from homeassistant.const import (
+    CONF_DEVICE_ID,
+    CONF_DOMAIN,
+    CONF_PLATFORM,
+    CONF_TYPE,
+)
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant
+from homeassistant.helpers.trigger import TriggerActionType, TriggerInfo
+from homeassistant.helpers.typing import ConfigType
+
+from .const import (
+    DOMAIN,
+    EVENT_FFES_SAUNA,
+    STATUS_MAP,
+    TRIGGER_STATUS_CHANGED,
+    TRIGGER_TYPES,
+)
+from .events import ATTR_NEW_STATUS, ATTR_OLD_STATUS
+
+CONF_FROM = "from"
+CONF_TO = "to"
+
+STATUS_NAMES = list(STATUS_MAP.values())
+
+TRIGGER_SCHEMA = DEVICE_TRIGGER_BASE_SCHEMA.extend(
+    {
+        vol.Required(CONF_TYPE): vol.In(TRIGGER_TYPES),
+        vol.Optional(CONF_FROM): vol.In(STATUS_NAMES),
+        vol.Optional(CONF_TO): vol.In(STATUS_NAMES),
+    }
+)
+
+
+async def async_get_triggers(
+    hass: HomeAssistant, device_id: str
+) -> list[dict[str, Any]]:
+    """List the triggers of an FFES Sauna device."""
+    return [
+        {
+            CONF_PLATFORM: "device",
+            CONF_DOMAIN: DOMAIN,
+            CONF_DEVICE_ID: device_id,
+            CONF_TYPE: trigger_type,
+        }
+        for trigger_type in TRIGGER_TYPES
+    ]
+
+
+async def async_get_trigger_capabilities(
+    hass: HomeAssistant, config: ConfigType
+) -> dict[str, vol.Schema]:
+    """Offer old and new status filters for status changes."""
+    if config[CONF_TYPE] != TRIGGER_STATUS_CHANGED:
+        return {}
+    return {
+        "extra_fields": vol.Schema(
+            {
+                vol.Optional(CONF_FROM): vol.In(STATUS_NAMES),
+                vol.Optional(CONF_TO): vol.In(STATUS_NAMES),
+            }
+        )
+    }
+
+
+async def async_attach_trigger(
+    hass: HomeAssistant,
+    config: ConfigType,
+    action: TriggerActionType,
+    trigger_info: TriggerInfo,
+) -> CALLBACK_TYPE:
+    """Listen for the transition events of a device."""
+    event_data = {
+        CONF_DEVICE_ID: config[CONF_DEVICE_ID],
+        CONF_TYPE: config[CONF_TYPE],
+    }
+    if CONF_FROM in config:
+        event_data[ATTR_OLD_STATUS] = config[CONF_FROM]
+    if CONF_TO in config:
+        event_data[ATTR_NEW_STATUS] = config[CONF_TO]
+
+    event_config = event_trigger.TRIGGER_SCHEMA(
+        {
+            event_trigger.CONF_PLATFORM: "event",
+            event_trigger.CONF_EVENT_TYPE: EVENT_FFES_SAUNA,
+            event_trigger.CONF_EVENT_DATA: event_data,
+        }
+    )
+    return await event_trigger.async_attach_trigger(
+        hass, event_config, action, trigger_info, platform_type="device"
+    )
@@ -0,0 +1,61 @@
+"""Diagnostics support for FFES Sauna."""
+from __future__ import annotations
+
+from typing import Any
+
+from yarl import URL
+
+from homeassistant.components.diagnostics import REDACTED, async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_HOST
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .coordinator import FFESSaunaCoordinator
+
+# The title and unique ID of an entry hold the controller's address too
+TO_REDACT = {CONF_HOST, "title", "unique_id"}
+
+
+def _redact_host(data: Any, host: str) -> Any:
+    """Replace the controller's address in strings, such as error messages."""
+    if isinstance(data, dict):
+        return {key: _redact_host(value, host) for key, value in data.items()}
+    if isinstance(data, (list, tuple)):
+        return [_redact_host(value, host) for value in data]
+    if isinstance(data, str):
+        return data.replace(host, REDACTED)
+    return data
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: FFESSaunaCoordinator = hass.data[DOMAIN][entry.entry_id]
+
+    diagnostics = {
+        "entry": async_redact_data(entry.as_dict(), TO_REDACT),
+        "polling": {
+            "last_update_success": coordinator.last_update_success,
+            "stale": coordinator.stale,
+            "poll_interval": coordinator.poll_interval.total_seconds(),
+            "fleet_polling": coordinator.fleet is not None,
+            "poll_lag": coordinator.poll_lag,
+            "circuit": coordinator.breaker.state,
+            "circuit_retry_in": coordinator.breaker.retry_in,
+        },
+        "stats": coordinator.stats.as_dict(),
+        "command_queue": {
+            "depth": coordinator.commands.depth,
+            "wait": coordinator.commands.wait.as_dict(),
+        },
+        "command_confirmation": {
+            "pending": coordinator.confirmation.pending,
+            "latency": coordinator.confirmation.latency.as_dict(),
+            "unconfirmed": coordinator.confirmation.unconfirmed,
+        },
+        "data": coordinator.data.as_dict() if coordinator.data else None,
+    }
+    # Errors name the bare host, without scheme, port or brackets
+    return _redact_host(diagnostics, URL(coordinator.host).host or coordinator.host)
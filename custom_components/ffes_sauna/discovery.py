@@ -0,0 +1,125 @@
+"""Network discovery of FFES Sauna controllers."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterable
+import ipaddress
+import logging
+
+import aiohttp
+
+from .const import (
+    DISCOVERY_MAX_CONCURRENT,
+    DISCOVERY_MAX_HOSTS,
+    DISCOVERY_TIMEOUT,
+    ENDPOINT_DATA,
+)
+from .models import InvalidPayload, SaunaState
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class InvalidRange(ValueError):
+    """Error to indicate a scan range we cannot use."""
+
+
+def format_host(address: str) -> str:
+    """Return an address as it appears in a URL, with IPv6 in brackets."""
+    try:
+        if ipaddress.ip_address(address).version == 6:
+            return f"[{address}]"
+    except ValueError:
+        pass
+    return address
+
+
+def normalize_host(value: str) -> str:
+    """Return the host, and port if given, of a controller address or URL.
+
+    Both the manual and the discovery steps identify controllers this way.
+    """
+    host = value.strip()
+    for scheme in ("http://", "https://"):
+        if host.startswith(scheme):
+            host = host[len(scheme) :]
+    return format_host(host.rstrip("/"))
+
+
+def hosts_in_range(value: str) -> list[str]:
+    """Expand a scan range into the hosts to probe.
+
+    Accepts an IPv4 or IPv6 network in CIDR notation such as
+    ``192.168.0.0/24``, or a host with a port range such as
+    ``127.0.0.1:8000-8009`` or ``[::1]:8000-8009`` for simulators.
+    """
+    value = value.strip()
+    try:
+        network = ipaddress.ip_network(value, strict=False)
+    except ValueError:
+        network = None
+
+    if network is not None:
+        if network.num_addresses > DISCOVERY_MAX_HOSTS + 2:
+            raise InvalidRange(f"Network too large: {value}")
+        hosts = [format_host(str(address)) for address in network.hosts()]
+    elif "/" not in value and ":" in value:
+        host, _, ports = value.rpartition(":")
+        first, _, last = ports.partition("-")
+        try:
+            start, end = int(first), int(last or first)
+        except ValueError as err:
+            raise InvalidRange(f"Invalid port range: {ports}") from err
+        if not host or not 0 < start <= end < 65536:
+            raise InvalidRange(f"Invalid port range: {value}")
+        if format_host(host) != host:
+            # An IPv6 address must be bracketed to tell it from the ports
+            raise InvalidRange(f"IPv6 host without brackets: {value}")
+        hosts = [f"{host}:{port}" for port in range(start, end + 1)]
+    else:
+        raise InvalidRange(f"Invalid network: {value}")
+
+    if len(hosts) > DISCOVERY_MAX_HOSTS:
+        raise InvalidRange(f"Range too large: {value}")
+    return hosts
+
+
+async def _async_probe(
+    session: aiohttp.ClientSession,
+    host: str,
+    timeout: aiohttp.ClientTimeout,
+) -> bool:
+    """Return True if an FFES Sauna controller answers at ``host``.
+
+    ``host`` is formatted for a URL, see ``format_host``.
+    """
+    try:
+        async with session.get(f"http://{host}{ENDPOINT_DATA}", timeout=timeout) as response:
+            if response.status != 200:
+                return False
+            body = await response.read()
+        # A payload with controllerStatus is the controller's fingerprint
+        SaunaState.from_bytes(body)
+    except (TimeoutError, aiohttp.ClientError, InvalidPayload):
+        return False
+    return True
+
+
+async def async_scan(
+    session: aiohttp.ClientSession,
+    hosts: Iterable[str],
+    timeout: float = DISCOVERY_TIMEOUT,
+    max_concurrent: int = DISCOVERY_MAX_CONCURRENT,
+) -> list[str]:
+    """Probe hosts concurrently and return those running a controller."""
+    semaphore = asyncio.Semaphore(max_concurrent)
+    client_timeout = aiohttp.ClientTimeout(total=timeout)
+
+    async def async_probe(host: str) -> bool:
+        async with semaphore:
+            return await _async_probe(session, host, client_timeout)
+
+    hosts = list(hosts)
+    results = await asyncio.gather(*(async_probe(host) for host in hosts))
+    found = [host for host, result in zip(hosts, results) if result]
+    _LOGGER.debug("Found %s controllers among %s hosts", len(found), len(hosts))
+    return found
@@ -0,0 +1,19 @@
+"""Base entity for FFES Sauna."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .coordinator import FFESSaunaCoordinator
+
+
+class FFESSaunaEntity(CoordinatorEntity[FFESSaunaCoordinator]):
+    """Representation of a FFES Sauna entity."""
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Mark values restored from storage until the first live poll."""
+        if self.coordinator.stale:
+            return {"stale": True, "stale_since": self.coordinator.stale_since}
+        return None
@@ -0,0 +1,74 @@
+"""Time-to-target estimation for FFES Sauna."""
+from __future__ import annotations
+
+from .const import (
+    HEATING_RATE_ALPHA,
+    HEATING_RATE_MIN_GAP,
+    HEATING_RATE_WINDOW,
+    STATUS_HEATING,
+)
+from .models import SaunaState
+
+
+class HeatingRateEstimator:
+    """Learn the heating rate of each profile from the temperature stream.
+
+    Every profile keeps an exponentially weighted moving average of the rate
+    of rise in degrees per minute, measured over windows of at least
+    ``HEATING_RATE_WINDOW`` seconds while the cabin is well below target.
+    Each sample costs O(1) time and memory.
+    """
+
+    def __init__(self, rates: dict[int, float] | None = None) -> None:
+        """Initialize with previously learned rates."""
+        self.rates: dict[int, float] = dict(rates or {})
+        self._anchor: tuple[float, float, int] | None = None
+
+    def add_sample(self, state: SaunaState, now: float) -> bool:
+        """Feed one poll, return True if a learned rate changed."""
+        if (
+            state.status != STATUS_HEATING
+            or state.actual_temp is None
+            or state.set_temp is None
+            or state.profile is None
+            or state.set_temp - state.actual_temp < HEATING_RATE_MIN_GAP
+        ):
+            # Only the ramp-up is representative, not holding the temperature
+            self._anchor = None
+            return False
+
+        if self._anchor is None or self._anchor[2] != state.profile:
+            self._anchor = (now, state.actual_temp, state.profile)
+            return False
+
+        started, start_temp, profile = self._anchor
+        elapsed = now - started
+        if elapsed < HEATING_RATE_WINDOW:
+            return False
+
+        self._anchor = (now, state.actual_temp, profile)
+        rate = (state.actual_temp - start_temp) * 60 / elapsed
+        if rate <= 0:
+            return False
+        if (previous := self.rates.get(profile)) is None:
+            self.rates[profile] = rate
+        else:
+            self.rates[profile] = previous + HEATING_RATE_ALPHA * (rate - previous)
+        return True
+
+    def minutes_to_target(self, state: SaunaState) -> float | None:
+        """Return the estimated minutes until the target temperature."""
+        if (
+            state.status != STATUS_HEATING
+            or state.actual_temp is None
+            or state.set_temp is None
+        ):
+            return None
+        if (gap := state.set_temp - state.actual_temp) <= 0:
+            return 0.0
+        if (rate := self.rates.get(state.profile)) is None:
+            if not self.rates:
+                return None
+            # Not learned for this profile yet, use the average of the others
+            rate = sum(self.rates.values()) / len(self.rates)
+        return gap / rate
@@ -0,0 +1,95 @@
+"""State transitions of FFES Sauna controllers."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.const import CONF_TYPE
+
+from .const import (
+    STATUS_HEATING,
+    STATUS_OFF,
+    STATUS_VENTILATION,
+    TRIGGER_CONTROLLER_OFFLINE,
+    TRIGGER_SESSION_FINISHED,
+    TRIGGER_STATUS_CHANGED,
+    TRIGGER_TARGET_REACHED,
+)
+from .models import SaunaState
+
+ATTR_OLD_STATUS = "old_status"
+ATTR_NEW_STATUS = "new_status"
+
+
+def _at_target(state: SaunaState) -> bool:
+    """Return True if a heating sauna has reached its target temperature."""
+    return (
+        state.status == STATUS_HEATING
+        and state.actual_temp is not None
+        and state.set_temp is not None
+        and state.actual_temp >= state.set_temp
+    )
+
+
+class TransitionDetector:
+    """Derive transitions from consecutive controller states.
+
+    Each transition is reported once: the target temperature once per
+    heating phase and target, the controller going offline once per outage.
+    The first state only sets the baseline, so a restart reports nothing.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the detector."""
+        self._previous: SaunaState | None = None
+        self._online: bool | None = None
+        self._target_reached = False
+
+    def update(self, state: SaunaState | None, online: bool) -> list[dict[str, Any]]:
+        """Return the event data of the transitions since the last update."""
+        events: list[dict[str, Any]] = []
+        if not online:
+            if self._online:
+                events.append({CONF_TYPE: TRIGGER_CONTROLLER_OFFLINE})
+            self._online = False
+            return events
+        self._online = True
+        if state is None:
+            return events
+
+        previous, self._previous = self._previous, state
+        if previous is None:
+            # A sauna found already at its target did not just reach it
+            self._target_reached = _at_target(state)
+            return events
+
+        if state.status != previous.status:
+            events.append(
+                {
+                    CONF_TYPE: TRIGGER_STATUS_CHANGED,
+                    ATTR_OLD_STATUS: previous.status_name,
+                    ATTR_NEW_STATUS: state.status_name,
+                }
+            )
+            if state.status == STATUS_OFF and previous.status in (
+                STATUS_HEATING,
+                STATUS_VENTILATION,
+            ):
+                events.append(
+                    {
+                        CONF_TYPE: TRIGGER_SESSION_FINISHED,
+                        "profile": previous.profile_name,
+                    }
+                )
+
+        if state.status != STATUS_HEATING or state.set_temp != previous.set_temp:
+            self._target_reached = False
+        if not self._target_reached and _at_target(state):
+            self._target_reached = True
+            events.append(
+                {
+                    CONF_TYPE: TRIGGER_TARGET_REACHED,
+                    "temperature": state.actual_temp,
+                    "target_temperature": state.set_temp,
+                }
+            )
+        return events
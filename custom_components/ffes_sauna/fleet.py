@@ -0,0 +1,166 @@
+"""Shared poll scheduler for many FFES Sauna controllers."""
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+import logging
+import random
+import time
+from typing import TYPE_CHECKING
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+
+from .const import DATA_FLEET, FLEET_JITTER, FLEET_MAX_CONCURRENT, FLEET_TICK
+
+if TYPE_CHECKING:
+    from .coordinator import FFESSaunaCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass
+class _FleetMember:
+    """Scheduling state for one coordinator."""
+
+    coordinator: FFESSaunaCoordinator
+    next_due: float | None = None
+
+
+class FFESFleetScheduler:
+    """Spread polls of all fleet-managed controllers over their interval.
+
+    Polls are staggered evenly with jitter and at most ``max_concurrent``
+    requests are in flight at once. The delay between a poll falling due and
+    actually starting is kept per host in ``lag``.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        max_concurrent: int = FLEET_MAX_CONCURRENT,
+        jitter: float = FLEET_JITTER,
+    ) -> None:
+        """Initialize the scheduler."""
+        self.hass = hass
+        self._jitter = jitter
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._members: dict[str, _FleetMember] = {}
+        self._unsub_tick: CALLBACK_TYPE | None = None
+        self.lag: dict[str, float] = {}
+
+    @callback
+    def async_add(self, coordinator: FFESSaunaCoordinator) -> CALLBACK_TYPE:
+        """Take over polling of a coordinator."""
+        coordinator.fleet = self
+        self._members[coordinator.host] = _FleetMember(coordinator, time.monotonic())
+        self._async_spread()
+
+        if self._unsub_tick is None:
+            self._unsub_tick = async_track_time_interval(
+                self.hass, self._async_tick, timedelta(seconds=FLEET_TICK)
+            )
+
+        @callback
+        def remove() -> None:
+            self.async_remove(coordinator)
+
+        return remove
+
+    @callback
+    def async_remove(self, coordinator: FFESSaunaCoordinator) -> None:
+        """Hand polling of a coordinator back to it."""
+        member = self._members.get(coordinator.host)
+        if member is None or member.coordinator is not coordinator:
+            return
+        del self._members[coordinator.host]
+        self.lag.pop(coordinator.host, None)
+        coordinator.fleet = None
+        if not self._members and self._unsub_tick is not None:
+            self._unsub_tick()
+            self._unsub_tick = None
+
+    async def async_first_refresh(self, coordinator: FFESSaunaCoordinator) -> None:
+        """Run a coordinator's first refresh within the concurrency cap."""
+        async with self._semaphore:
+            await coordinator.async_config_entry_first_refresh()
+
+    async def async_refresh(self, coordinator: FFESSaunaCoordinator) -> None:
+        """Refresh a coordinator out of schedule within the concurrency cap.
+
+        A poll already in flight stands in for the refresh. Otherwise the
+        member's scheduled poll is held back while the refresh runs and
+        moved a full interval past it.
+        """
+        member = self._members.get(coordinator.host)
+        if member is None or member.coordinator is not coordinator:
+            async with self._semaphore:
+                await coordinator.async_refresh()
+            return
+        if member.next_due is None:
+            return
+
+        member.next_due = None
+        try:
+            async with self._semaphore:
+                await coordinator.async_refresh()
+        finally:
+            if coordinator.host in self._members:
+                member.next_due = (
+                    time.monotonic()
+                    + coordinator.poll_interval.total_seconds()
+                    + random.uniform(0, self._jitter)
+                )
+
+    @callback
+    def _async_spread(self) -> None:
+        """Give every member an evenly spaced, jittered next poll time."""
+        now = time.monotonic()
+        count = len(self._members)
+        for position, member in enumerate(self._members.values()):
+            if member.next_due is None:
+                # Poll in flight, it reschedules itself when done
+                continue
+            interval = member.coordinator.poll_interval.total_seconds()
+            member.next_due = (
+                now + interval * (position + 1) / count + random.uniform(0, self._jitter)
+            )
+
+    @callback
+    def _async_tick(self, _now: datetime) -> None:
+        """Start the polls that are due."""
+        now = time.monotonic()
+        for member in self._members.values():
+            if member.next_due is not None and member.next_due <= now:
+                due, member.next_due = member.next_due, None
+                self.hass.async_create_task(
+                    self._async_poll(member, due),
+                    f"ffes_sauna fleet poll {member.coordinator.host}",
+                )
+
+    async def _async_poll(self, member: _FleetMember, due: float) -> None:
+        """Poll one controller and schedule its next poll."""
+        coordinator = member.coordinator
+        async with self._semaphore:
+            lag = time.monotonic() - due
+            self.lag[coordinator.host] = lag
+            coordinator.poll_lag = lag
+            if lag > coordinator.poll_interval.total_seconds() / 2:
+                _LOGGER.debug("Poll of %s started %.1f s late", coordinator.host, lag)
+            await coordinator.async_refresh()
+
+        if coordinator.host not in self._members:
+            return
+        interval = coordinator.poll_interval.total_seconds()
+        member.next_due = max(due + interval, time.monotonic()) + random.uniform(
+            0, self._jitter
+        )
+
+
+@callback
+def async_get_fleet(hass: HomeAssistant) -> FFESFleetScheduler:
+    """Return the shared fleet scheduler, creating it on first use."""
+    if (fleet := hass.data.get(DATA_FLEET)) is None:
+        fleet = hass.data[DATA_FLEET] = FFESFleetScheduler(hass)
+    return fleet
@@ -0,0 +1,159 @@
+"""Data models for FFES Sauna."""
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass, field, fields
+from typing import Any
+
+from homeassistant.util.json import json_loads
+
+from .const import PROFILES, STATUS_MAP
+
+
+# Status codes are kept as 16-bit integers in the telemetry buffer
+STATUS_MIN = -(2**15)
+STATUS_MAX = 2**15 - 1
+
+
+class InvalidPayload(ValueError):
+    """Error to indicate the controller sent data we cannot use."""
+
+
+def _hhmm_minutes(value: int) -> int:
+    """Convert an HHMM integer to minutes."""
+    return value // 100 * 60 + value % 100
+
+
+def hhmm_label(value: int) -> str:
+    """Format an HHMM integer as an HH:MM string."""
+    return f"{value // 100:02d}:{value % 100:02d}"
+
+
+def _int(payload: dict[str, Any], key: str, default: int | None = None) -> int | None:
+    """Return an integer field, rejecting values that are not numbers."""
+    value = payload.get(key)
+    if value is None:
+        return default
+    try:
+        return int(value)
+    except (TypeError, ValueError) as err:
+        raise InvalidPayload(f"Invalid {key}: {value!r}") from err
+
+
+def _float(payload: dict[str, Any], key: str) -> float | None:
+    """Return a numeric field, keeping integers as reported."""
+    value = payload.get(key)
+    if value is None or (isinstance(value, int | float) and not isinstance(value, bool)):
+        return value
+    try:
+        return float(value)
+    except (TypeError, ValueError) as err:
+        raise InvalidPayload(f"Invalid {key}: {value!r}") from err
+
+
+@dataclass(frozen=True, slots=True)
+class SaunaState:
+    """Snapshot of one ``/sauna-data`` payload, decoded and validated once."""
+
+    status: int
+    actual_temp: float | None = None
+    humidity: float | None = None
+    set_temp: int | None = None
+    profile: int | None = None
+    session_time: int = 0
+    ventilation_time: int = 0
+    aroma_value: int | None = None
+    humidity_value: int | None = None
+    light: bool = False
+    aux: bool = False
+    # Derived from the fields above
+    session_minutes: int = field(init=False)
+    ventilation_minutes: int = field(init=False)
+    session_label: str = field(init=False)
+    ventilation_label: str = field(init=False)
+
+    def __post_init__(self) -> None:
+        """Derive the parsed session and ventilation times."""
+        object.__setattr__(self, "session_minutes", _hhmm_minutes(self.session_time))
+        object.__setattr__(
+            self, "ventilation_minutes", _hhmm_minutes(self.ventilation_time)
+        )
+        object.__setattr__(self, "session_label", hhmm_label(self.session_time))
+        object.__setattr__(
+            self, "ventilation_label", hhmm_label(self.ventilation_time)
+        )
+
+    @classmethod
+    def from_bytes(cls, body: bytes) -> SaunaState:
+        """Decode a raw ``/sauna-data`` response body."""
+        try:
+            payload = json_loads(body)
+        except ValueError as err:
+            raise InvalidPayload(f"Invalid JSON: {err}") from err
+        return cls.from_payload(payload)
+
+    @classmethod
+    def from_payload(cls, payload: Any) -> SaunaState:
+        """Validate a decoded ``/sauna-data`` payload."""
+        if not isinstance(payload, dict):
+            raise InvalidPayload("Payload is not an object")
+        if (status := _int(payload, "controllerStatus")) is None:
+            raise InvalidPayload("Missing controllerStatus")
+        if not STATUS_MIN <= status <= STATUS_MAX:
+            raise InvalidPayload(f"Invalid controllerStatus: {status}")
+
+        return cls(
+            status=status,
+            actual_temp=_float(payload, "actualTemp"),
+            humidity=_float(payload, "humidity"),
+            set_temp=_int(payload, "setTemp"),
+            profile=_int(payload, "profile"),
+            session_time=_int(payload, "sessionTime", 0) or 0,
+            ventilation_time=_int(payload, "ventilationTime", 0) or 0,
+            aroma_value=_int(payload, "aromaValue"),
+            humidity_value=_int(payload, "humidityValue"),
+            light=bool(_int(payload, "light", 0)),
+            aux=bool(_int(payload, "aux", 0)),
+        )
+
+    @property
+    def status_name(self) -> str:
+        """Return the status as a string."""
+        return STATUS_MAP.get(self.status, "unknown")
+
+    @property
+    def profile_name(self) -> str | None:
+        """Return the profile name, if known."""
+        return PROFILES.get(self.profile)
+
+    def changed_fields(self, other: SaunaState) -> list[str]:
+        """Return the names of the fields that differ from ``other``."""
+        if self == other:
+            return []
+        return [
+            name
+            for name in _FIELD_NAMES
+            if getattr(self, name) != getattr(other, name)
+        ]
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return all fields as a dict."""
+        return asdict(self)
+
+    def as_payload(self) -> dict[str, Any]:
+        """Return the state in the controller's ``/sauna-data`` format."""
+        return {
+            "controllerStatus": self.status,
+            "actualTemp": self.actual_temp,
+            "humidity": self.humidity,
+            "setTemp": self.set_temp,
+            "profile": self.profile,
+            "sessionTime": self.session_time,
+            "ventilationTime": self.ventilation_time,
+            "aromaValue": self.aroma_value,
+            "humidityValue": self.humidity_value,
+            "light": self.light,
+            "aux": self.aux,
+        }
+
+
+_FIELD_NAMES = tuple(item.name for item in fields(SaunaState))
@@ -9,11 +9,13 @@ from homeassistant.components.number import NumberEntity, NumberEntityDescriptio
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import PERCENTAGE, UnitOfTemperature
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, MIN_TEMP, MAX_TEMP, MIN_HUMIDITY, MAX_HUMIDITY, PROFILE_REVERSE_MAP
+from .const import DOMAIN, MIN_TEMP, MAX_TEMP, MIN_HUMIDITY, MAX_HUMIDITY
 from .coordinator import FFESSaunaCoordinator
+from .entity import FFESSaunaEntity
+from .models import SaunaState
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -22,7 +24,8 @@ _LOGGER = logging.getLogger(__name__)
 class FFESSaunaNumberEntityDescription(NumberEntityDescription):
     """Describes FFES Sauna number entity."""
 
-    value_fn: Callable[[dict], float | None] | None = None
+    value_fn: Callable[[SaunaState], float | None] | None = None
+    source_keys: tuple[str, ...] | None = None
 
 
 NUMBERS: tuple[FFESSaunaNumberEntityDescription, ...] = (
@@ -35,7 +38,8 @@ NUMBERS: tuple[FFESSaunaNumberEntityDescription, ...] = (
         native_step=1,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         mode=NumberMode.BOX,
-        value_fn=lambda data: data.get("setTemp"),
+        source_keys=("set_temp",),
+        value_fn=lambda state: state.set_temp,
     ),
     FFESSaunaNumberEntityDescription(
         key="humidity_setting",
@@ -46,7 +50,8 @@ NUMBERS: tuple[FFESSaunaNumberEntityDescription, ...] = (
         native_step=5,
         native_unit_of_measurement=PERCENTAGE,
         mode=NumberMode.SLIDER,
-        value_fn=lambda data: data.get("humidityValue"),
+        source_keys=("humidity_value",),
+        value_fn=lambda state: state.humidity_value,
     ),
 )
 
@@ -67,7 +72,7 @@ async def async_setup_entry(
     async_add_entities(entities)
 
 
-class FFESSaunaNumber(CoordinatorEntity, NumberEntity):
+class FFESSaunaNumber(FFESSaunaEntity, NumberEntity):
     """Representation of a FFES Sauna number entity."""
 
     entity_description: FFESSaunaNumberEntityDescription
@@ -79,7 +84,7 @@ class FFESSaunaNumber(CoordinatorEntity, NumberEntity):
         entry: ConfigEntry,
     ) -> None:
         """Initialize the number entity."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, description.source_keys)
         self.entity_description = description
         self._attr_unique_id = f"{entry.entry_id}_{description.key}"
         self._attr_device_info = {
@@ -98,26 +103,11 @@ class FFESSaunaNumber(CoordinatorEntity, NumberEntity):
 
     async def async_set_native_value(self, value: float) -> None:
         """Update the current value."""
-        # Get current settings
-        data = self.coordinator.data
-        profile_name = data.get("profile", 2)
-        
-        session_time_raw = data.get("sessionTime", 130)
-        hours = session_time_raw // 100
-        minutes = session_time_raw % 100
-        session_time = f"{hours:02d}:{minutes:02d}"
-        
         if self.entity_description.key == "target_temperature":
-            temperature = int(value)
-            humidity_value = data.get("humidityValue", 0)
+            changes = {"temperature": int(value)}
         else:  # humidity_setting
-            temperature = data.get("setTemp", 80)
-            humidity_value = int(value)
-        
-        # Start session with new settings
-        await self.coordinator.async_start_session(
-            profile=profile_name,
-            temperature=temperature,
-            session_time=session_time,
-            humidity_value=humidity_value,
-        )
+            changes = {"humidity_value": int(value)}
+        if not await self.coordinator.session_commands.async_send(**changes):
+            raise HomeAssistantError(
+                f"{self.coordinator.host} did not accept the session change"
+            )
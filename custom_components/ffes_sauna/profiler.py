@@ -0,0 +1,210 @@
+"""On-demand profiling of the FFES Sauna integration."""
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+import contextlib
+import cProfile
+import io
+import logging
+from pathlib import Path
+import pstats
+import re
+import sys
+import threading
+import time
+from types import FrameType
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    DOMAIN,
+    PROFILE_CHECK_INTERVAL,
+    PROFILE_REPORT_LINES,
+    PROFILE_SAMPLE_INTERVAL,
+)
+
+if TYPE_CHECKING:
+    from .coordinator import FFESSaunaCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+FORMAT_REPORT = "report"
+FORMAT_COLLAPSED = "collapsed"
+PROFILE_FORMATS = (FORMAT_REPORT, FORMAT_COLLAPSED)
+
+# Matches the functions of this integration in pstats output
+_INTEGRATION_FUNCTIONS = re.escape(str(Path(__file__).parent))
+
+
+def _collapse(frame: FrameType | None) -> str:
+    """Return a stack as a semicolon separated line, outermost frame first."""
+    names = []
+    while frame is not None:
+        code = frame.f_code
+        names.append(f"{Path(code.co_filename).stem}:{code.co_qualname}")
+        frame = frame.f_back
+    return ";".join(reversed(names))
+
+
+class StackSampler:
+    """Sample the stack of one thread into collapsed flame graph stacks.
+
+    A background thread records the stack of ``thread_id`` every
+    ``interval`` seconds, so the profiled thread runs unhindered between
+    samples.
+    """
+
+    def __init__(
+        self, thread_id: int, interval: float = PROFILE_SAMPLE_INTERVAL
+    ) -> None:
+        """Initialize the sampler."""
+        self._thread_id = thread_id
+        self._interval = interval
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self.stacks: Counter[str] = Counter()
+
+    def start(self) -> None:
+        """Start sampling."""
+        self._thread = threading.Thread(
+            target=self._run, name=f"{DOMAIN} stack sampler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop sampling."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _run(self) -> None:
+        """Take samples until stopped."""
+        while not self._stop.wait(self._interval):
+            frame = sys._current_frames().get(self._thread_id)  # noqa: SLF001
+            if frame is not None:
+                self.stacks[_collapse(frame)] += 1
+            del frame
+
+    def collapsed(self) -> str:
+        """Return the samples in the collapsed stack format of flamegraph.pl."""
+        return "".join(
+            f"{stack} {count}\n" for stack, count in sorted(self.stacks.items())
+        )
+
+
+def _report(profile: cProfile.Profile, title: str) -> str:
+    """Return the profile as text, integration functions first."""
+    buffer = io.StringIO()
+    buffer.write(f"{title}\n\n")
+    stats = pstats.Stats(profile, stream=buffer)
+    stats.sort_stats(pstats.SortKey.CUMULATIVE)
+    buffer.write("FFES Sauna functions by cumulative time\n")
+    stats.print_stats(_INTEGRATION_FUNCTIONS, PROFILE_REPORT_LINES)
+    buffer.write("All functions by cumulative time\n")
+    stats.print_stats(PROFILE_REPORT_LINES)
+    return buffer.getvalue()
+
+
+def _polls(coordinator: FFESSaunaCoordinator) -> int:
+    """Return the number of polls that reached the controller so far."""
+    return coordinator.stats.poll.success + coordinator.stats.poll.failure
+
+
+async def async_profile(
+    hass: HomeAssistant,
+    coordinators: list[FFESSaunaCoordinator],
+    poll_cycles: int,
+    timeout: float,
+    output_format: str,
+) -> dict[str, Any]:
+    """Profile the event loop until every coordinator finished ``poll_cycles``.
+
+    Polls keep their own schedule. The profile covers everything the event
+    loop runs meanwhile, so the work of this integration is shown next to
+    the rest of Home Assistant. The result is written to the configuration
+    directory.
+    """
+    start_polls = {coordinator.host: _polls(coordinator) for coordinator in coordinators}
+
+    def cycles() -> dict[str, int]:
+        """Return the polls of each controller since profiling started."""
+        return {
+            coordinator.host: _polls(coordinator) - start_polls[coordinator.host]
+            for coordinator in coordinators
+        }
+
+    done = asyncio.Event()
+
+    @callback
+    def check_done() -> None:
+        """Stop profiling once every controller finished its poll cycles."""
+        if min(cycles().values()) >= poll_cycles:
+            done.set()
+
+    # Successful polls notify listeners, failed ones are caught by the
+    # periodic check
+    removers = [
+        coordinator.async_add_listener(check_done) for coordinator in coordinators
+    ]
+
+    profile: cProfile.Profile | None = None
+    sampler: StackSampler | None = None
+    started = time.monotonic()
+    try:
+        if output_format == FORMAT_COLLAPSED:
+            sampler = StackSampler(threading.get_ident())
+            sampler.start()
+        else:
+            profile = cProfile.Profile()
+            try:
+                profile.enable()
+            except ValueError as err:
+                raise HomeAssistantError(f"Cannot start profiling: {err}") from err
+        try:
+            async with asyncio.timeout(timeout):
+                while not done.is_set():
+                    check_done()
+                    with contextlib.suppress(TimeoutError):
+                        await asyncio.wait_for(done.wait(), PROFILE_CHECK_INTERVAL)
+        except TimeoutError:
+            _LOGGER.warning(
+                "Profiling stopped after %s s before all poll cycles finished",
+                timeout,
+            )
+    finally:
+        if profile is not None:
+            profile.disable()
+        if sampler is not None:
+            sampler.stop()
+        for remove in removers:
+            remove()
+    duration = time.monotonic() - started
+
+    polled = cycles()
+    stamp = dt_util.utcnow().strftime("%Y%m%d%H%M%S")
+    if sampler is not None:
+        path = Path(hass.config.path(f"{DOMAIN}_profile_{stamp}.folded"))
+        content = sampler.collapsed()
+    elif profile is not None:
+        title = (
+            f"FFES Sauna profile of {', '.join(polled)}, "
+            f"{duration:.1f} s, poll cycles {polled}"
+        )
+        path = Path(hass.config.path(f"{DOMAIN}_profile_{stamp}.txt"))
+        content = await hass.async_add_executor_job(_report, profile, title)
+    else:
+        raise HomeAssistantError("Profiling produced no result")
+    await hass.async_add_executor_job(path.write_text, content)
+    _LOGGER.info("Wrote profile of %s to %s", ", ".join(polled), path)
+
+    return {
+        "path": str(path),
+        "format": output_format,
+        "duration": round(duration, 1),
+        "poll_cycles": polled,
+        "completed": done.is_set(),
+    }
@@ -6,11 +6,12 @@ import logging
 from homeassistant.components.select import SelectEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN, PROFILES, PROFILE_REVERSE_MAP
 from .coordinator import FFESSaunaCoordinator
+from .entity import FFESSaunaEntity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -26,7 +27,7 @@ async def async_setup_entry(
     async_add_entities([FFESSaunaProfileSelect(coordinator, entry)])
 
 
-class FFESSaunaProfileSelect(CoordinatorEntity, SelectEntity):
+class FFESSaunaProfileSelect(FFESSaunaEntity, SelectEntity):
     """Representation of FFES Sauna profile selector."""
 
     def __init__(
@@ -35,7 +36,7 @@ class FFESSaunaProfileSelect(CoordinatorEntity, SelectEntity):
         entry: ConfigEntry,
     ) -> None:
         """Initialize the select entity."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, ("profile",))
         self._attr_name = "Profile"
         self._attr_unique_id = f"{entry.entry_id}_profile_select"
         self._attr_icon = "mdi:format-list-bulleted"
@@ -50,8 +51,7 @@ class FFESSaunaProfileSelect(CoordinatorEntity, SelectEntity):
     @property
     def current_option(self) -> str | None:
         """Return the selected option."""
-        profile_id = self.coordinator.data.get("profile")
-        return PROFILES.get(profile_id, list(PROFILES.values())[0])
+        return self.coordinator.data.profile_name or list(PROFILES.values())[0]
 
     async def async_select_option(self, option: str) -> None:
         """Change the selected option."""
@@ -60,18 +60,7 @@ class FFESSaunaProfileSelect(CoordinatorEntity, SelectEntity):
             _LOGGER.error("Unknown profile: %s", option)
             return
         
-        # Get current settings
-        temperature = self.coordinator.data.get("setTemp", 80)
-        session_time_raw = self.coordinator.data.get("sessionTime", 130)
-        
-        # Format session time
-        hours = session_time_raw // 100
-        minutes = session_time_raw % 100
-        session_time = f"{hours:02d}:{minutes:02d}"
-        
-        # Start session with new profile
-        await self.coordinator.async_start_session(
-            profile=profile_id,
-            temperature=temperature,
-            session_time=session_time,
-        )
+        if not await self.coordinator.session_commands.async_send(profile=profile_id):
+            raise HomeAssistantError(
+                f"{self.coordinator.host} did not accept the session change"
+            )
@@ -3,7 +3,11 @@ from __future__ import annotations
 
 from collections.abc import Callable
 from dataclasses import dataclass
+from datetime import datetime, timedelta
 import logging
+import math
+import time
+from typing import Any
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -12,14 +16,31 @@ from homeassistant.components.sensor import (
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import PERCENTAGE, UnitOfTemperature
-from homeassistant.core import HomeAssistant
+from homeassistant.const import (
+    PERCENTAGE,
+    EntityCategory,
+    UnitOfInformation,
+    UnitOfTemperature,
+    UnitOfTime,
+)
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.typing import StateType
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util import dt as dt_util
 
-from .const import DOMAIN, PROFILES, STATUS_MAP
+from .const import (
+    CONF_HUMIDITY_DEADBAND,
+    CONF_HUMIDITY_MAX_SILENCE,
+    CONF_TEMPERATURE_DEADBAND,
+    CONF_TEMPERATURE_MAX_SILENCE,
+    DEFAULT_DEADBAND,
+    DEFAULT_MAX_SILENCE,
+    DOMAIN,
+)
 from .coordinator import FFESSaunaCoordinator
+from .entity import FFESSaunaEntity
+from .models import SaunaState
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -28,7 +49,10 @@ _LOGGER = logging.getLogger(__name__)
 class FFESSaunaSensorEntityDescription(SensorEntityDescription):
     """Describes FFES Sauna sensor entity."""
 
-    value_fn: Callable[[dict], StateType] | None = None
+    value_fn: Callable[[SaunaState], StateType] | None = None
+    source_keys: tuple[str, ...] | None = None
+    deadband_option: str | None = None
+    max_silence_option: str | None = None
 
 
 SENSORS: tuple[FFESSaunaSensorEntityDescription, ...] = (
@@ -38,7 +62,10 @@ SENSORS: tuple[FFESSaunaSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        value_fn=lambda data: data.get("actualTemp"),
+        source_keys=("actual_temp",),
+        value_fn=lambda state: state.actual_temp,
+        deadband_option=CONF_TEMPERATURE_DEADBAND,
+        max_silence_option=CONF_TEMPERATURE_MAX_SILENCE,
     ),
     FFESSaunaSensorEntityDescription(
         key="humidity",
@@ -46,7 +73,10 @@ SENSORS: tuple[FFESSaunaSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.HUMIDITY,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=PERCENTAGE,
-        value_fn=lambda data: data.get("humidity"),
+        source_keys=("humidity",),
+        value_fn=lambda state: state.humidity,
+        deadband_option=CONF_HUMIDITY_DEADBAND,
+        max_silence_option=CONF_HUMIDITY_MAX_SILENCE,
     ),
     FFESSaunaSensorEntityDescription(
         key="setTemp",
@@ -54,56 +84,291 @@ SENSORS: tuple[FFESSaunaSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         icon="mdi:thermometer-chevron-up",
-        value_fn=lambda data: data.get("setTemp"),
+        source_keys=("set_temp",),
+        value_fn=lambda state: state.set_temp,
     ),
     FFESSaunaSensorEntityDescription(
         key="status",
         name="Status",
         icon="mdi:sauna",
-        value_fn=lambda data: STATUS_MAP.get(data.get("controllerStatus", 0), "unknown"),
+        source_keys=("status",),
+        value_fn=lambda state: state.status_name,
     ),
     FFESSaunaSensorEntityDescription(
         key="profile",
         name="Profile",
         icon="mdi:format-list-bulleted",
-        value_fn=lambda data: PROFILES.get(data.get("profile", 0), "Unknown"),
+        source_keys=("profile",),
+        value_fn=lambda state: state.profile_name or "Unknown",
     ),
     FFESSaunaSensorEntityDescription(
         key="sessionTime",
         name="Session Time",
         icon="mdi:clock-outline",
-        value_fn=lambda data: _format_time(data.get("sessionTime", 0)),
+        source_keys=("session_label",),
+        value_fn=lambda state: state.session_label,
     ),
     FFESSaunaSensorEntityDescription(
         key="ventilationTime",
         name="Ventilation Time",
         icon="mdi:fan-clock",
-        value_fn=lambda data: _format_time(data.get("ventilationTime", 0)),
+        source_keys=("ventilation_label",),
+        value_fn=lambda state: state.ventilation_label,
     ),
     FFESSaunaSensorEntityDescription(
         key="aromaValue",
         name="Aromatherapy",
         native_unit_of_measurement=PERCENTAGE,
         icon="mdi:flower",
-        value_fn=lambda data: data.get("aromaValue"),
+        source_keys=("aroma_value",),
+        value_fn=lambda state: state.aroma_value,
     ),
     FFESSaunaSensorEntityDescription(
         key="humidityValue",
         name="Humidity Setting",
         native_unit_of_measurement=PERCENTAGE,
         icon="mdi:water-percent",
-        value_fn=lambda data: data.get("humidityValue"),
+        source_keys=("humidity_value",),
+        value_fn=lambda state: state.humidity_value,
     ),
 )
 
 
-def _format_time(time_value: int) -> str:
-    """Format time from integer to HH:MM string."""
-    if not time_value:
-        return "00:00"
-    hours = time_value // 100
-    minutes = time_value % 100
-    return f"{hours:02d}:{minutes:02d}"
+@dataclass
+class FFESSaunaCoordinatorSensorEntityDescription(SensorEntityDescription):
+    """Describes FFES Sauna sensor entity computed by the coordinator."""
+
+    value_fn: Callable[[FFESSaunaCoordinator], StateType | datetime] | None = None
+    attr_fn: Callable[[FFESSaunaCoordinator], dict[str, Any]] | None = None
+    source_keys: tuple[str, ...] | None = None
+
+
+def _minutes_to_target(coordinator: FFESSaunaCoordinator) -> int | None:
+    """Return the estimated whole minutes until the target temperature."""
+    minutes = coordinator.heating_model.minutes_to_target(coordinator.data)
+    return None if minutes is None else round(minutes)
+
+
+def _ready_at(coordinator: FFESSaunaCoordinator) -> datetime | None:
+    """Return when the target temperature is expected, to the minute."""
+    if (minutes := _minutes_to_target(coordinator)) is None:
+        return None
+    now = dt_util.utcnow().replace(second=0, microsecond=0)
+    return now + timedelta(minutes=minutes)
+
+
+ESTIMATE_SENSORS: tuple[FFESSaunaCoordinatorSensorEntityDescription, ...] = (
+    FFESSaunaCoordinatorSensorEntityDescription(
+        key="time_to_target",
+        name="Time to Target",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MINUTES,
+        icon="mdi:timer-sand",
+        source_keys=("status", "actual_temp", "set_temp", "profile"),
+        value_fn=_minutes_to_target,
+        attr_fn=lambda coord: {
+            "heating_rate": (
+                round(rate, 2)
+                if (rate := coord.heating_model.rates.get(coord.data.profile))
+                else None
+            ),
+        },
+    ),
+    FFESSaunaCoordinatorSensorEntityDescription(
+        key="ready_at",
+        name="Ready At",
+        device_class=SensorDeviceClass.TIMESTAMP,
+        icon="mdi:clock-check-outline",
+        source_keys=("status", "actual_temp", "set_temp", "profile"),
+        value_fn=_ready_at,
+    ),
+    FFESSaunaCoordinatorSensorEntityDescription(
+        key="phase_ends_at",
+        name="Phase Ends At",
+        device_class=SensorDeviceClass.TIMESTAMP,
+        icon="mdi:timer-check-outline",
+        source_keys=("status", "session_time", "ventilation_time"),
+        value_fn=lambda coord: coord.countdown.ends_at,
+    ),
+)
+
+
+def _remaining_minutes(coordinator: FFESSaunaCoordinator) -> int | None:
+    """Return the started minutes left in the current phase."""
+    remaining = coordinator.countdown.remaining(time.monotonic())
+    return None if remaining is None else math.ceil(remaining / 60)
+
+
+COUNTDOWN_SENSORS: tuple[FFESSaunaCoordinatorSensorEntityDescription, ...] = (
+    FFESSaunaCoordinatorSensorEntityDescription(
+        key="remaining_time",
+        name="Remaining Time",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MINUTES,
+        icon="mdi:timer-outline",
+        source_keys=("status", "session_time", "ventilation_time"),
+        value_fn=_remaining_minutes,
+        attr_fn=lambda coord: {
+            "phase": coord.data.status_name,
+            "observed_start": coord.countdown.observed_start,
+        },
+    ),
+)
+
+
+def _rounded(value: float | None, digits: int = 2) -> float | None:
+    """Round a statistic that may not be available yet."""
+    return None if value is None else round(value, digits)
+
+
+TELEMETRY_SENSORS: tuple[FFESSaunaCoordinatorSensorEntityDescription, ...] = (
+    FFESSaunaCoordinatorSensorEntityDescription(
+        key="temperature_rate",
+        name="Temperature Rate",
+        native_unit_of_measurement=f"{UnitOfTemperature.CELSIUS}/min",
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:thermometer-chevron-up",
+        value_fn=lambda coord: _rounded(coord.telemetry.temperature_rate),
+        attr_fn=lambda coord: {
+            "window_minutes": round(coord.telemetry.window_minutes, 1),
+            "samples": len(coord.telemetry),
+            "window_min": _rounded(coord.telemetry.temperature_min, 1),
+            "window_max": _rounded(coord.telemetry.temperature_max, 1),
+            "window_mean": _rounded(coord.telemetry.temperature_mean, 1),
+            "session_min": _rounded(coord.telemetry.session_min, 1),
+            "session_max": _rounded(coord.telemetry.session_max, 1),
+            "heating_share": _rounded(coord.telemetry.heating_share),
+        },
+    ),
+    FFESSaunaCoordinatorSensorEntityDescription(
+        key="humidity_trend",
+        name="Humidity Trend",
+        native_unit_of_measurement=f"{PERCENTAGE}/min",
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:water-percent-alert",
+        value_fn=lambda coord: _rounded(coord.telemetry.humidity_trend),
+        attr_fn=lambda coord: {
+            "window_minutes": round(coord.telemetry.window_minutes, 1),
+            "window_mean": _rounded(coord.telemetry.humidity_mean, 1),
+        },
+    ),
+)
+
+
+def _milliseconds(seconds: float | None) -> float | None:
+    """Convert seconds to rounded milliseconds."""
+    return None if seconds is None else round(seconds * 1000, 1)
+
+
+DIAGNOSTIC_SENSORS: tuple[FFESSaunaCoordinatorSensorEntityDescription, ...] = (
+    FFESSaunaCoordinatorSensorEntityDescription(
+        key="poll_latency",
+        name="Poll Latency",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda coord: _milliseconds(coord.stats.poll.latency.last),
+        attr_fn=lambda coord: {
+            "mean_ms": _milliseconds(coord.stats.poll.latency.mean),
+            "max_ms": _milliseconds(coord.stats.poll.latency.maximum),
+            "poll_lag_ms": _milliseconds(coord.poll_lag),
+        },
+    ),
+    FFESSaunaCoordinatorSensorEntityDescription(
+        key="poll_errors",
+        name="Poll Errors",
+        icon="mdi:alert-circle-outline",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda coord: coord.stats.poll.failure,
+        attr_fn=lambda coord: {
+            "timeouts": coord.stats.poll.timeout,
+            "successful": coord.stats.poll.success,
+        },
+    ),
+    FFESSaunaCoordinatorSensorEntityDescription(
+        key="command_latency",
+        name="Command Latency",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda coord: _milliseconds(coord.stats.command.latency.last),
+        attr_fn=lambda coord: {
+            "mean_ms": _milliseconds(coord.stats.command.latency.mean),
+            "max_ms": _milliseconds(coord.stats.command.latency.maximum),
+        },
+    ),
+    FFESSaunaCoordinatorSensorEntityDescription(
+        key="command_errors",
+        name="Command Errors",
+        icon="mdi:alert-circle-outline",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda coord: coord.stats.command.failure,
+        attr_fn=lambda coord: {
+            "timeouts": coord.stats.command.timeout,
+            "successful": coord.stats.command.success,
+        },
+    ),
+    FFESSaunaCoordinatorSensorEntityDescription(
+        key="command_queue_wait",
+        name="Command Queue Wait",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda coord: _milliseconds(coord.commands.wait.last),
+        attr_fn=lambda coord: {
+            "queue_depth": coord.commands.depth,
+            "mean_ms": _milliseconds(coord.commands.wait.mean),
+            "max_ms": _milliseconds(coord.commands.wait.maximum),
+        },
+    ),
+    FFESSaunaCoordinatorSensorEntityDescription(
+        key="command_confirmation",
+        name="Command Confirmation",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda coord: _milliseconds(coord.confirmation.latency.last),
+        attr_fn=lambda coord: {
+            "mean_ms": _milliseconds(coord.confirmation.latency.mean),
+            "max_ms": _milliseconds(coord.confirmation.latency.maximum),
+            "unconfirmed": coord.confirmation.unconfirmed,
+        },
+    ),
+    FFESSaunaCoordinatorSensorEntityDescription(
+        key="payload_size",
+        name="Payload Size",
+        device_class=SensorDeviceClass.DATA_SIZE,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfInformation.BYTES,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda coord: coord.stats.poll.last_payload_bytes,
+    ),
+    FFESSaunaCoordinatorSensorEntityDescription(
+        key="last_error",
+        name="Last Error",
+        device_class=SensorDeviceClass.TIMESTAMP,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda coord: coord.stats.last_error_time,
+        attr_fn=lambda coord: {
+            "poll_error": coord.stats.poll.last_error,
+            "command_error": coord.stats.command.last_error,
+        },
+    ),
+)
 
 
 async def async_setup_entry(
@@ -114,15 +379,31 @@ async def async_setup_entry(
     """Set up FFES Sauna sensors."""
     coordinator: FFESSaunaCoordinator = hass.data[DOMAIN][entry.entry_id]
     
-    entities = [
+    entities: list[SensorEntity] = [
         FFESSaunaSensor(coordinator, description, entry)
         for description in SENSORS
     ]
+    entities.extend(
+        FFESSaunaCoordinatorSensor(coordinator, description, entry)
+        for description in ESTIMATE_SENSORS
+    )
+    entities.extend(
+        FFESSaunaCoordinatorSensor(coordinator, description, entry)
+        for description in TELEMETRY_SENSORS
+    )
+    entities.extend(
+        FFESSaunaCountdownSensor(coordinator, description, entry)
+        for description in COUNTDOWN_SENSORS
+    )
+    entities.extend(
+        FFESSaunaDiagnosticSensor(coordinator, description, entry)
+        for description in DIAGNOSTIC_SENSORS
+    )
     
     async_add_entities(entities)
 
 
-class FFESSaunaSensor(CoordinatorEntity, SensorEntity):
+class FFESSaunaSensor(FFESSaunaEntity, SensorEntity):
     """Representation of a FFES Sauna sensor."""
 
     entity_description: FFESSaunaSensorEntityDescription
@@ -134,8 +415,9 @@ class FFESSaunaSensor(CoordinatorEntity, SensorEntity):
         entry: ConfigEntry,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, description.source_keys)
         self.entity_description = description
+        self._entry = entry
         self._attr_unique_id = f"{entry.entry_id}_{description.key}"
         self._attr_device_info = {
             "identifiers": {(DOMAIN, entry.entry_id)},
@@ -143,6 +425,80 @@ class FFESSaunaSensor(CoordinatorEntity, SensorEntity):
             "manufacturer": "FFES",
             "model": "Sauna Controller",
         }
+        # Last written value, availability and stale flag, and when
+        self._written: tuple[StateType, bool, bool] | None = None
+        self._written_at = 0.0
+        self._unsub_heartbeat: CALLBACK_TYPE | None = None
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Stop the pending heartbeat when removed."""
+        self._async_cancel_heartbeat()
+        await super().async_will_remove_from_hass()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the state unless the change is within the deadband."""
+        if self._within_deadband():
+            # The controller may not notify again while the value holds
+            if self._unsub_heartbeat is None:
+                self._unsub_heartbeat = async_call_later(
+                    self.hass,
+                    self._written_at + self._max_silence() - time.monotonic(),
+                    self._handle_heartbeat,
+                )
+            return
+        self._async_write_state()
+
+    @callback
+    def _async_write_state(self) -> None:
+        """Write the state and remember what was written."""
+        self._async_cancel_heartbeat()
+        self._written = (self.native_value, self.available, self.coordinator.stale)
+        self._written_at = time.monotonic()
+        super()._handle_coordinator_update()
+
+    @callback
+    def _async_cancel_heartbeat(self) -> None:
+        """Stop the pending heartbeat write."""
+        if self._unsub_heartbeat is not None:
+            self._unsub_heartbeat()
+            self._unsub_heartbeat = None
+
+    @callback
+    def _handle_heartbeat(self, _now: datetime) -> None:
+        """Write a change held back by the deadband once the silence ends."""
+        self._unsub_heartbeat = None
+        self._async_write_state()
+
+    def _max_silence(self) -> float:
+        """Return the longest time a held back change stays unwritten."""
+        return self._entry.options.get(
+            self.entity_description.max_silence_option, DEFAULT_MAX_SILENCE
+        )
+
+    def _within_deadband(self) -> bool:
+        """Return True if the new value is too close to the written one.
+
+        A change smaller than the deadband is only written once the maximum
+        silence has passed, so long-term history still gets a heartbeat.
+        """
+        description = self.entity_description
+        if description.deadband_option is None or self._written is None:
+            return False
+        options = self._entry.options
+        if not (deadband := options.get(description.deadband_option, DEFAULT_DEADBAND)):
+            return False
+        value = self.native_value
+        written, available, stale = self._written
+        if (
+            value is None
+            or written is None
+            or available != self.available
+            or stale != self.coordinator.stale
+            or abs(value - written) >= deadband
+        ):
+            return False
+        return time.monotonic() - self._written_at < self._max_silence()
 
     @property
     def native_value(self) -> StateType:
@@ -150,3 +506,102 @@ class FFESSaunaSensor(CoordinatorEntity, SensorEntity):
         if self.entity_description.value_fn:
             return self.entity_description.value_fn(self.coordinator.data)
         return None
+
+
+class FFESSaunaCoordinatorSensor(FFESSaunaEntity, SensorEntity):
+    """Representation of a FFES Sauna sensor computed by the coordinator."""
+
+    entity_description: FFESSaunaCoordinatorSensorEntityDescription
+
+    def __init__(
+        self,
+        coordinator: FFESSaunaCoordinator,
+        description: FFESSaunaCoordinatorSensorEntityDescription,
+        entry: ConfigEntry,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, description.source_keys)
+        self.entity_description = description
+        self._attr_unique_id = f"{entry.entry_id}_{description.key}"
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, entry.entry_id)},
+            "name": "FFES Sauna",
+            "manufacturer": "FFES",
+            "model": "Sauna Controller",
+        }
+
+    @property
+    def native_value(self) -> StateType | datetime:
+        """Return the state of the sensor."""
+        if self.entity_description.value_fn:
+            return self.entity_description.value_fn(self.coordinator)
+        return None
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return the state attributes, marking values derived from storage."""
+        attributes = super().extra_state_attributes
+        if self.entity_description.attr_fn:
+            attributes = {
+                **(self.entity_description.attr_fn(self.coordinator) or {}),
+                **(attributes or {}),
+            }
+        return attributes or None
+
+
+class FFESSaunaDiagnosticSensor(FFESSaunaCoordinatorSensor):
+    """Representation of a FFES Sauna request statistics sensor."""
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return the state attributes, statistics are never restored."""
+        if self.entity_description.attr_fn:
+            return self.entity_description.attr_fn(self.coordinator)
+        return None
+
+    @property
+    def available(self) -> bool:
+        """Statistics stay available while the controller is unreachable."""
+        return True
+
+
+class FFESSaunaCountdownSensor(FFESSaunaCoordinatorSensor):
+    """Representation of a FFES Sauna sensor that counts down between polls."""
+
+    _unsub_tick: CALLBACK_TYPE | None = None
+
+    async def async_added_to_hass(self) -> None:
+        """Start counting down when added."""
+        await super().async_added_to_hass()
+        self._async_schedule_tick()
+        self.async_on_remove(self._async_cancel_tick)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Re-sync the countdown with the controller data."""
+        super()._handle_coordinator_update()
+        self._async_schedule_tick()
+
+    @callback
+    def _async_schedule_tick(self) -> None:
+        """Update the state when the remaining minutes next change."""
+        self._async_cancel_tick()
+        remaining = self.coordinator.countdown.remaining(time.monotonic())
+        if remaining:
+            self._unsub_tick = async_call_later(
+                self.hass, remaining % 60 or 60, self._handle_tick
+            )
+
+    @callback
+    def _async_cancel_tick(self) -> None:
+        """Stop the pending update."""
+        if self._unsub_tick is not None:
+            self._unsub_tick()
+            self._unsub_tick = None
+
+    @callback
+    def _handle_tick(self, _now: datetime) -> None:
+        """Write the counted down state."""
+        self._unsub_tick = None
+        self.async_write_ha_state()
+        self._async_schedule_tick()
@@ -0,0 +1,355 @@
+"""Services for FFES Sauna."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import re
+import time
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.config_entries import ConfigEntry, ConfigEntryState
+from homeassistant.const import ATTR_AREA_ID
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers import device_registry as dr
+
+from .const import (
+    BROADCAST_MAX_CONCURRENT,
+    BROADCAST_TIMEOUT,
+    DOMAIN,
+    MAX_HUMIDITY,
+    MAX_TEMP,
+    MIN_HUMIDITY,
+    MIN_TEMP,
+    PROFILE_MAX_TIMEOUT,
+    PROFILE_POLL_CYCLES,
+    PROFILE_REVERSE_MAP,
+    STATUS_HEATING,
+    STATUS_MAP,
+    STATUS_STANDBY,
+)
+from .coordinator import FFESSaunaCoordinator
+from .profiler import FORMAT_REPORT, PROFILE_FORMATS, async_profile
+
+_LOGGER = logging.getLogger(__name__)
+
+SERVICE_APPLY_SETTINGS = "apply_settings"
+SERVICE_BROADCAST = "broadcast"
+SERVICE_PROFILE = "profile"
+
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+ATTR_PROFILE = "profile"
+ATTR_TEMPERATURE = "temperature"
+ATTR_HUMIDITY = "humidity"
+ATTR_AROMA = "aroma"
+ATTR_SESSION_TIME = "session_time"
+ATTR_VENTILATION_TIME = "ventilation_time"
+ATTR_STATUS = "status"
+ATTR_LIGHT = "light"
+ATTR_AUX = "aux"
+ATTR_LABEL_ID = "label_id"
+ATTR_TIMEOUT = "timeout"
+ATTR_POLL_CYCLES = "poll_cycles"
+ATTR_FORMAT = "format"
+
+STATUS_OPTIONS = {
+    "heating": STATUS_HEATING,
+    "standby": STATUS_STANDBY,
+}
+
+STATUS_REVERSE_MAP = {name: status for status, name in STATUS_MAP.items()}
+
+_HHMM = re.compile(r"^(\d{1,2}):(\d{2})(?::\d{2})?$")
+
+
+def session_time(value: Any) -> str:
+    """Validate a duration given as H:MM or HH:MM[:SS], return HH:MM."""
+    if not isinstance(value, str) or (match := _HHMM.match(value.strip())) is None:
+        raise vol.Invalid(f"Invalid time {value!r}, expected HH:MM")
+    hours, minutes = int(match.group(1)), int(match.group(2))
+    if minutes > 59:
+        raise vol.Invalid(f"Invalid time {value!r}, expected HH:MM")
+    return f"{hours:02d}:{minutes:02d}"
+
+
+SESSION_FIELDS = {
+    vol.Optional(ATTR_PROFILE): vol.In(PROFILE_REVERSE_MAP),
+    vol.Optional(ATTR_TEMPERATURE): vol.All(
+        vol.Coerce(int), vol.Range(min=MIN_TEMP, max=MAX_TEMP)
+    ),
+    vol.Optional(ATTR_HUMIDITY): vol.All(
+        vol.Coerce(int), vol.Range(min=MIN_HUMIDITY, max=MAX_HUMIDITY)
+    ),
+    vol.Optional(ATTR_AROMA): vol.All(vol.Coerce(int), vol.Range(min=0, max=100)),
+    vol.Optional(ATTR_SESSION_TIME): session_time,
+    vol.Optional(ATTR_VENTILATION_TIME): session_time,
+}
+
+APPLY_SETTINGS_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        **SESSION_FIELDS,
+        vol.Optional(ATTR_STATUS, default="heating"): vol.In(STATUS_OPTIONS),
+    }
+)
+
+BROADCAST_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Optional(ATTR_CONFIG_ENTRY_ID): vol.All(cv.ensure_list, [cv.string]),
+            vol.Optional(ATTR_AREA_ID): vol.All(cv.ensure_list, [cv.string]),
+            vol.Optional(ATTR_LABEL_ID): vol.All(cv.ensure_list, [cv.string]),
+            vol.Optional(ATTR_STATUS): vol.In(STATUS_REVERSE_MAP),
+            vol.Optional(ATTR_LIGHT): cv.boolean,
+            vol.Optional(ATTR_AUX): cv.boolean,
+            **SESSION_FIELDS,
+            vol.Optional(ATTR_TIMEOUT, default=BROADCAST_TIMEOUT): vol.All(
+                vol.Coerce(float), vol.Range(min=1, max=120)
+            ),
+        }
+    ),
+    cv.has_at_least_one_key(
+        ATTR_STATUS,
+        ATTR_LIGHT,
+        ATTR_AUX,
+        *(str(key) for key in SESSION_FIELDS),
+    ),
+)
+
+PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional(ATTR_POLL_CYCLES, default=PROFILE_POLL_CYCLES): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=1000)
+        ),
+        vol.Optional(ATTR_TIMEOUT): vol.All(
+            vol.Coerce(float), vol.Range(min=1, max=PROFILE_MAX_TIMEOUT)
+        ),
+        vol.Optional(ATTR_FORMAT, default=FORMAT_REPORT): vol.In(PROFILE_FORMATS),
+    }
+)
+
+
+@callback
+def async_get_coordinator(hass: HomeAssistant, entry_id: str) -> FFESSaunaCoordinator:
+    """Return the coordinator of a loaded FFES Sauna config entry."""
+    entry = hass.config_entries.async_get_entry(entry_id)
+    if entry is None or entry.domain != DOMAIN:
+        raise ServiceValidationError(f"Unknown FFES Sauna config entry: {entry_id}")
+    if entry.state is not ConfigEntryState.LOADED:
+        raise ServiceValidationError(f"{entry.title} is not loaded")
+    return hass.data[DOMAIN][entry_id]
+
+
+def _session_changes(data: dict[str, Any]) -> dict[str, Any]:
+    """Map service fields to start_session arguments."""
+    changes: dict[str, Any] = {}
+    if ATTR_PROFILE in data:
+        changes["profile"] = PROFILE_REVERSE_MAP[data[ATTR_PROFILE]]
+    if ATTR_TEMPERATURE in data:
+        changes["temperature"] = data[ATTR_TEMPERATURE]
+    if ATTR_HUMIDITY in data:
+        changes["humidity_value"] = data[ATTR_HUMIDITY]
+    if ATTR_AROMA in data:
+        changes["aroma_value"] = data[ATTR_AROMA]
+    if ATTR_SESSION_TIME in data:
+        changes["session_time"] = data[ATTR_SESSION_TIME]
+    if ATTR_VENTILATION_TIME in data:
+        changes["ventilation_time"] = data[ATTR_VENTILATION_TIME]
+    return changes
+
+
+async def _async_apply_settings(
+    hass: HomeAssistant, call: ServiceCall
+) -> ServiceResponse:
+    """Set a whole session with a single start_session request.
+
+    The response holds the settings the controller accepted; polls confirm
+    them afterwards.
+    """
+    coordinator = async_get_coordinator(hass, call.data[ATTR_CONFIG_ENTRY_ID])
+
+    # Settings left out keep their current values, and changes still waiting
+    # in the entity debounce window go out with this request
+    success = await coordinator.session_commands.async_apply(
+        **_session_changes(call.data)
+    )
+    status = STATUS_OPTIONS[call.data[ATTR_STATUS]]
+    if success and status == STATUS_STANDBY:
+        # start_session always starts heating, holding needs a second request
+        success = await coordinator.async_set_status(STATUS_STANDBY)
+    if not success:
+        raise HomeAssistantError(f"{coordinator.host} did not accept the settings")
+
+    data = coordinator.data
+    return {
+        "status": data.status_name if data else None,
+        "profile": data.profile_name if data else None,
+        "temperature": data.set_temp if data else None,
+        "session_time": data.session_label if data else None,
+        "ventilation_time": data.ventilation_label if data else None,
+    }
+
+
+@callback
+def _async_broadcast_targets(
+    hass: HomeAssistant, data: dict[str, Any]
+) -> list[ConfigEntry]:
+    """Return the FFES Sauna config entries a broadcast is aimed at.
+
+    Without any target every FFES Sauna config entry is included.
+    """
+    entries = hass.config_entries.async_entries(DOMAIN)
+    entry_ids = set(data.get(ATTR_CONFIG_ENTRY_ID, ()))
+    areas = set(data.get(ATTR_AREA_ID, ()))
+    labels = set(data.get(ATTR_LABEL_ID, ()))
+    if not (entry_ids or areas or labels):
+        return entries
+
+    if unknown := entry_ids - {entry.entry_id for entry in entries}:
+        raise ServiceValidationError(
+            f"Unknown FFES Sauna config entries: {', '.join(sorted(unknown))}"
+        )
+    if areas or labels:
+        device_registry = dr.async_get(hass)
+        for entry in entries:
+            for device in dr.async_entries_for_config_entry(
+                device_registry, entry.entry_id
+            ):
+                if device.area_id in areas or device.labels & labels:
+                    entry_ids.add(entry.entry_id)
+    return [entry for entry in entries if entry.entry_id in entry_ids]
+
+
+async def _async_broadcast_commands(
+    coordinator: FFESSaunaCoordinator, data: dict[str, Any]
+) -> bool:
+    """Send the broadcast commands to one controller, stopping at a failure."""
+    status = data.get(ATTR_STATUS)
+    success = True
+    if changes := _session_changes(data):
+        success = await coordinator.session_commands.async_apply(**changes)
+        if status == STATUS_MAP[STATUS_HEATING]:
+            # start_session already started heating
+            status = None
+    if success and status is not None:
+        success = await coordinator.async_set_status(STATUS_REVERSE_MAP[status])
+    if success and ATTR_LIGHT in data:
+        success = await coordinator.async_set_light(data[ATTR_LIGHT])
+    if success and ATTR_AUX in data:
+        success = await coordinator.async_set_aux(data[ATTR_AUX])
+    return success
+
+
+async def _async_broadcast(hass: HomeAssistant, call: ServiceCall) -> ServiceResponse:
+    """Send the same commands to many controllers in parallel."""
+    entries = _async_broadcast_targets(hass, call.data)
+    timeout = call.data[ATTR_TIMEOUT]
+    semaphore = asyncio.Semaphore(BROADCAST_MAX_CONCURRENT)
+
+    async def async_send(entry: ConfigEntry) -> dict[str, Any]:
+        result: dict[str, Any] = {"title": entry.title, "success": False}
+        if entry.state is not ConfigEntryState.LOADED:
+            result["error"] = "not loaded"
+            return result
+        coordinator: FFESSaunaCoordinator = hass.data[DOMAIN][entry.entry_id]
+        result["host"] = coordinator.host
+        async with semaphore:
+            started = time.monotonic()
+            try:
+                async with asyncio.timeout(timeout):
+                    result["success"] = await _async_broadcast_commands(
+                        coordinator, call.data
+                    )
+                if not result["success"]:
+                    result["error"] = "command failed"
+            except TimeoutError:
+                # The command stays queued and may still reach the controller
+                result["error"] = "timeout"
+            result["latency"] = round(time.monotonic() - started, 3)
+        return result
+
+    results = await asyncio.gather(*(async_send(entry) for entry in entries))
+    succeeded = sum(result["success"] for result in results)
+    _LOGGER.debug(
+        "Broadcast to %s controllers, %s succeeded", len(results), succeeded
+    )
+    return {
+        "succeeded": succeeded,
+        "failed": len(results) - succeeded,
+        "results": {
+            entry.entry_id: result for entry, result in zip(entries, results)
+        },
+    }
+
+
+async def _async_profile(hass: HomeAssistant, call: ServiceCall) -> ServiceResponse:
+    """Profile the event loop for a number of poll cycles of some saunas."""
+    if ATTR_CONFIG_ENTRY_ID in call.data:
+        coordinators = [
+            async_get_coordinator(hass, entry_id)
+            for entry_id in call.data[ATTR_CONFIG_ENTRY_ID]
+        ]
+    else:
+        coordinators = list(hass.data.get(DOMAIN, {}).values())
+    if not coordinators:
+        raise ServiceValidationError("No FFES Sauna is loaded")
+
+    poll_cycles = call.data[ATTR_POLL_CYCLES]
+    if (timeout := call.data.get(ATTR_TIMEOUT)) is None:
+        # Leave the slowest sauna room for its cycles plus the one under way
+        interval = max(
+            coordinator.poll_interval.total_seconds() for coordinator in coordinators
+        )
+        timeout = min((poll_cycles + 1) * interval, PROFILE_MAX_TIMEOUT)
+    return await async_profile(
+        hass, coordinators, poll_cycles, timeout, call.data[ATTR_FORMAT]
+    )
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the FFES Sauna services."""
+
+    async def async_apply_settings(call: ServiceCall) -> ServiceResponse:
+        """Handle the apply_settings service."""
+        return await _async_apply_settings(hass, call)
+
+    async def async_broadcast(call: ServiceCall) -> ServiceResponse:
+        """Handle the broadcast service."""
+        return await _async_broadcast(hass, call)
+
+    async def async_profile_service(call: ServiceCall) -> ServiceResponse:
+        """Handle the profile service."""
+        return await _async_profile(hass, call)
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_APPLY_SETTINGS,
+        async_apply_settings,
+        schema=APPLY_SETTINGS_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_BROADCAST,
+        async_broadcast,
+        schema=BROADCAST_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_PROFILE,
+        async_profile_service,
+        schema=PROFILE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
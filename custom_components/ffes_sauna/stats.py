@@ -0,0 +1,114 @@
+"""Request statistics for FFES Sauna controllers."""
+from __future__ import annotations
+
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+
+from homeassistant.util import dt as dt_util
+
+# Upper bounds of the latency histogram buckets (seconds)
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+@dataclass
+class LatencyHistogram:
+    """Fixed-bucket latency histogram."""
+
+    counts: list[int] = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS) + 1))
+    count: int = 0
+    total: float = 0.0
+    maximum: float = 0.0
+    last: float | None = None
+
+    def add(self, seconds: float) -> None:
+        """Record one sample."""
+        self.counts[bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        self.maximum = max(self.maximum, seconds)
+        self.last = seconds
+
+    @property
+    def mean(self) -> float | None:
+        """Return the mean latency."""
+        return self.total / self.count if self.count else None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the histogram for diagnostics."""
+        labels = [f"<={bound}" for bound in LATENCY_BUCKETS] + [f">{LATENCY_BUCKETS[-1]}"]
+        return {
+            "buckets": dict(zip(labels, self.counts)),
+            "count": self.count,
+            "mean": self.mean,
+            "max": self.maximum,
+            "last": self.last,
+        }
+
+
+@dataclass
+class RequestStats:
+    """Outcome counters for one kind of request."""
+
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+    success: int = 0
+    failure: int = 0
+    timeout: int = 0
+    payload_bytes: int = 0
+    last_payload_bytes: int | None = None
+    last_error: str | None = None
+    last_error_time: datetime | None = None
+
+    def record_success(self, seconds: float, size: int) -> None:
+        """Record a successful request."""
+        self.latency.add(seconds)
+        self.success += 1
+        self.payload_bytes += size
+        self.last_payload_bytes = size
+
+    def record_failure(self, seconds: float, error: str, timeout: bool = False) -> None:
+        """Record a failed request."""
+        self.latency.add(seconds)
+        self.failure += 1
+        if timeout:
+            self.timeout += 1
+        self.last_error = error
+        self.last_error_time = dt_util.utcnow()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the counters for diagnostics."""
+        return {
+            "latency": self.latency.as_dict(),
+            "success": self.success,
+            "failure": self.failure,
+            "timeout": self.timeout,
+            "payload_bytes": self.payload_bytes,
+            "last_payload_bytes": self.last_payload_bytes,
+            "last_error": self.last_error,
+            "last_error_time": (
+                self.last_error_time.isoformat() if self.last_error_time else None
+            ),
+        }
+
+
+@dataclass
+class FFESSaunaStats:
+    """Statistics for polls and commands of one controller."""
+
+    poll: RequestStats = field(default_factory=RequestStats)
+    command: RequestStats = field(default_factory=RequestStats)
+
+    @property
+    def last_error_time(self) -> datetime | None:
+        """Return when the latest poll or command failed."""
+        times = [
+            stats.last_error_time
+            for stats in (self.poll, self.command)
+            if stats.last_error_time is not None
+        ]
+        return max(times, default=None)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return all statistics for diagnostics."""
+        return {"poll": self.poll.as_dict(), "command": self.command.as_dict()}
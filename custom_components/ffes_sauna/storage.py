@@ -0,0 +1,94 @@
+"""Persistent storage for FFES Sauna."""
+from __future__ import annotations
+
+from datetime import datetime
+import logging
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN, STORAGE_SAVE_DELAY, STORAGE_VERSION
+from .models import InvalidPayload, SaunaState
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class FFESSaunaStore:
+    """Data of one config entry kept across restarts.
+
+    Holds the last known controller state and the learned heating rates.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the store."""
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}"
+        )
+        self._data: dict[str, Any] = {}
+        self._save_pending = False
+
+    async def async_load(self) -> None:
+        """Load the stored data."""
+        self._data = await self._store.async_load() or {}
+
+    @property
+    def state(self) -> tuple[SaunaState, datetime] | None:
+        """Return the stored controller state and when it was received."""
+        if (stored := self._data.get("state")) is None:
+            return None
+        try:
+            state = SaunaState.from_payload(stored["payload"])
+            saved_at = dt_util.parse_datetime(stored["saved_at"])
+        except (InvalidPayload, KeyError, TypeError) as err:
+            _LOGGER.debug("Ignoring invalid stored state: %s", err)
+            return None
+        if saved_at is None:
+            return None
+        return state, saved_at
+
+    @callback
+    def async_save_state(self, state: SaunaState) -> None:
+        """Remember the latest controller state."""
+        self._data["state"] = {
+            "payload": state.as_payload(),
+            "saved_at": dt_util.utcnow().isoformat(),
+        }
+        self._async_schedule_save()
+
+    @property
+    def heating_rates(self) -> dict[int, float]:
+        """Return the learned heating rate of each profile."""
+        try:
+            return {
+                int(profile): float(rate)
+                for profile, rate in self._data.get("heating_rates", {}).items()
+            }
+        except (AttributeError, TypeError, ValueError):
+            return {}
+
+    @callback
+    def async_save_heating_rates(self, rates: dict[int, float]) -> None:
+        """Remember the learned heating rates."""
+        self._data["heating_rates"] = {
+            str(profile): rate for profile, rate in rates.items()
+        }
+        self._async_schedule_save()
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        """Write the data after a delay, at most once per delay."""
+        if not self._save_pending:
+            self._save_pending = True
+            self._store.async_delay_save(self._data_to_save, STORAGE_SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data to write."""
+        self._save_pending = False
+        return self._data
+
+    async def async_remove(self) -> None:
+        """Delete the stored data."""
+        await self._store.async_remove()
@@ -10,10 +10,11 @@ from homeassistant.components.switch import SwitchEntity, SwitchEntityDescriptio
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
 from .coordinator import FFESSaunaCoordinator
+from .entity import FFESSaunaEntity
+from .models import SaunaState
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -22,7 +23,8 @@ _LOGGER = logging.getLogger(__name__)
 class FFESSaunaSwitchEntityDescription(SwitchEntityDescription):
     """Describes FFES Sauna switch entity."""
 
-    is_on_fn: Callable[[dict], bool] | None = None
+    is_on_fn: Callable[[SaunaState], bool] | None = None
+    source_keys: tuple[str, ...] | None = None
     turn_on_fn: Callable[[FFESSaunaCoordinator], Any] | None = None
     turn_off_fn: Callable[[FFESSaunaCoordinator], Any] | None = None
 
@@ -32,7 +34,8 @@ SWITCHES: tuple[FFESSaunaSwitchEntityDescription, ...] = (
         key="light",
         name="Light",
         icon="mdi:lightbulb",
-        is_on_fn=lambda data: data.get("light", False),
+        source_keys=("light",),
+        is_on_fn=lambda state: state.light,
         turn_on_fn=lambda coord: coord.async_set_light(True),
         turn_off_fn=lambda coord: coord.async_set_light(False),
     ),
@@ -40,7 +43,8 @@ SWITCHES: tuple[FFESSaunaSwitchEntityDescription, ...] = (
         key="aux",
         name="AUX",
         icon="mdi:power-plug",
-        is_on_fn=lambda data: data.get("aux", False),
+        source_keys=("aux",),
+        is_on_fn=lambda state: state.aux,
         turn_on_fn=lambda coord: coord.async_set_aux(True),
         turn_off_fn=lambda coord: coord.async_set_aux(False),
     ),
@@ -63,7 +67,7 @@ async def async_setup_entry(
     async_add_entities(entities)
 
 
-class FFESSaunaSwitch(CoordinatorEntity, SwitchEntity):
+class FFESSaunaSwitch(FFESSaunaEntity, SwitchEntity):
     """Representation of a FFES Sauna switch."""
 
     entity_description: FFESSaunaSwitchEntityDescription
@@ -75,7 +79,7 @@ class FFESSaunaSwitch(CoordinatorEntity, SwitchEntity):
         entry: ConfigEntry,
     ) -> None:
         """Initialize the switch."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, description.source_keys)
         self.entity_description = description
         self._attr_unique_id = f"{entry.entry_id}_{description.key}"
         self._attr_device_info = {
@@ -0,0 +1,237 @@
+"""In-memory telemetry of recent FFES Sauna readings."""
+from __future__ import annotations
+
+from array import array
+from collections import deque
+import math
+
+from .const import STATUS_HEATING, TELEMETRY_BUFFER_SIZE
+from .models import SaunaState
+
+
+class _RollingExtreme:
+    """Minimum or maximum over a sliding window, amortized O(1) per sample."""
+
+    def __init__(self, maximum: bool) -> None:
+        """Initialize the tracker."""
+        self._maximum = maximum
+        self._values: deque[tuple[int, float]] = deque()
+
+    def add(self, sequence: int, value: float) -> None:
+        """Add a sample."""
+        values = self._values
+        if self._maximum:
+            while values and values[-1][1] <= value:
+                values.pop()
+        else:
+            while values and values[-1][1] >= value:
+                values.pop()
+        values.append((sequence, value))
+
+    def evict(self, sequence: int) -> None:
+        """Forget samples older than ``sequence``."""
+        while self._values and self._values[0][0] < sequence:
+            self._values.popleft()
+
+    @property
+    def value(self) -> float | None:
+        """Return the extreme of the window."""
+        return self._values[0][1] if self._values else None
+
+
+class _RollingTrend:
+    """Mean and least-squares slope over a sliding window of (t, y) samples."""
+
+    def __init__(self) -> None:
+        """Initialize the sums."""
+        self.count = 0
+        self._sum_t = 0.0
+        self._sum_tt = 0.0
+        self._sum_y = 0.0
+        self._sum_ty = 0.0
+
+    def reset(self) -> None:
+        """Clear the sums."""
+        self.__init__()
+
+    def add(self, t: float, y: float) -> None:
+        """Add a sample."""
+        self.count += 1
+        self._sum_t += t
+        self._sum_tt += t * t
+        self._sum_y += y
+        self._sum_ty += t * y
+
+    def remove(self, t: float, y: float) -> None:
+        """Remove a sample that left the window."""
+        self.count -= 1
+        self._sum_t -= t
+        self._sum_tt -= t * t
+        self._sum_y -= y
+        self._sum_ty -= t * y
+
+    @property
+    def mean(self) -> float | None:
+        """Return the mean of y."""
+        return self._sum_y / self.count if self.count else None
+
+    @property
+    def slope(self) -> float | None:
+        """Return the change of y per unit of t."""
+        if self.count < 2:
+            return None
+        denominator = self.count * self._sum_tt - self._sum_t * self._sum_t
+        if denominator <= 0:
+            return None
+        return (self.count * self._sum_ty - self._sum_t * self._sum_y) / denominator
+
+
+class TelemetryBuffer:
+    """Fixed-size ring buffer of recent samples with rolling statistics.
+
+    Samples are kept in preallocated arrays, so memory does not grow, and all
+    statistics are updated incrementally as samples enter and leave the
+    window. Times are stored relative to an origin to keep the sums well
+    conditioned. Once per lap of the buffer the origin moves to the oldest
+    sample and the sums are rebuilt, so neither the times nor rounding errors
+    grow however long the buffer runs.
+    """
+
+    def __init__(self, size: int = TELEMETRY_BUFFER_SIZE) -> None:
+        """Initialize the buffer."""
+        self.size = size
+        self._time = array("d", bytes(8 * size))
+        self._temp = array("d", bytes(8 * size))
+        self._humidity = array("d", bytes(8 * size))
+        # Payloads with status codes outside 16 bits are rejected on decode
+        self._status = array("h", bytes(2 * size))
+        self._origin: float | None = None
+        self._next = 0
+        self._count = 0
+        self._sequence = 0
+        self._temp_trend = _RollingTrend()
+        self._humidity_trend = _RollingTrend()
+        self._temp_min = _RollingExtreme(maximum=False)
+        self._temp_max = _RollingExtreme(maximum=True)
+        self._heating = 0
+        self._last_status: int | None = None
+        self.session_min: float | None = None
+        self.session_max: float | None = None
+
+    def __len__(self) -> int:
+        """Return the number of samples in the window."""
+        return self._count
+
+    def add(self, now: float, state: SaunaState) -> None:
+        """Add one reading taken at monotonic time ``now``."""
+        if state.actual_temp is None:
+            return
+        if self._origin is None:
+            self._origin = now
+
+        if self._count == self.size:
+            self._evict(self._next)
+        else:
+            self._count += 1
+
+        t = (now - self._origin) / 60
+        temp = float(state.actual_temp)
+        humidity = math.nan if state.humidity is None else float(state.humidity)
+        index = self._next
+        self._time[index] = t
+        self._temp[index] = temp
+        self._humidity[index] = humidity
+        self._status[index] = state.status
+
+        self._temp_trend.add(t, temp)
+        if not math.isnan(humidity):
+            self._humidity_trend.add(t, humidity)
+        self._sequence += 1
+        self._temp_min.add(self._sequence, temp)
+        self._temp_max.add(self._sequence, temp)
+        self._temp_min.evict(self._sequence - self._count + 1)
+        self._temp_max.evict(self._sequence - self._count + 1)
+        if state.status == STATUS_HEATING:
+            self._heating += 1
+
+        self._track_session(state.status, temp)
+        self._next = (index + 1) % self.size
+        if self._next == 0:
+            self._rebuild_sums()
+
+    def _evict(self, index: int) -> None:
+        """Remove the oldest sample from the running sums."""
+        t = self._time[index]
+        self._temp_trend.remove(t, self._temp[index])
+        if not math.isnan(humidity := self._humidity[index]):
+            self._humidity_trend.remove(t, humidity)
+        if self._status[index] == STATUS_HEATING:
+            self._heating -= 1
+
+    def _rebuild_sums(self) -> None:
+        """Re-base the stored times on the oldest sample, then recompute sums."""
+        shift = self._time[self._next if self._count == self.size else 0]
+        for index in range(self._count):
+            self._time[index] -= shift
+        self._origin += shift * 60
+
+        self._temp_trend.reset()
+        self._humidity_trend.reset()
+        for index in range(self._count):
+            t = self._time[index]
+            self._temp_trend.add(t, self._temp[index])
+            if not math.isnan(humidity := self._humidity[index]):
+                self._humidity_trend.add(t, humidity)
+
+    def _track_session(self, status: int, temp: float) -> None:
+        """Track the temperature range since heating last started."""
+        if status == STATUS_HEATING and self._last_status != STATUS_HEATING:
+            self.session_min = self.session_max = temp
+        elif status == STATUS_HEATING:
+            self.session_min = min(temp, self.session_min)
+            self.session_max = max(temp, self.session_max)
+        self._last_status = status
+
+    @property
+    def temperature_rate(self) -> float | None:
+        """Return the temperature change in degrees per minute."""
+        return self._temp_trend.slope
+
+    @property
+    def humidity_trend(self) -> float | None:
+        """Return the humidity change in percent per minute."""
+        return self._humidity_trend.slope
+
+    @property
+    def temperature_mean(self) -> float | None:
+        """Return the mean temperature of the window."""
+        return self._temp_trend.mean
+
+    @property
+    def humidity_mean(self) -> float | None:
+        """Return the mean humidity of the window."""
+        return self._humidity_trend.mean
+
+    @property
+    def temperature_min(self) -> float | None:
+        """Return the lowest temperature of the window."""
+        return self._temp_min.value
+
+    @property
+    def temperature_max(self) -> float | None:
+        """Return the highest temperature of the window."""
+        return self._temp_max.value
+
+    @property
+    def heating_share(self) -> float | None:
+        """Return the fraction of samples in the window taken while heating."""
+        return self._heating / self._count if self._count else None
+
+    @property
+    def window_minutes(self) -> float:
+        """Return the time covered by the window."""
+        if self._count < 2:
+            return 0.0
+        newest = self._time[(self._next - 1) % self.size]
+        oldest = self._time[self._next % self.size if self._count == self.size else 0]
+        return newest - oldest
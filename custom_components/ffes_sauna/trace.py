@@ -0,0 +1,178 @@
+"""Traffic traces of FFES Sauna controllers."""
+from __future__ import annotations
+
+import base64
+from collections.abc import Iterator
+import gzip
+import json
+import logging
+import os
+from pathlib import Path
+import time
+from typing import Any
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.util import slugify
+
+from .const import (
+    DOMAIN,
+    TRACE_BACKUP_COUNT,
+    TRACE_FLUSH_DELAY,
+    TRACE_FLUSH_RECORDS,
+    TRACE_MAX_BYTES,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+TRACE_DIRECTORY = f"{DOMAIN}_traces"
+
+
+def encode_body(body: bytes) -> dict[str, str]:
+    """Return a response body as a JSON field, base64 if it is not UTF-8."""
+    try:
+        return {"body": body.decode()}
+    except UnicodeDecodeError:
+        return {"body_b64": base64.b64encode(body).decode()}
+
+
+def decode_body(record: dict[str, Any]) -> bytes:
+    """Return the raw response body of a trace record."""
+    if "body_b64" in record:
+        return base64.b64decode(record["body_b64"])
+    return record.get("body", "").encode()
+
+
+def read_trace(path: str | Path) -> Iterator[dict[str, Any]]:
+    """Yield the records of a trace file, compressed or not."""
+    with open(path, "rb") as file:
+        compressed = file.read(2) == b"\x1f\x8b"
+    opener = gzip.open if compressed else open
+    with opener(path, "rt", encoding="utf-8") as file:
+        for line in file:
+            if line.strip():
+                yield json.loads(line)
+
+
+class TraceRecorder:
+    """Stream the exchanges with one controller to a gzip JSON-lines file.
+
+    Each line holds one request with its wall clock time, latency, status and
+    raw response body, or the error it failed with. Records are buffered and
+    written in the executor within ``TRACE_FLUSH_DELAY`` seconds, and when
+    Home Assistant stops; the file is rotated once it grows past
+    ``max_bytes``, keeping ``backup_count`` older files.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        host: str,
+        max_bytes: int = TRACE_MAX_BYTES,
+        backup_count: int = TRACE_BACKUP_COUNT,
+    ) -> None:
+        """Initialize the recorder."""
+        self.hass = hass
+        self.host = host
+        self._name = slugify(host)
+        self.path = self._file(0)
+        self._max_bytes = max_bytes
+        self._backup_count = backup_count
+        self._buffer: list[str] = []
+        self._unsub_flush: CALLBACK_TYPE | None = None
+        # Stopping Home Assistant does not unload config entries
+        self._unsub_stop: CALLBACK_TYPE | None = hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_STOP, self._async_handle_stop
+        )
+
+    def _file(self, index: int) -> Path:
+        """Return the path of the current trace file or of a rotated one."""
+        suffix = f".{index}" if index else ""
+        return Path(
+            self.hass.config.path(TRACE_DIRECTORY, f"{self._name}{suffix}.jsonl.gz")
+        )
+
+    @callback
+    def async_record(
+        self,
+        method: str,
+        path: str,
+        latency: float,
+        form: dict[str, str] | None = None,
+        status: int | None = None,
+        body: bytes | None = None,
+        error: str | None = None,
+    ) -> None:
+        """Add one exchange to the trace."""
+        record: dict[str, Any] = {
+            "time": round(time.time(), 3),
+            "host": self.host,
+            "method": method,
+            "path": path,
+            "latency": round(latency, 4),
+        }
+        if form is not None:
+            record["form"] = form
+        if status is not None:
+            record["status"] = status
+        if body is not None:
+            record.update(encode_body(body))
+        if error is not None:
+            record["error"] = error
+        self._buffer.append(json.dumps(record, separators=(",", ":")))
+
+        if len(self._buffer) >= TRACE_FLUSH_RECORDS:
+            self.hass.async_create_task(self.async_flush())
+        elif self._unsub_flush is None:
+            self._unsub_flush = async_call_later(
+                self.hass, TRACE_FLUSH_DELAY, self._handle_flush_timer
+            )
+
+    @callback
+    def _handle_flush_timer(self, _now: Any) -> None:
+        """Write buffered records after the flush delay."""
+        self._unsub_flush = None
+        self.hass.async_create_task(self.async_flush())
+
+    async def _async_handle_stop(self, _event: Event) -> None:
+        """Write buffered records before Home Assistant stops."""
+        self._unsub_stop = None
+        await self.async_flush()
+
+    async def async_close(self) -> None:
+        """Write buffered records and stop recording."""
+        if self._unsub_stop is not None:
+            self._unsub_stop()
+            self._unsub_stop = None
+        await self.async_flush()
+
+    async def async_flush(self) -> None:
+        """Write the buffered records."""
+        if self._unsub_flush is not None:
+            self._unsub_flush()
+            self._unsub_flush = None
+        if not self._buffer:
+            return
+        lines, self._buffer = self._buffer, []
+        try:
+            await self.hass.async_add_executor_job(self._write, lines)
+        except OSError as err:
+            _LOGGER.warning("Cannot write trace of %s: %s", self.host, err)
+
+    def _write(self, lines: list[str]) -> None:
+        """Append records to the trace file, rotating it when full."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if self.path.exists() and self.path.stat().st_size >= self._max_bytes:
+            self._rotate()
+        # Every flush adds a gzip member, which gzip readers concatenate
+        with gzip.open(self.path, "at", encoding="utf-8") as file:
+            file.write("\n".join(lines) + "\n")
+
+    def _rotate(self) -> None:
+        """Shift older trace files by one and start a new one."""
+        if (oldest := self._file(self._backup_count)).exists():
+            oldest.unlink()
+        for index in range(self._backup_count - 1, -1, -1):
+            if (source := self._file(index)).exists():
+                os.replace(source, self._file(index + 1))
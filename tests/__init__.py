@@ -0,0 +1 @@
+"""Tests for the FFES Sauna integration."""
@@ -0,0 +1,18 @@
+"""Helpers for FFES Sauna tests."""
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+from homeassistant.core import HomeAssistant
+
+
+@asynccontextmanager
+async def async_test_home_assistant(config_dir: Path) -> AsyncIterator[HomeAssistant]:
+    """Run a bare Home Assistant core in the current event loop."""
+    hass = HomeAssistant(str(config_dir))
+    try:
+        yield hass
+    finally:
+        await hass.async_stop(force=True)
@@ -0,0 +1,26 @@
+"""Fixtures for FFES Sauna tests.
+
+The tests use a bare Home Assistant core and need no test plugin;
+coroutine tests run in their own event loop.
+"""
+from __future__ import annotations
+
+import asyncio
+import inspect
+
+# Import the core first, the helpers import it partially otherwise
+import homeassistant.core  # noqa: F401
+import pytest
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_pyfunc_call(pyfuncitem: pytest.Function) -> bool | None:
+    """Run coroutine test functions to completion."""
+    if not inspect.iscoroutinefunction(pyfuncitem.obj):
+        return None
+    arguments = {
+        name: pyfuncitem.funcargs[name]
+        for name in pyfuncitem._fixtureinfo.argnames  # pylint: disable=protected-access
+    }
+    asyncio.run(pyfuncitem.obj(**arguments))
+    return True
@@ -0,0 +1,95 @@
+"""Tests for the circuit breaker."""
+from __future__ import annotations
+
+import pytest
+
+from custom_components.ffes_sauna import breaker as breaker_module
+from custom_components.ffes_sauna.breaker import (
+    STATE_CLOSED,
+    STATE_HALF_OPEN,
+    STATE_OPEN,
+    CircuitBreaker,
+)
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    """Control the monotonic clock the breaker reads."""
+    now = [1000.0]
+    monkeypatch.setattr(breaker_module.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_opens_after_threshold(clock: list[float]) -> None:
+    """Consecutive failures open the circuit at the threshold."""
+    breaker = CircuitBreaker("host", failure_threshold=3, base_backoff=10)
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.state == STATE_CLOSED
+    assert breaker.allow_request()
+
+    breaker.record_failure()
+    assert breaker.state == STATE_OPEN
+    assert not breaker.allow_request()
+    assert breaker.retry_in == 10
+
+
+def test_success_resets_failures(clock: list[float]) -> None:
+    """A success between failures starts the count over."""
+    breaker = CircuitBreaker("host", failure_threshold=2)
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state == STATE_CLOSED
+    assert breaker.failures == 1
+
+
+def test_probe_closes_circuit(clock: list[float]) -> None:
+    """After the backoff one probe goes out and its success closes the circuit."""
+    breaker = CircuitBreaker("host", failure_threshold=1, base_backoff=10)
+    breaker.record_failure()
+
+    clock[0] += 10
+    assert breaker.allow_request()
+    assert breaker.state == STATE_HALF_OPEN
+    assert breaker.probing
+    # Only the one probe is let through
+    assert not breaker.allow_request()
+
+    breaker.record_success()
+    assert breaker.state == STATE_CLOSED
+    assert breaker.failures == 0
+    assert breaker.allow_request()
+
+
+def test_failed_probe_doubles_backoff(clock: list[float]) -> None:
+    """A failed probe opens the circuit again with twice the backoff, capped."""
+    breaker = CircuitBreaker("host", failure_threshold=1, base_backoff=10, max_backoff=30)
+    breaker.record_failure()
+
+    for backoff in (20, 30, 30):
+        clock[0] += breaker.backoff
+        assert breaker.allow_request()
+        breaker.record_failure()
+        assert breaker.state == STATE_OPEN
+        assert breaker.backoff == backoff
+        assert breaker.retry_in == backoff
+
+    clock[0] += breaker.backoff
+    assert breaker.allow_request()
+    breaker.record_success()
+    assert breaker.backoff == 10
+
+
+def test_lost_probe_is_replaced(clock: list[float]) -> None:
+    """A probe that never reports back is replaced after the backoff."""
+    breaker = CircuitBreaker("host", failure_threshold=1, base_backoff=10)
+    breaker.record_failure()
+    clock[0] += 10
+    assert breaker.allow_request()
+
+    clock[0] += 9
+    assert not breaker.allow_request()
+    clock[0] += 1
+    assert breaker.allow_request()
+    assert breaker.state == STATE_HALF_OPEN
@@ -0,0 +1,330 @@
+"""Tests for the command helpers."""
+from __future__ import annotations
+
+import asyncio
+from dataclasses import replace
+from pathlib import Path
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.ffes_sauna.command import (
+    CommandConfirmation,
+    CommandQueue,
+    SessionCommandAggregator,
+)
+from custom_components.ffes_sauna.const import (
+    ACTION_START_SESSION,
+    PRIORITY_STOP,
+    STATUS_HEATING,
+    STATUS_OFF,
+)
+from custom_components.ffes_sauna.models import SaunaState
+
+from .common import async_test_home_assistant
+
+STATE = SaunaState(
+    status=STATUS_OFF,
+    actual_temp=20.0,
+    set_temp=80,
+    profile=1,
+    session_time=100,
+    ventilation_time=10,
+    aroma_value=0,
+    humidity_value=0,
+)
+
+
+class FakeCoordinator:
+    """The parts of the coordinator the command helpers use."""
+
+    def __init__(self, data: SaunaState = STATE, accept: bool = True) -> None:
+        """Initialize the fake."""
+        self.host = "http://sauna"
+        self.name = "sauna"
+        self.data = data
+        self.fleet = None
+        self.last_update_success = True
+        self.accept = accept
+        self.sessions: list[dict[str, Any]] = []
+        self.shown: list[dict[str, Any]] = []
+        self.refreshes = 0
+        self.confirmation: CommandConfirmation | None = None
+
+    def async_show_pending(self, changes: dict[str, Any]) -> None:
+        """Record changes shown before they are sent."""
+        self.shown.append(changes)
+
+    async def async_start_session(self, **session: Any) -> bool:
+        """Record a start_session request."""
+        self.sessions.append(session)
+        return self.accept
+
+    async def async_request_refresh(self) -> None:
+        """Count requested refreshes."""
+        self.refreshes += 1
+
+    async def async_refresh(self) -> None:
+        """Count refreshes and pass the data to the confirmation."""
+        self.refreshes += 1
+        if self.confirmation is not None:
+            self.confirmation.async_check(self.data)
+
+
+class RecordingSender:
+    """Send callable for the queue that records commands and can be held."""
+
+    def __init__(self, result: bool = True) -> None:
+        """Initialize the sender."""
+        self.result = result
+        self.sent: list[dict[str, str]] = []
+        self.release = asyncio.Event()
+        self.release.set()
+
+    async def __call__(
+        self, data: dict[str, str], optimistic: dict[str, Any] | None
+    ) -> bool:
+        """Record the command once released."""
+        await self.release.wait()
+        self.sent.append(data)
+        return self.result
+
+
+async def _async_hold_queue(
+    hass: HomeAssistant, queue: CommandQueue, sender: RecordingSender
+) -> asyncio.Task[bool]:
+    """Keep the queue busy sending a first command until released."""
+    sender.release.clear()
+    task = hass.async_create_task(queue.async_send("aux", {"action": "aux"}))
+    await asyncio.sleep(0)
+    return task
+
+
+async def test_queue_sends_stop_first(tmp_path: Path) -> None:
+    """A stop command overtakes commands queued before it."""
+    async with async_test_home_assistant(tmp_path) as hass:
+        sender = RecordingSender()
+        queue = CommandQueue(hass, "sauna", sender)
+        first = await _async_hold_queue(hass, queue, sender)
+
+        light = hass.async_create_task(queue.async_send("light", {"action": "light"}))
+        stop = hass.async_create_task(
+            queue.async_send("status", {"action": "status"}, priority=PRIORITY_STOP)
+        )
+        await asyncio.sleep(0)
+        assert queue.depth == 2
+
+        sender.release.set()
+        assert await asyncio.gather(first, light, stop) == [True, True, True]
+        assert [data["action"] for data in sender.sent] == ["aux", "status", "light"]
+        assert queue.wait.count == 3
+
+
+async def test_queue_merges_same_setting(tmp_path: Path) -> None:
+    """A queued command for the same setting is replaced, callers share the result."""
+    async with async_test_home_assistant(tmp_path) as hass:
+        sender = RecordingSender(result=False)
+        queue = CommandQueue(hass, "sauna", sender)
+        first = await _async_hold_queue(hass, queue, sender)
+
+        on = hass.async_create_task(queue.async_send("light", {"value": "1"}))
+        off = hass.async_create_task(queue.async_send("light", {"value": "0"}))
+        await asyncio.sleep(0)
+        assert queue.depth == 1
+
+        sender.release.set()
+        assert await asyncio.gather(first, on, off) == [False, False, False]
+        assert sender.sent[1:] == [{"value": "0"}]
+
+
+async def test_queue_stop_drops_session_start(tmp_path: Path) -> None:
+    """A stop command drops a session start that has not been sent yet."""
+    async with async_test_home_assistant(tmp_path) as hass:
+        sender = RecordingSender()
+        queue = CommandQueue(hass, "sauna", sender)
+        first = await _async_hold_queue(hass, queue, sender)
+
+        start = hass.async_create_task(
+            queue.async_send(ACTION_START_SESSION, {"action": ACTION_START_SESSION})
+        )
+        await asyncio.sleep(0)
+        stop = hass.async_create_task(
+            queue.async_send("status", {"action": "status"}, priority=PRIORITY_STOP)
+        )
+        await asyncio.sleep(0)
+
+        sender.release.set()
+        assert await asyncio.gather(first, start, stop) == [True, False, True]
+        assert [data["action"] for data in sender.sent] == ["aux", "status"]
+
+
+async def test_queue_send_error_fails_callers(tmp_path: Path) -> None:
+    """An exception while sending fails the command instead of the queue."""
+    async with async_test_home_assistant(tmp_path) as hass:
+
+        async def send(data: dict[str, str], optimistic: Any) -> bool:
+            raise RuntimeError("boom")
+
+        queue = CommandQueue(hass, "sauna", send)
+        assert not await queue.async_send("light", {"value": "1"})
+        await queue.async_drain()
+        assert queue.depth == 0
+
+
+async def test_aggregator_merges_changes(tmp_path: Path) -> None:
+    """Changes within the window go out as one start_session request."""
+    async with async_test_home_assistant(tmp_path) as hass:
+        coordinator = FakeCoordinator()
+        aggregator = SessionCommandAggregator(hass, coordinator, delay=0.05)
+
+        results = await asyncio.gather(
+            aggregator.async_send(temperature=90),
+            aggregator.async_send(profile=3),
+            aggregator.async_send(temperature=85),
+        )
+
+        assert results == [True, True, True]
+        assert coordinator.sessions == [
+            {
+                "profile": 3,
+                "temperature": 85,
+                "session_time": "01:00",
+                "ventilation_time": "00:10",
+                "aroma_value": 0,
+                "humidity_value": 0,
+            }
+        ]
+        assert coordinator.shown == [{"set_temp": 90}, {"profile": 3}, {"set_temp": 85}]
+        assert not aggregator.pending
+
+
+async def test_aggregator_window_restarts(tmp_path: Path) -> None:
+    """Each change restarts the window, so nothing is sent while changes arrive."""
+    async with async_test_home_assistant(tmp_path) as hass:
+        coordinator = FakeCoordinator()
+        aggregator = SessionCommandAggregator(hass, coordinator, delay=0.1)
+
+        for temperature in (70, 71, 72):
+            aggregator.async_queue(temperature=temperature)
+            await asyncio.sleep(0.06)
+        assert coordinator.sessions == []
+        assert aggregator.pending
+
+        await asyncio.sleep(0.1)
+        assert [session["temperature"] for session in coordinator.sessions] == [72]
+
+
+async def test_aggregator_flush_sends_at_once(tmp_path: Path) -> None:
+    """Applying changes sends them with the pending ones without waiting."""
+    async with async_test_home_assistant(tmp_path) as hass:
+        coordinator = FakeCoordinator()
+        aggregator = SessionCommandAggregator(hass, coordinator, delay=60)
+
+        aggregator.async_queue(temperature=90)
+        assert await aggregator.async_apply(profile=2)
+        assert len(coordinator.sessions) == 1
+        assert coordinator.sessions[0]["temperature"] == 90
+        assert coordinator.sessions[0]["profile"] == 2
+        # Nothing pending means nothing to send
+        assert await aggregator.async_flush()
+        assert len(coordinator.sessions) == 1
+
+
+async def test_aggregator_reports_failure(tmp_path: Path) -> None:
+    """A rejected merged request fails every caller and refreshes the data."""
+    async with async_test_home_assistant(tmp_path) as hass:
+        coordinator = FakeCoordinator(accept=False)
+        aggregator = SessionCommandAggregator(hass, coordinator, delay=0.01)
+
+        assert await asyncio.gather(
+            aggregator.async_send(temperature=90), aggregator.async_send(profile=2)
+        ) == [False, False]
+        await hass.async_block_till_done()
+        assert coordinator.refreshes == 1
+
+
+async def test_aggregator_cancel(tmp_path: Path) -> None:
+    """Cancelled changes are not sent and their callers fail."""
+    async with async_test_home_assistant(tmp_path) as hass:
+        coordinator = FakeCoordinator()
+        aggregator = SessionCommandAggregator(hass, coordinator, delay=0.01)
+
+        waiting = hass.async_create_task(aggregator.async_send(temperature=90))
+        await asyncio.sleep(0)
+        aggregator.async_cancel()
+
+        assert not await waiting
+        await asyncio.sleep(0.05)
+        assert coordinator.sessions == []
+        assert not aggregator.pending
+
+
+async def test_confirmation_holds_commanded_values(tmp_path: Path) -> None:
+    """Stale readings show the commanded values until the controller reports them."""
+    async with async_test_home_assistant(tmp_path) as hass:
+        coordinator = FakeCoordinator()
+        confirmation = CommandConfirmation(hass, coordinator, backoff=(60,), timeout=60)
+
+        confirmation.async_expect({"status": STATUS_HEATING, "temperature": 90})
+        assert confirmation.pending
+
+        shown = confirmation.async_check(STATE)
+        assert shown.status == STATUS_HEATING
+        assert shown.actual_temp == STATE.actual_temp
+        assert confirmation.pending
+
+        live = replace(STATE, status=STATUS_HEATING)
+        assert confirmation.async_check(live) is live
+        assert not confirmation.pending
+        assert confirmation.latency.count == 1
+        assert confirmation.unconfirmed == 0
+        confirmation.async_cancel()
+
+
+async def test_confirmation_expires(tmp_path: Path) -> None:
+    """Values the controller does not report in time are given up on."""
+    async with async_test_home_assistant(tmp_path) as hass:
+        coordinator = FakeCoordinator()
+        confirmation = CommandConfirmation(hass, coordinator, backoff=(60,), timeout=0)
+
+        confirmation.async_expect({"light": True})
+        assert confirmation.async_check(STATE) is STATE
+        assert not confirmation.pending
+        assert confirmation.unconfirmed == 1
+        assert confirmation.latency.count == 0
+        confirmation.async_cancel()
+
+
+async def test_confirmation_polls_until_confirmed(tmp_path: Path) -> None:
+    """The burst polls along the backoff and stops once the values show up."""
+    async with async_test_home_assistant(tmp_path) as hass:
+        coordinator = FakeCoordinator()
+        confirmation = CommandConfirmation(
+            hass, coordinator, backoff=(0.01, 0.02), timeout=60
+        )
+        coordinator.confirmation = confirmation
+
+        confirmation.async_expect({"light": True})
+        await asyncio.sleep(0.05)
+        assert confirmation.pending
+        polls = coordinator.refreshes
+        assert polls >= 2
+
+        coordinator.data = replace(STATE, light=True)
+        await asyncio.sleep(0.05)
+        assert not confirmation.pending
+        assert confirmation.latency.count == 1
+
+        polls = coordinator.refreshes
+        await asyncio.sleep(0.05)
+        assert coordinator.refreshes == polls
+
+
+async def test_confirmation_ignores_other_fields(tmp_path: Path) -> None:
+    """Only fields the controller reports are confirmed."""
+    async with async_test_home_assistant(tmp_path) as hass:
+        coordinator = FakeCoordinator()
+        confirmation = CommandConfirmation(hass, coordinator)
+
+        confirmation.async_expect({"session_time": "01:00", "humidity_value": 20})
+        assert not confirmation.pending
@@ -0,0 +1,92 @@
+"""Tests for the discovery helpers."""
+from __future__ import annotations
+
+import pytest
+
+from custom_components.ffes_sauna.const import DISCOVERY_MAX_HOSTS
+from custom_components.ffes_sauna.discovery import (
+    InvalidRange,
+    format_host,
+    hosts_in_range,
+    normalize_host,
+)
+
+
+def test_ipv4_network() -> None:
+    """A CIDR network expands to its usable hosts."""
+    hosts = hosts_in_range("192.168.0.0/30")
+    assert hosts == ["192.168.0.1", "192.168.0.2"]
+
+
+def test_ipv4_network_not_strict() -> None:
+    """Host bits in the network address are ignored."""
+    assert hosts_in_range(" 10.0.0.5/31 ") == ["10.0.0.4", "10.0.0.5"]
+
+
+def test_ipv6_network() -> None:
+    """IPv6 hosts are bracketed for use in URLs."""
+    assert hosts_in_range("fd00::/126") == ["[fd00::1]", "[fd00::2]", "[fd00::3]"]
+
+
+def test_port_range() -> None:
+    """A host with a port range expands to one entry per port."""
+    assert hosts_in_range("127.0.0.1:8000-8002") == [
+        "127.0.0.1:8000",
+        "127.0.0.1:8001",
+        "127.0.0.1:8002",
+    ]
+    assert hosts_in_range("[::1]:8000") == ["[::1]:8000"]
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "",
+        "sauna",
+        "192.168.0.0/33",
+        "127.0.0.1:8002-8000",
+        "127.0.0.1:0-1",
+        "127.0.0.1:abc",
+        ":8000",
+        "::1:8000-8001",
+        "10.0.0.0/8",
+        f"127.0.0.1:1-{DISCOVERY_MAX_HOSTS + 1}",
+    ],
+)
+def test_invalid_range(value: str) -> None:
+    """Malformed and oversized ranges are rejected."""
+    with pytest.raises(InvalidRange):
+        hosts_in_range(value)
+
+
+def test_largest_allowed_network() -> None:
+    """A network of the maximum size is accepted."""
+    assert len(hosts_in_range("10.0.0.0/22")) == DISCOVERY_MAX_HOSTS - 2
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("192.168.0.10", "192.168.0.10"),
+        ("fd00::1", "[fd00::1]"),
+        ("sauna.local", "sauna.local"),
+    ],
+)
+def test_format_host(value: str, expected: str) -> None:
+    """Only IPv6 addresses are bracketed."""
+    assert format_host(value) == expected
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("http://192.168.0.208", "192.168.0.208"),
+        (" https://192.168.0.208:8080/ ", "192.168.0.208:8080"),
+        ("sauna.local", "sauna.local"),
+        ("http://fd00::1", "[fd00::1]"),
+        ("[fd00::1]:8080", "[fd00::1]:8080"),
+    ],
+)
+def test_normalize_host(value: str, expected: str) -> None:
+    """The scheme and trailing slash are dropped, IPv6 is bracketed."""
+    assert normalize_host(value) == expected
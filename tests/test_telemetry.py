@@ -0,0 +1,100 @@
+"""Tests for the telemetry buffer."""
+from __future__ import annotations
+
+import pytest
+
+from custom_components.ffes_sauna.const import STATUS_HEATING, STATUS_OFF
+from custom_components.ffes_sauna.models import SaunaState
+from custom_components.ffes_sauna.telemetry import TelemetryBuffer
+
+
+def _state(temp: float, humidity: float | None = None, status: int = STATUS_HEATING) -> SaunaState:
+    """Return a reading."""
+    return SaunaState(status=status, actual_temp=temp, humidity=humidity)
+
+
+def test_empty_buffer() -> None:
+    """An empty buffer has no statistics."""
+    buffer = TelemetryBuffer(size=4)
+    assert len(buffer) == 0
+    assert buffer.temperature_rate is None
+    assert buffer.temperature_mean is None
+    assert buffer.temperature_min is None
+    assert buffer.heating_share is None
+    assert buffer.window_minutes == 0.0
+
+
+def test_skips_readings_without_temperature() -> None:
+    """Readings without a temperature are not stored."""
+    buffer = TelemetryBuffer(size=4)
+    buffer.add(0, SaunaState(status=STATUS_OFF))
+    assert len(buffer) == 0
+
+
+def test_statistics_of_partial_window() -> None:
+    """Statistics cover every sample until the buffer is full."""
+    buffer = TelemetryBuffer(size=8)
+    for minute, temp in enumerate((20, 22, 24, 26)):
+        buffer.add(minute * 60, _state(temp, humidity=10))
+
+    assert len(buffer) == 4
+    assert buffer.temperature_rate == pytest.approx(2)
+    assert buffer.temperature_mean == pytest.approx(23)
+    assert buffer.humidity_trend == pytest.approx(0)
+    assert buffer.temperature_min == 20
+    assert buffer.temperature_max == 26
+    assert buffer.window_minutes == pytest.approx(3)
+
+
+def test_wraparound_evicts_oldest() -> None:
+    """Once full, each sample replaces the oldest one in every statistic."""
+    buffer = TelemetryBuffer(size=4)
+    temps = (50, 10, 20, 30, 40, 35)
+    statuses = (STATUS_OFF, STATUS_OFF, STATUS_HEATING, STATUS_HEATING, STATUS_HEATING, STATUS_OFF)
+    for minute, (temp, status) in enumerate(zip(temps, statuses)):
+        buffer.add(minute * 60, _state(temp, status=status))
+
+    # The window holds 20, 30, 40 and 35
+    assert len(buffer) == 4
+    assert buffer.temperature_min == 20
+    assert buffer.temperature_max == 40
+    assert buffer.temperature_mean == pytest.approx(31.25)
+    assert buffer.heating_share == pytest.approx(0.75)
+    assert buffer.window_minutes == pytest.approx(3)
+
+
+def test_rebase_keeps_statistics() -> None:
+    """Re-basing the times each lap leaves the statistics unchanged."""
+    buffer = TelemetryBuffer(size=5)
+    start = 1_000_000_000.0
+    for minute in range(23):
+        buffer.add(start + minute * 60, _state(20 + 0.5 * minute, humidity=minute))
+
+    assert buffer.temperature_rate == pytest.approx(0.5)
+    assert buffer.humidity_trend == pytest.approx(1)
+    assert buffer.temperature_mean == pytest.approx(20 + 0.5 * 20)
+    assert buffer.window_minutes == pytest.approx(4)
+    # Stored times stay within two laps however long the buffer runs
+    assert max(buffer._time) < 2 * buffer.size  # pylint: disable=protected-access
+
+
+def test_missing_humidity_is_skipped() -> None:
+    """Readings without humidity count for temperature only."""
+    buffer = TelemetryBuffer(size=4)
+    buffer.add(0, _state(20, humidity=None))
+    buffer.add(60, _state(21, humidity=30))
+    buffer.add(120, _state(22, humidity=None))
+    assert buffer.humidity_mean == pytest.approx(30)
+    assert buffer.humidity_trend is None
+    assert buffer.temperature_rate == pytest.approx(1)
+
+
+def test_session_range() -> None:
+    """The session range restarts whenever heating starts."""
+    buffer = TelemetryBuffer(size=8)
+    for minute, (temp, status) in enumerate(
+        ((30, STATUS_HEATING), (60, STATUS_HEATING), (55, STATUS_OFF), (40, STATUS_HEATING))
+    ):
+        buffer.add(minute * 60, _state(temp, status=status))
+    assert buffer.session_min == 40
+    assert buffer.session_max == 40
@@ -0,0 +1,82 @@
+"""Tests for the traffic trace recorder."""
+from __future__ import annotations
+
+from pathlib import Path
+
+from custom_components.ffes_sauna.trace import (
+    TRACE_DIRECTORY,
+    TraceRecorder,
+    decode_body,
+    encode_body,
+    read_trace,
+)
+
+from .common import async_test_home_assistant
+
+HOST = "http://192.168.0.50"
+
+
+async def _async_write(recorder: TraceRecorder, count: int) -> None:
+    """Record and flush one poll ``count`` times."""
+    for _ in range(count):
+        recorder.async_record("GET", "/sauna-data", 0.01, status=200, body=b"x" * 200)
+        await recorder.async_flush()
+
+
+def _traces(config_dir: Path) -> list[str]:
+    """Return the names of the trace files."""
+    return sorted(path.name for path in (config_dir / TRACE_DIRECTORY).iterdir())
+
+
+async def test_records_round_trip(tmp_path: Path) -> None:
+    """Recorded exchanges read back with their bodies and errors."""
+    async with async_test_home_assistant(tmp_path) as hass:
+        recorder = TraceRecorder(hass, HOST)
+        recorder.async_record(
+            "POST", "/sauna-control", 0.02, form={"action": "light"}, status=200, body=b"{}"
+        )
+        recorder.async_record("GET", "/sauna-data", 5.0, error="timeout")
+        await recorder.async_close()
+
+        records = list(read_trace(recorder.path))
+        assert [record["method"] for record in records] == ["POST", "GET"]
+        assert records[0]["form"] == {"action": "light"}
+        assert decode_body(records[0]) == b"{}"
+        assert records[1]["error"] == "timeout"
+        assert "status" not in records[1]
+
+
+async def test_rotation_keeps_backups(tmp_path: Path) -> None:
+    """A full file is rotated, keeping only ``backup_count`` older ones."""
+    async with async_test_home_assistant(tmp_path) as hass:
+        recorder = TraceRecorder(hass, HOST, max_bytes=1, backup_count=2)
+        await _async_write(recorder, 1)
+        assert _traces(tmp_path) == ["http_192_168_0_50.jsonl.gz"]
+
+        await _async_write(recorder, 4)
+        assert _traces(tmp_path) == [
+            "http_192_168_0_50.1.jsonl.gz",
+            "http_192_168_0_50.2.jsonl.gz",
+            "http_192_168_0_50.jsonl.gz",
+        ]
+        # Every flush went to a fresh file, the oldest ones were dropped
+        for path in (tmp_path / TRACE_DIRECTORY).iterdir():
+            assert len(list(read_trace(path))) == 1
+        await recorder.async_close()
+
+
+async def test_no_rotation_below_limit(tmp_path: Path) -> None:
+    """Flushes append to the current file until it reaches the limit."""
+    async with async_test_home_assistant(tmp_path) as hass:
+        recorder = TraceRecorder(hass, HOST, max_bytes=1024 * 1024)
+        await _async_write(recorder, 3)
+        assert _traces(tmp_path) == ["http_192_168_0_50.jsonl.gz"]
+        assert len(list(read_trace(recorder.path))) == 3
+        await recorder.async_close()
+
+
+def test_body_encoding() -> None:
+    """Bodies that are not UTF-8 are stored as base64."""
+    assert encode_body(b"{}") == {"body": "{}"}
+    assert decode_body(encode_body(b"\xff\x00")) == b"\xff\x00"
+    assert decode_body({}) == b""
@@ -0,0 +1 @@
+"""Development tools for the FFES Sauna integration."""
@@ -0,0 +1,212 @@
+"""End-to-end performance benchmark for the FFES Sauna coordinator.
+
+Starts N simulated controllers, drives one ``FFESSaunaCoordinator`` per
+controller against them inside a bare Home Assistant core, and reports poll
+latency percentiles, command round-trip time, entity state writes per second
+and event-loop lag::
+
+    python -m tools.benchmark --controllers 20 --duration 60 --interval 2
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+from dataclasses import dataclass, field
+import json
+import logging
+import statistics
+import tempfile
+import time
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.ffes_sauna.coordinator import FFESSaunaCoordinator
+from custom_components.ffes_sauna.number import NUMBERS
+from custom_components.ffes_sauna.sensor import SENSORS
+from custom_components.ffes_sauna.switch import SWITCHES
+
+from .ffes_simulator import async_start_simulators
+
+LAG_PROBE_INTERVAL = 0.05
+
+
+@dataclass
+class BenchmarkResult:
+    """Measurements collected during a run."""
+
+    poll_latency: list[float] = field(default_factory=list)
+    command_rtt: list[float] = field(default_factory=list)
+    loop_lag: list[float] = field(default_factory=list)
+    state_writes: int = 0
+    poll_failures: int = 0
+    command_failures: int = 0
+    duration: float = 0.0
+
+    def summary(self) -> dict[str, float]:
+        """Return the headline numbers."""
+        return {
+            "polls": len(self.poll_latency),
+            "poll_failures": self.poll_failures,
+            **_percentiles("poll_ms", self.poll_latency),
+            "commands": len(self.command_rtt),
+            "command_failures": self.command_failures,
+            **_percentiles("command_ms", self.command_rtt),
+            "state_writes_per_s": self.state_writes / self.duration,
+            **_percentiles("loop_lag_ms", self.loop_lag),
+            "loop_lag_max_ms": max(self.loop_lag, default=0.0) * 1000,
+        }
+
+
+def _percentiles(prefix: str, samples: list[float]) -> dict[str, float]:
+    """Return p50/p90/p99 of ``samples`` in milliseconds."""
+    if len(samples) < 2:
+        value = samples[0] * 1000 if samples else 0.0
+        return {f"{prefix}_p50": value, f"{prefix}_p90": value, f"{prefix}_p99": value}
+    cuts = statistics.quantiles(samples, n=100)
+    return {
+        f"{prefix}_p50": cuts[49] * 1000,
+        f"{prefix}_p90": cuts[89] * 1000,
+        f"{prefix}_p99": cuts[98] * 1000,
+    }
+
+
+def attach_entity_listeners(
+    coordinator: FFESSaunaCoordinator, result: BenchmarkResult
+) -> None:
+    """Subscribe one counting listener per entity, with the entity's context."""
+
+    def count_write() -> None:
+        result.state_writes += 1
+
+    contexts = [description.source_keys for description in SENSORS]
+    contexts += [description.source_keys for description in NUMBERS]
+    contexts += [description.source_keys for description in SWITCHES]
+    contexts.append(("profile",))
+    for context in contexts:
+        # A fresh closure per entity, as every entity has its own callback
+        coordinator.async_add_listener(lambda: count_write(), context)
+
+
+async def _poll_loop(
+    coordinator: FFESSaunaCoordinator,
+    result: BenchmarkResult,
+    interval: float,
+    deadline: float,
+) -> None:
+    """Refresh a coordinator at a fixed interval until the deadline."""
+    while time.monotonic() < deadline:
+        started = time.monotonic()
+        await coordinator.async_refresh()
+        if coordinator.last_update_success:
+            result.poll_latency.append(time.monotonic() - started)
+        else:
+            result.poll_failures += 1
+        await asyncio.sleep(max(0.0, interval - (time.monotonic() - started)))
+
+
+async def _command_loop(
+    coordinator: FFESSaunaCoordinator,
+    result: BenchmarkResult,
+    interval: float,
+    deadline: float,
+) -> None:
+    """Toggle the light at a fixed interval until the deadline."""
+    state = False
+    while time.monotonic() < deadline:
+        await asyncio.sleep(interval)
+        state = not state
+        started = time.monotonic()
+        if await coordinator.async_set_light(state):
+            result.command_rtt.append(time.monotonic() - started)
+        else:
+            result.command_failures += 1
+
+
+async def lag_probe(result: BenchmarkResult, deadline: float) -> None:
+    """Measure how late the event loop wakes up a sleeping task."""
+    while time.monotonic() < deadline:
+        started = time.monotonic()
+        await asyncio.sleep(LAG_PROBE_INTERVAL)
+        result.loop_lag.append(time.monotonic() - started - LAG_PROBE_INTERVAL)
+
+
+async def async_run_benchmark(
+    controllers: int,
+    duration: float,
+    interval: float,
+    command_interval: float,
+    speed: float,
+) -> BenchmarkResult:
+    """Run the benchmark and return the measurements."""
+    simulators = await async_start_simulators(controllers, speed=speed)
+    result = BenchmarkResult()
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        coordinators = []
+        for _, url in simulators:
+            # Fleet mode leaves scheduling to the benchmark loops
+            coordinator = FFESSaunaCoordinator(hass, url, fleet_polling=True)
+            await coordinator.async_refresh()
+            attach_entity_listeners(coordinator, result)
+            coordinators.append(coordinator)
+
+        started = time.monotonic()
+        deadline = started + duration
+        tasks = [lag_probe(result, deadline)]
+        for coordinator in coordinators:
+            tasks.append(_poll_loop(coordinator, result, interval, deadline))
+            if command_interval:
+                tasks.append(
+                    _command_loop(coordinator, result, command_interval, deadline)
+                )
+        await asyncio.gather(*tasks)
+        result.duration = time.monotonic() - started
+
+        for coordinator in coordinators:
+            await coordinator.async_shutdown()
+        await hass.async_stop(force=True)
+
+    for simulator, _ in simulators:
+        await simulator.async_stop()
+    return result
+
+
+def main() -> None:
+    """Parse arguments, run the benchmark and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--controllers", type=int, default=10)
+    parser.add_argument("--duration", type=float, default=30.0)
+    parser.add_argument("--interval", type=float, default=1.0, help="poll interval (s)")
+    parser.add_argument(
+        "--command-interval",
+        type=float,
+        default=5.0,
+        help="light toggle interval per controller (s), 0 disables commands",
+    )
+    parser.add_argument(
+        "--speed", type=float, default=60.0, help="simulated seconds per real second"
+    )
+    parser.add_argument("--json", action="store_true", help="print JSON")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+
+    result = asyncio.run(
+        async_run_benchmark(
+            args.controllers,
+            args.duration,
+            args.interval,
+            args.command_interval,
+            args.speed,
+        )
+    )
+    summary = result.summary()
+    if args.json:
+        print(json.dumps(summary, indent=2))
+        return
+    for key, value in summary.items():
+        print(f"{key:>24}: {value:10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,289 @@
+"""Fault scenarios for the FFES Sauna coordinator.
+
+Runs one ``FFESSaunaCoordinator`` against a simulated controller per
+scenario, injects one kind of fault while polling and sending commands, then
+clears it and waits for the coordinator to recover. Every scenario reports
+event-loop lag, entity availability transitions and command outcomes, and
+checks that:
+
+- the event loop never lags behind by more than ``--lag-budget``,
+- every failure maps to a handled error, never to "Unexpected error",
+- no command reports success without reaching the controller,
+- polls succeed again once the fault is gone.
+
+Run all scenarios or some of them::
+
+    python -m tools.fault_scenarios --duration 10
+    python -m tools.fault_scenarios --scenario stall --scenario flapping
+
+The exit status is 1 when a check fails.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections import Counter
+from dataclasses import dataclass, field
+import json
+import logging
+import sys
+import tempfile
+import time
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.ffes_sauna.breaker import CircuitBreaker
+from custom_components.ffes_sauna.const import CONF_CONNECT_TIMEOUT, CONF_READ_TIMEOUT
+from custom_components.ffes_sauna.coordinator import FFESSaunaCoordinator
+
+from .benchmark import BenchmarkResult, lag_probe
+from .ffes_simulator import (
+    FAULT_DROP,
+    FAULT_HTTP_ERROR,
+    FAULT_MALFORMED,
+    FAULT_MISSING_STATUS,
+    FAULT_PARTIAL,
+    FAULT_STALL,
+    FaultPlan,
+    SaunaSimulator,
+)
+
+FAULT_RATE = 0.5
+SCENARIOS = {
+    "baseline": FaultPlan(),
+    "latency": FaultPlan(latency=1.0),
+    "drop": FaultPlan(rates={FAULT_DROP: FAULT_RATE}),
+    "http_error": FaultPlan(rates={FAULT_HTTP_ERROR: FAULT_RATE}),
+    "malformed": FaultPlan(rates={FAULT_MALFORMED: FAULT_RATE}),
+    "partial": FaultPlan(rates={FAULT_PARTIAL: FAULT_RATE}),
+    "missing_status": FaultPlan(rates={FAULT_MISSING_STATUS: FAULT_RATE}),
+    # Longer than the read timeout, so stalled requests time out
+    "stall": FaultPlan(rates={FAULT_STALL: FAULT_RATE}, stall=5.0),
+    "flapping": FaultPlan(flap_period=3.0),
+}
+
+# Short timeouts and backoffs so a scenario fits in seconds
+SCENARIO_OPTIONS = {CONF_CONNECT_TIMEOUT: 1, CONF_READ_TIMEOUT: 2}
+BREAKER_BASE_BACKOFF = 1.0
+BREAKER_MAX_BACKOFF = 4.0
+RECOVERY_TIMEOUT = 15.0
+
+OUTCOME_CONFIRMED = "confirmed"  # reported success, reached the controller
+OUTCOME_REJECTED = "rejected"  # reported failure, never reached it
+OUTCOME_GHOST = "ghost"  # reported failure, but the controller applied it
+OUTCOME_PHANTOM = "phantom"  # reported success, but the controller missed it
+
+
+@dataclass
+class ScenarioResult:
+    """Measurements and check results of one scenario."""
+
+    name: str
+    timing: BenchmarkResult = field(default_factory=BenchmarkResult)
+    injected: Counter[str] = field(default_factory=Counter)
+    transitions: list[tuple[float, bool]] = field(default_factory=list)
+    errors: Counter[str] = field(default_factory=Counter)
+    commands: Counter[str] = field(default_factory=Counter)
+    recovery: float | None = None
+    failed_checks: list[str] = field(default_factory=list)
+
+    def summary(self) -> dict:
+        """Return the headline numbers."""
+        timing = self.timing
+        return {
+            "polls": len(timing.poll_latency) + timing.poll_failures,
+            "poll_failures": timing.poll_failures,
+            "injected": dict(self.injected),
+            "unavailable": sum(not available for _, available in self.transitions),
+            "errors": dict(self.errors),
+            "commands": dict(self.commands),
+            "loop_lag_max_ms": round(max(timing.loop_lag, default=0.0) * 1000, 1),
+            "recovery_s": None if self.recovery is None else round(self.recovery, 2),
+            "failed_checks": self.failed_checks,
+        }
+
+
+def _error_kind(message: str) -> str:
+    """Return the failure class of an ``UpdateFailed`` message."""
+    return message.split(":", 1)[0].split(",", 1)[0]
+
+
+async def _poll_loop(
+    coordinator: FFESSaunaCoordinator,
+    result: ScenarioResult,
+    interval: float,
+    deadline: float,
+) -> None:
+    """Refresh the coordinator until the deadline, counting failures by kind."""
+    while time.monotonic() < deadline:
+        started = time.monotonic()
+        await coordinator.async_refresh()
+        if coordinator.last_update_success:
+            result.timing.poll_latency.append(time.monotonic() - started)
+        else:
+            result.timing.poll_failures += 1
+            result.errors[_error_kind(str(coordinator.last_exception))] += 1
+        await asyncio.sleep(max(0.0, interval - (time.monotonic() - started)))
+
+
+async def _command_loop(
+    coordinator: FFESSaunaCoordinator,
+    simulator: SaunaSimulator,
+    result: ScenarioResult,
+    interval: float,
+    deadline: float,
+) -> None:
+    """Toggle the light until the deadline and compare with the controller."""
+    state = simulator.model.light
+    while time.monotonic() + interval < deadline:
+        await asyncio.sleep(interval)
+        state = not state
+        success = await coordinator.async_set_light(state)
+        applied = simulator.model.light == state
+        if success:
+            result.commands[OUTCOME_CONFIRMED if applied else OUTCOME_PHANTOM] += 1
+        else:
+            result.commands[OUTCOME_GHOST if applied else OUTCOME_REJECTED] += 1
+        # Resync with the controller, whatever the outcome was
+        state = simulator.model.light
+
+
+async def async_run_scenario(
+    name: str,
+    plan: FaultPlan,
+    duration: float,
+    interval: float,
+    command_interval: float,
+    lag_budget: float,
+) -> ScenarioResult:
+    """Run one scenario and return its measurements."""
+    result = ScenarioResult(name)
+    simulator = SaunaSimulator()
+    url = await simulator.async_start()
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        # Fleet mode leaves scheduling to the scenario loops
+        coordinator = FFESSaunaCoordinator(
+            hass, url, fleet_polling=True, options=SCENARIO_OPTIONS
+        )
+        coordinator.breaker = CircuitBreaker(
+            url, base_backoff=BREAKER_BASE_BACKOFF, max_backoff=BREAKER_MAX_BACKOFF
+        )
+        await coordinator.async_refresh()
+        started = time.monotonic()
+
+        def track_availability() -> None:
+            available = coordinator.last_update_success
+            if not result.transitions or result.transitions[-1][1] != available:
+                result.transitions.append((time.monotonic() - started, available))
+
+        coordinator.async_add_listener(track_availability)
+        track_availability()
+
+        simulator.faults = plan
+        deadline = started + duration
+        tasks = [
+            lag_probe(result.timing, deadline),
+            _poll_loop(coordinator, result, interval, deadline),
+        ]
+        if command_interval:
+            tasks.append(
+                _command_loop(
+                    coordinator, simulator, result, command_interval, deadline
+                )
+            )
+        await asyncio.gather(*tasks)
+        result.timing.duration = time.monotonic() - started
+        result.injected = simulator.injected.copy()
+
+        simulator.faults = FaultPlan()
+        cleared = time.monotonic()
+        while time.monotonic() - cleared < RECOVERY_TIMEOUT:
+            await coordinator.async_refresh()
+            if coordinator.last_update_success:
+                result.recovery = time.monotonic() - cleared
+                break
+            await asyncio.sleep(interval)
+
+        await coordinator.async_shutdown()
+        await hass.async_stop(force=True)
+    await simulator.async_stop()
+
+    if max(result.timing.loop_lag, default=0.0) > lag_budget:
+        result.failed_checks.append("loop lag over budget")
+    if result.errors["Unexpected error"]:
+        result.failed_checks.append("unhandled errors")
+    if result.commands[OUTCOME_PHANTOM]:
+        result.failed_checks.append("commands reported without reaching controller")
+    if result.recovery is None:
+        result.failed_checks.append("no recovery")
+    if name == "baseline" and (result.timing.poll_failures or result.errors):
+        result.failed_checks.append("failures without faults")
+    return result
+
+
+async def async_run_scenarios(
+    names: list[str],
+    duration: float,
+    interval: float,
+    command_interval: float,
+    lag_budget: float,
+) -> list[ScenarioResult]:
+    """Run scenarios one after another."""
+    return [
+        await async_run_scenario(
+            name, SCENARIOS[name], duration, interval, command_interval, lag_budget
+        )
+        for name in names
+    ]
+
+
+def main() -> None:
+    """Parse arguments, run the scenarios and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        choices=list(SCENARIOS),
+        help="scenario to run, all by default",
+    )
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--interval", type=float, default=0.5, help="poll interval (s)")
+    parser.add_argument(
+        "--command-interval",
+        type=float,
+        default=1.0,
+        help="light toggle interval (s), 0 disables commands",
+    )
+    parser.add_argument(
+        "--lag-budget", type=float, default=0.1, help="maximum event-loop lag (s)"
+    )
+    parser.add_argument("--json", action="store_true", help="print JSON")
+    args = parser.parse_args()
+    # The coordinator logs every injected failure
+    logging.basicConfig(level=logging.CRITICAL)
+
+    results = asyncio.run(
+        async_run_scenarios(
+            args.scenario or list(SCENARIOS),
+            args.duration,
+            args.interval,
+            args.command_interval,
+            args.lag_budget,
+        )
+    )
+    summaries = {result.name: result.summary() for result in results}
+    if args.json:
+        print(json.dumps(summaries, indent=2))
+    else:
+        for name, summary in summaries.items():
+            status = "FAIL" if summary["failed_checks"] else "ok"
+            print(f"{name} [{status}]")
+            for key, value in summary.items():
+                print(f"{key:>18}: {value}")
+    sys.exit(1 if any(result.failed_checks for result in results) else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,414 @@
+"""Local FFES Sauna controller simulator.
+
+Serves ``/sauna-data`` and ``/sauna-control`` like the real controller, with a
+simple thermal model: the heater drives the cabin towards the target
+temperature, the cabin cools towards ambient when the heater is off, and wet
+profiles pull the humidity towards the humidity setting.
+
+A ``FaultPlan`` makes the controller misbehave: added latency, dropped
+connections, HTTP 500 errors, malformed or truncated JSON, payloads without
+``controllerStatus``, bodies that stall halfway and a controller that flaps
+between reachable and unreachable.
+
+Run one or more simulated controllers::
+
+    python -m tools.ffes_simulator --count 4 --base-port 8300 --speed 60
+    python -m tools.ffes_simulator --latency 0.5 --fault partial=0.2 --fault drop=0.1
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections import Counter
+from dataclasses import dataclass, field
+import json
+import logging
+import random
+import time
+
+from aiohttp import web
+
+_LOGGER = logging.getLogger(__name__)
+
+STATUS_OFF = 0
+STATUS_HEATING = 1
+STATUS_VENTILATION = 2
+STATUS_STANDBY = 3
+
+WET_PROFILES = (3, 5)
+
+AMBIENT_TEMP = 21.0
+AMBIENT_HUMIDITY = 30.0
+HEATING_RATE = 1.5  # degrees per minute at full power
+COOLING_FACTOR = 0.02  # fraction of the gap to ambient lost per minute
+VENTILATION_FACTOR = 0.08
+HUMIDITY_RATE = 4.0  # percent per minute
+
+FAULT_DROP = "drop"
+FAULT_HTTP_ERROR = "http_error"
+FAULT_MALFORMED = "malformed"
+FAULT_PARTIAL = "partial"
+FAULT_MISSING_STATUS = "missing_status"
+FAULT_STALL = "stall"
+FAULTS = (
+    FAULT_DROP,
+    FAULT_HTTP_ERROR,
+    FAULT_MALFORMED,
+    FAULT_PARTIAL,
+    FAULT_MISSING_STATUS,
+    FAULT_STALL,
+)
+# Faults that hit before a command reaches the model, so it is not applied
+REJECTING_FAULTS = (FAULT_DROP, FAULT_HTTP_ERROR)
+
+
+def _parse_hhmm(value: str) -> int:
+    """Convert an ``HH:MM`` string to the controller's HHMM integer."""
+    hours, _, minutes = value.partition(":")
+    return int(hours) * 100 + int(minutes or 0)
+
+
+def _hhmm_minutes(value: int) -> float:
+    """Convert an HHMM integer to minutes."""
+    return value // 100 * 60 + value % 100
+
+
+@dataclass
+class SaunaModel:
+    """Simulated controller state and dynamics."""
+
+    speed: float = 1.0
+    noise: float = 0.05
+    controller_status: int = STATUS_OFF
+    actual_temp: float = AMBIENT_TEMP
+    humidity: float = AMBIENT_HUMIDITY
+    set_temp: int = 80
+    profile: int = 2
+    session_time: int = 130
+    ventilation_time: int = 15
+    aroma_value: int = 0
+    humidity_value: int = 0
+    light: bool = False
+    aux: bool = False
+    phase_elapsed: float = 0.0
+    last_step: float = field(default_factory=time.monotonic, repr=False)
+
+    def step(self) -> None:
+        """Advance the model to the current time."""
+        now = time.monotonic()
+        minutes = (now - self.last_step) * self.speed / 60
+        self.last_step = now
+        if minutes <= 0:
+            return
+
+        if (
+            self.controller_status == STATUS_HEATING
+            and self.actual_temp < self.set_temp
+        ):
+            self.actual_temp = min(
+                float(self.set_temp), self.actual_temp + HEATING_RATE * minutes
+            )
+        else:
+            factor = (
+                VENTILATION_FACTOR
+                if self.controller_status == STATUS_VENTILATION
+                else COOLING_FACTOR
+            )
+            self.actual_temp += (AMBIENT_TEMP - self.actual_temp) * min(
+                1.0, factor * minutes
+            )
+
+        target_humidity = AMBIENT_HUMIDITY
+        if self.controller_status == STATUS_HEATING and self.profile in WET_PROFILES:
+            target_humidity = max(self.humidity_value, AMBIENT_HUMIDITY)
+        gap = target_humidity - self.humidity
+        step = min(abs(gap), HUMIDITY_RATE * minutes)
+        self.humidity += step if gap > 0 else -step
+
+        self.actual_temp += random.uniform(-self.noise, self.noise)
+        self.humidity += random.uniform(-self.noise, self.noise)
+        self._advance_phase(minutes)
+
+    def _advance_phase(self, minutes: float) -> None:
+        """Move from heating to ventilation to off as the timers run out."""
+        if self.controller_status == STATUS_HEATING:
+            limit = _hhmm_minutes(self.session_time)
+            next_status = STATUS_VENTILATION
+        elif self.controller_status == STATUS_VENTILATION:
+            limit = _hhmm_minutes(self.ventilation_time)
+            next_status = STATUS_OFF
+        else:
+            return
+
+        self.phase_elapsed += minutes
+        if limit and self.phase_elapsed >= limit:
+            self.set_status(next_status)
+
+    def set_status(self, status: int) -> None:
+        """Change the controller status and restart the phase timer."""
+        self.controller_status = status
+        self.phase_elapsed = 0.0
+
+    def as_payload(self) -> dict:
+        """Return the ``/sauna-data`` payload."""
+        return {
+            "controllerStatus": self.controller_status,
+            "actualTemp": round(self.actual_temp),
+            "humidity": round(self.humidity),
+            "setTemp": self.set_temp,
+            "profile": self.profile,
+            "sessionTime": self.session_time,
+            "ventilationTime": self.ventilation_time,
+            "aromaValue": self.aroma_value,
+            "humidityValue": self.humidity_value,
+            "light": self.light,
+            "aux": self.aux,
+        }
+
+    def apply(self, form: dict[str, str]) -> dict:
+        """Apply a ``/sauna-control`` form and return the response body."""
+        action = form.get("action")
+        try:
+            if action == "start_session":
+                self.profile = int(form["profile"])
+                self.set_temp = int(form["temperature"])
+                self.session_time = _parse_hhmm(form["session_time"])
+                self.ventilation_time = _parse_hhmm(form.get("ventilation_time", "00:15"))
+                self.aroma_value = int(form.get("aroma_value", 0))
+                self.humidity_value = int(form.get("humidity_value", 0))
+                self.set_status(STATUS_HEATING)
+            elif action == "status":
+                status = int(form["value"])
+                if status not in (
+                    STATUS_OFF,
+                    STATUS_HEATING,
+                    STATUS_VENTILATION,
+                    STATUS_STANDBY,
+                ):
+                    return {"success": False, "message": f"Invalid status {status}"}
+                self.set_status(status)
+            elif action == "light":
+                self.light = form["value"] == "1"
+            elif action == "aux":
+                self.aux = form["value"] == "1"
+            else:
+                return {"success": False, "message": f"Unknown action {action}"}
+        except (KeyError, ValueError) as err:
+            return {"success": False, "message": f"Invalid request: {err}"}
+        return {"success": True}
+
+
+@dataclass
+class FaultPlan:
+    """Faults injected into the responses of a simulator.
+
+    ``rates`` maps fault names from ``FAULTS`` to the share of requests they
+    hit. With a ``flap_period`` the controller alternates between answering
+    and dropping every connection, switching every ``flap_period`` seconds.
+    Commands are only hit when ``commands`` is True.
+    """
+
+    latency: float = 0.0
+    rates: dict[str, float] = field(default_factory=dict)
+    stall: float = 30.0
+    flap_period: float = 0.0
+    commands: bool = True
+
+    def pick(self) -> str | None:
+        """Return the fault for the next request, or None."""
+        if self.flap_period and int(time.monotonic() / self.flap_period) % 2:
+            return FAULT_DROP
+        roll = random.random()
+        for fault, rate in self.rates.items():
+            if roll < rate:
+                return fault
+            roll -= rate
+        return None
+
+
+class SaunaSimulator:
+    """HTTP front end for one simulated controller."""
+
+    def __init__(
+        self, model: SaunaModel | None = None, faults: FaultPlan | None = None
+    ) -> None:
+        """Initialize the simulator."""
+        self.model = model or SaunaModel()
+        # Replace at any time to change the faults of the following requests
+        self.faults = faults or FaultPlan()
+        self.injected: Counter[str] = Counter()
+        self.requests = 0
+        self.app = web.Application()
+        self.app.router.add_get("/sauna-data", self.handle_data)
+        self.app.router.add_post("/sauna-control", self.handle_control)
+        self._runner: web.AppRunner | None = None
+        self.port: int | None = None
+
+    async def handle_data(self, request: web.Request) -> web.StreamResponse:
+        """Serve the controller data."""
+        self.requests += 1
+        fault = await self._async_pick_fault(command=False)
+        self.model.step()
+        return await self._async_respond(request, self.model.as_payload(), fault)
+
+    async def handle_control(self, request: web.Request) -> web.StreamResponse:
+        """Apply a control command."""
+        self.requests += 1
+        fault = await self._async_pick_fault(command=True)
+        self.model.step()
+        form = await request.post()
+        if fault in REJECTING_FAULTS:
+            return await self._async_respond(request, {}, fault)
+        return await self._async_respond(request, self.model.apply(dict(form)), fault)
+
+    async def _async_pick_fault(self, command: bool) -> str | None:
+        """Wait out the added latency and pick the fault for a request."""
+        plan = self.faults
+        if plan.latency:
+            await asyncio.sleep(plan.latency)
+        if command and not plan.commands:
+            return None
+        if (fault := plan.pick()) is not None:
+            self.injected[fault] += 1
+        return fault
+
+    async def _async_respond(
+        self, request: web.Request, payload: dict, fault: str | None
+    ) -> web.StreamResponse:
+        """Send ``payload``, damaged by ``fault``."""
+        if fault == FAULT_MISSING_STATUS:
+            payload = {
+                key: value
+                for key, value in payload.items()
+                if key != "controllerStatus"
+            }
+        body = json.dumps(payload).encode()
+
+        if fault == FAULT_DROP:
+            # Close the connection without any response
+            if request.transport is not None:
+                request.transport.abort()
+            return web.Response()
+        if fault == FAULT_HTTP_ERROR:
+            return web.Response(status=500, text="Internal Server Error")
+        if fault == FAULT_MALFORMED:
+            # Single quotes, as sent by some firmware bugs
+            body = body.replace(b'"', b"'")
+        elif fault == FAULT_PARTIAL:
+            body = body[: len(body) // 2]
+        elif fault == FAULT_STALL:
+            # Announce the whole body, send half of it and hang
+            response = web.StreamResponse(headers={"Content-Type": "application/json"})
+            response.content_length = len(body)
+            await response.prepare(request)
+            await response.write(body[: len(body) // 2])
+            await asyncio.sleep(self.faults.stall)
+            await response.write(body[len(body) // 2 :])
+            await response.write_eof()
+            return response
+        return web.Response(body=body, content_type="application/json")
+
+    async def async_start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Start serving and return the base URL."""
+        self._runner = web.AppRunner(self.app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        self.port = self._runner.addresses[-1][1]
+        return f"http://{host}:{self.port}"
+
+    async def async_stop(self) -> None:
+        """Stop serving."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+
+async def async_start_simulators(
+    count: int,
+    base_port: int = 0,
+    speed: float = 1.0,
+    host: str = "127.0.0.1",
+    faults: FaultPlan | None = None,
+) -> list[tuple[SaunaSimulator, str]]:
+    """Start ``count`` simulators, on consecutive ports unless ``base_port`` is 0."""
+    simulators = []
+    for index in range(count):
+        simulator = SaunaSimulator(SaunaModel(speed=speed), faults)
+        url = await simulator.async_start(host, base_port + index if base_port else 0)
+        simulators.append((simulator, url))
+    return simulators
+
+
+async def _async_main(args: argparse.Namespace) -> None:
+    """Run simulators until interrupted."""
+    faults = FaultPlan(
+        latency=args.latency,
+        rates=dict(args.fault),
+        stall=args.stall,
+        flap_period=args.flap_period,
+    )
+    simulators = await async_start_simulators(
+        args.count, args.base_port, args.speed, args.host, faults
+    )
+    for _, url in simulators:
+        print(url)
+    try:
+        await asyncio.Event().wait()
+    finally:
+        for simulator, _ in simulators:
+            await simulator.async_stop()
+
+
+def _fault_rate(value: str) -> tuple[str, float]:
+    """Parse a ``fault=rate`` argument."""
+    fault, _, rate = value.partition("=")
+    if fault not in FAULTS:
+        raise argparse.ArgumentTypeError(
+            f"unknown fault {fault!r}, choose from {', '.join(FAULTS)}"
+        )
+    try:
+        return fault, float(rate or 1)
+    except ValueError as err:
+        raise argparse.ArgumentTypeError(f"invalid rate {rate!r}") from err
+
+
+def main() -> None:
+    """Parse arguments and run the simulators."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=1)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--base-port", type=int, default=8300)
+    parser.add_argument(
+        "--speed", type=float, default=1.0, help="simulated seconds per real second"
+    )
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="seconds added to every response"
+    )
+    parser.add_argument(
+        "--fault",
+        type=_fault_rate,
+        action="append",
+        default=[],
+        metavar="FAULT=RATE",
+        help=f"inject a fault into a share of requests, one of: {', '.join(FAULTS)}",
+    )
+    parser.add_argument(
+        "--stall", type=float, default=30.0, help="seconds a stalled body hangs"
+    )
+    parser.add_argument(
+        "--flap-period",
+        type=float,
+        default=0.0,
+        help="alternate between reachable and unreachable every N seconds",
+    )
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    try:
+        asyncio.run(_async_main(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,211 @@
+"""Replay a recorded FFES Sauna traffic trace through the coordinator.
+
+Feeds the responses of a trace written by the integration's ``trace`` option
+back into an ``FFESSaunaCoordinator`` inside a bare Home Assistant core, with
+no controller or network involved, and reports how fast the integration
+processes them::
+
+    python -m tools.replay config/ffes_sauna_traces/http_192_168_1_50.jsonl.gz
+
+Rotated files are read oldest first when passed together. By default the
+trace is replayed as fast as possible; ``--speed`` follows the recorded
+timing instead, scaled by the given factor.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+from pathlib import Path
+import sys
+import tempfile
+import time
+from typing import Any
+
+import aiohttp
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.ffes_sauna.breaker import CircuitBreaker
+from custom_components.ffes_sauna.const import ACTION_START_SESSION
+from custom_components.ffes_sauna.coordinator import FFESSaunaCoordinator
+from custom_components.ffes_sauna.trace import decode_body, read_trace
+
+from .benchmark import BenchmarkResult, attach_entity_listeners
+
+COMMAND_ACCEPTED = (200, b'{"success":true}')
+
+
+class ReplayClient:
+    """Stand-in for ``FFESSaunaClient`` answering from trace records."""
+
+    def __init__(self, host: str) -> None:
+        """Initialize the client."""
+        self.host = host
+        self.recorder = None
+        self.record: dict[str, Any] | None = None
+        self._last_get: dict[str, Any] | None = None
+        # Requests answered, to check that each record was replayed once
+        self.polls = 0
+        self.commands = 0
+
+    async def async_get(
+        self, path: str, timeout: aiohttp.ClientTimeout
+    ) -> tuple[int, bytes]:
+        """Answer a poll with the current record, or the last recorded poll."""
+        self.polls += 1
+        if self.record is not None and self.record["method"] == "GET":
+            self._last_get = self.record
+        if self._last_get is None:
+            raise aiohttp.ClientConnectionError("No poll recorded yet")
+        return self._respond(self._last_get)
+
+    async def async_post(
+        self, path: str, data: dict[str, str], timeout: aiohttp.ClientTimeout
+    ) -> tuple[int, bytes]:
+        """Answer a command with the current record."""
+        self.commands += 1
+        if self.record is None or self.record["method"] != "POST":
+            return COMMAND_ACCEPTED
+        return self._respond(self.record)
+
+    @staticmethod
+    def _respond(record: dict[str, Any]) -> tuple[int, bytes]:
+        """Return the recorded response, or raise the recorded error."""
+        if (error := record.get("error")) == "timeout":
+            raise TimeoutError
+        if error is not None:
+            raise aiohttp.ClientConnectionError(error)
+        return record["status"], decode_body(record)
+
+
+def load_records(paths: list[str | Path]) -> list[dict[str, Any]]:
+    """Return the records of the trace files in recorded order."""
+    records = [record for path in paths for record in read_trace(path)]
+    records.sort(key=lambda record: record["time"])
+    return records
+
+
+async def _async_no_refresh() -> None:
+    """Leave polls to the trace records."""
+
+
+async def _async_replay_command(
+    coordinator: FFESSaunaCoordinator, form: dict[str, str]
+) -> bool:
+    """Send a recorded command through the matching coordinator method."""
+    action = form["action"]
+    if action == ACTION_START_SESSION:
+        return await coordinator.async_start_session(
+            profile=int(form["profile"]),
+            temperature=int(form["temperature"]),
+            session_time=form["session_time"],
+            ventilation_time=form["ventilation_time"],
+            aroma_value=int(form["aroma_value"]),
+            humidity_value=int(form["humidity_value"]),
+        )
+    value = int(form["value"])
+    if action == "status":
+        return await coordinator.async_set_status(value)
+    if action == "light":
+        return await coordinator.async_set_light(bool(value))
+    if action == "aux":
+        return await coordinator.async_set_aux(bool(value))
+    raise ValueError(f"Unknown action in trace: {action}")
+
+
+async def async_run_replay(
+    records: list[dict[str, Any]], speed: float = 0.0
+) -> BenchmarkResult:
+    """Replay trace records and return the measurements.
+
+    Poll and command samples hold the time the integration spent on each
+    record, without the recorded network latency. Raises ``RuntimeError``
+    if the coordinator did not make exactly the recorded requests.
+    """
+    result = BenchmarkResult()
+    if not records:
+        return result
+    client = ReplayClient(records[0]["host"])
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        # Fleet mode leaves scheduling to the replay loop
+        coordinator = FFESSaunaCoordinator(hass, client.host, fleet_polling=True)
+        coordinator.client = client
+        # Replay compresses time, so backoffs would swallow the records
+        # following an outage; a breaker that never opens keeps them all
+        coordinator.breaker = CircuitBreaker(client.host, failure_threshold=sys.maxsize)
+        # The trace holds the confirmation and follow-up polls the live
+        # coordinator made; polls of its own would answer them a second time
+        coordinator.confirmation.async_expect = lambda changes: None
+        coordinator.async_request_refresh = _async_no_refresh
+        attach_entity_listeners(coordinator, result)
+
+        started = time.monotonic()
+        for record in records:
+            if speed:
+                due = started + (record["time"] - records[0]["time"]) / speed
+                await asyncio.sleep(max(0.0, due - time.monotonic()))
+            client.record = record
+            processed = time.monotonic()
+            if record["method"] == "GET":
+                await coordinator.async_refresh()
+                if coordinator.last_update_success:
+                    result.poll_latency.append(time.monotonic() - processed)
+                else:
+                    result.poll_failures += 1
+            elif await _async_replay_command(coordinator, record.get("form", {})):
+                result.command_rtt.append(time.monotonic() - processed)
+            else:
+                result.command_failures += 1
+        result.duration = time.monotonic() - started
+
+        await coordinator.async_shutdown()
+        await hass.async_stop(force=True)
+
+    recorded = sum(record["method"] == "GET" for record in records)
+    if (client.polls, client.commands) != (recorded, len(records) - recorded):
+        raise RuntimeError(
+            f"Replayed {client.polls} polls and {client.commands} commands, "
+            f"the trace holds {recorded} and {len(records) - recorded}"
+        )
+    return result
+
+
+def main() -> None:
+    """Parse arguments, replay the traces and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("traces", nargs="+", type=Path, help="trace files")
+    parser.add_argument(
+        "--speed",
+        type=float,
+        default=0.0,
+        help="recorded seconds per real second, 0 replays as fast as possible",
+    )
+    parser.add_argument("--json", action="store_true", help="print JSON")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+
+    records = load_records(args.traces)
+    if not records:
+        parser.error("the traces hold no records")
+    result = asyncio.run(async_run_replay(records, args.speed))
+    summary = {
+        "records": len(records),
+        **result.summary(),
+        "records_per_s": len(records) / result.duration,
+    }
+    # Nothing measures the event loop during a replay
+    for key in [key for key in summary if key.startswith("loop_lag")]:
+        del summary[key]
+    if args.json:
+        print(json.dumps(summary, indent=2))
+        return
+    for key, value in summary.items():
+        print(f"{key:>24}: {value:10.2f}")
+
+
+if __name__ == "__main__":
+    main()